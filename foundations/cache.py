@@ -16,6 +16,12 @@
 
 
 
+import hashlib
+import os
+import pickle
+import tempfile
+
+import foundations.exceptions
 import foundations.verbose
 
 __author__ = "Thomas Mansencal"
@@ -25,10 +31,47 @@ __maintainer__ = "Thomas Mansencal"
 __email__ = "thomas.mansencal@gmail.com"
 __status__ = "Production"
 
-__all__ = ["LOGGER", "Cache"]
+__all__ = ["LOGGER", "DIGEST_SIZE", "pack_entry", "unpack_entry", "Cache", "PersistentCache"]
 
 LOGGER = foundations.verbose.install_logger()
 
+DIGEST_SIZE = hashlib.sha1().digest_size
+
+
+def pack_entry(magic, content):
+    """
+    Packs given content into a persistent entry: the magic bytes, the payload sha1 digest and the pickled payload.
+
+    :param magic: Entry header magic bytes.
+    :type magic: bytes
+    :param content: Content to pack.
+    :type content: object
+    :return: Entry data.
+    :rtype: bytes
+    """
+
+    payload = pickle.dumps(content, pickle.HIGHEST_PROTOCOL)
+    return b"".join((magic, hashlib.sha1(payload).digest(), payload))
+
+
+def unpack_entry(magic, data):
+    """
+    Unpacks given persistent entry data packed by :func:`pack_entry` definition.
+
+    :param magic: Entry header magic bytes.
+    :type magic: bytes
+    :param data: Entry data.
+    :type data: bytes
+    :return: Content.
+    :rtype: object
+    """
+
+    digest = data[len(magic):len(magic) + DIGEST_SIZE]
+    payload = data[len(magic) + DIGEST_SIZE:]
+    if not data.startswith(magic) or hashlib.sha1(payload).digest() != digest:
+        raise ValueError("Invalid header or digest!")
+    return pickle.loads(payload)
+
 
 class Cache(dict):
     """
@@ -144,3 +187,320 @@ class Cache(dict):
 
         self.clear()
         return True
+
+
+class PersistentCache(object):
+    """
+    | Defines an on disk cache storing objects in a compact binary form.
+    | Each entry is keyed on a file path and given options, and is only returned while the file size
+        and modification time are unchanged. Stale or corrupted entries are discarded and the least recently
+        used entries are evicted once the cache exceeds its maximum size.
+
+    .. warning::
+
+        Entries are unpickled when read, the cache directory must only be writable by trusted users.
+    """
+
+    magic = b"FNDC\x01"
+    """
+    :param magic: Entries header magic bytes.
+    :type magic: bytes
+    """
+
+    def __init__(self, directory=None, maximum_size=64 * 1024 * 1024):
+        """
+        Initializes the class.
+
+        Usage::
+
+            >>> cache = PersistentCache("/tmp/cache")
+            >>> cache.set_content("standard.rc", {"Section A": {"Attribute A": "Value A"}}, options=("=",))
+            True
+            >>> cache.get_content("standard.rc", options=("=",))
+            {'Section A': {'Attribute A': 'Value A'}}
+            >>> cache.get_content("standard.rc", options=(":",))
+
+        :param directory: Cache directory.
+        :type directory: unicode
+        :param maximum_size: Cache maximum size in bytes.
+        :type maximum_size: int
+        """
+
+        LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+        # --- Setting class attributes. ---
+        self.__directory = None
+        self.directory = directory
+        self.__maximum_size = None
+        self.maximum_size = maximum_size
+
+    @property
+    def directory(self):
+        """
+        Property for **self.__directory** attribute.
+
+        :return: self.__directory.
+        :rtype: unicode
+        """
+
+        return self.__directory
+
+    @directory.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def directory(self, value):
+        """
+        Setter for **self.__directory** attribute.
+
+        :param value: Attribute value.
+        :type value: unicode
+        """
+
+        if value is not None:
+            assert type(value) is str, "'{0}' attribute: '{1}' type is not 'unicode'!".format("directory", value)
+        self.__directory = value
+
+    @directory.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def directory(self):
+        """
+        Deleter for **self.__directory** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "directory"))
+
+    @property
+    def maximum_size(self):
+        """
+        Property for **self.__maximum_size** attribute.
+
+        :return: self.__maximum_size.
+        :rtype: int
+        """
+
+        return self.__maximum_size
+
+    @maximum_size.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def maximum_size(self, value):
+        """
+        Setter for **self.__maximum_size** attribute.
+
+        :param value: Attribute value.
+        :type value: int
+        """
+
+        if value is not None:
+            assert type(value) is int, "'{0}' attribute: '{1}' type is not 'int'!".format("maximum_size", value)
+            assert value > 0, "'{0}' attribute: '{1}' need to be exactly positive!".format("maximum_size", value)
+        self.__maximum_size = value
+
+    @maximum_size.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def maximum_size(self):
+        """
+        Deleter for **self.__maximum_size** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "maximum_size"))
+
+    def get_signature(self, path, options=()):
+        """
+        Returns given file signature, the file path, size, modification time and given options.
+
+        :param path: File path.
+        :type path: unicode
+        :param options: Options the cached content depends on.
+        :type options: tuple
+        :return: Signature.
+        :rtype: tuple
+        """
+
+        stat = os.stat(path)
+        return os.path.abspath(path), stat.st_size, stat.st_mtime_ns, tuple(options)
+
+    def get_entry_path(self, path, options=()):
+        """
+        Returns given file and options cache entry path.
+
+        :param path: File path.
+        :type path: unicode
+        :param options: Options the cached content depends on.
+        :type options: tuple
+        :return: Entry path.
+        :rtype: unicode
+        """
+
+        key = repr((os.path.abspath(path), tuple(options))).encode("utf-8")
+        return os.path.join(self.__directory, "{0}.cache".format(hashlib.sha1(key).hexdigest()))
+
+    def get_content(self, path, options=()):
+        """
+        Returns given file and options cached content.
+
+        :param path: File path.
+        :type path: unicode
+        :param options: Options the cached content depends on.
+        :type options: tuple
+        :return: Cached content or None if no valid entry exists.
+        :rtype: object
+        """
+
+        entry_path = self.get_entry_path(path, options)
+        try:
+            with open(entry_path, "rb") as file:
+                data = file.read()
+        except (IOError, OSError):
+            return
+
+        try:
+            signature, content = unpack_entry(self.magic, data)
+        except Exception as error:
+            LOGGER.warning("!> {0} | '{1}' cache entry is corrupted and will be discarded: '{2}'.".format(
+                self.__class__.__name__, entry_path, error))
+            self.__remove_entry(entry_path)
+            return
+
+        try:
+            current_signature = self.get_signature(path, options)
+        except OSError:
+            current_signature = None
+        if signature != current_signature:
+            LOGGER.debug("> '{0}' cache entry is stale and will be discarded.".format(entry_path))
+            self.__remove_entry(entry_path)
+            return
+
+        LOGGER.debug("> Retrieving '{0}' file content from '{1}' cache entry.".format(path, entry_path))
+        try:
+            os.utime(entry_path, None)
+        except OSError:
+            pass
+        return content
+
+    def set_content(self, path, content, options=(), signature=None):
+        """
+        | Stores given file and options content into the cache.
+        | The file signature should be taken with :meth:`PersistentCache.get_signature` method before the file
+            is read so that content read from a file modified meanwhile is not stored as current.
+
+        :param path: File path.
+        :type path: unicode
+        :param content: Content to store.
+        :type content: object
+        :param options: Options the cached content depends on.
+        :type options: tuple
+        :param signature: File signature taken before reading the content, current one if not given.
+        :type signature: tuple
+        :return: Method success.
+        :rtype: bool
+        """
+
+        if signature is None:
+            signature = self.get_signature(path, options)
+
+        data = pack_entry(self.magic, (signature, content))
+        if len(data) > self.__maximum_size:
+            LOGGER.debug("> '{0}' file content exceeds cache maximum size, skipping!".format(path))
+            return False
+
+        os.path.isdir(self.__directory) or os.makedirs(self.__directory)
+
+        entry_path = self.get_entry_path(path, options)
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.__directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                file.write(data)
+            os.replace(temporary_path, entry_path)
+        except Exception:
+            self.__remove_entry(temporary_path)
+            raise
+
+        LOGGER.debug("> Stored '{0}' file content into '{1}' cache entry.".format(path, entry_path))
+        self.evict_content()
+        return True
+
+    def remove_content(self, path, options=()):
+        """
+        Removes given file and options cached content.
+
+        :param path: File path.
+        :type path: unicode
+        :param options: Options the cached content depends on.
+        :type options: tuple
+        :return: Method success.
+        :rtype: bool
+        """
+
+        return self.__remove_entry(self.get_entry_path(path, options))
+
+    def get_entries(self):
+        """
+        Returns the cache entries sorted from the least to the most recently used.
+
+        :return: Entries paths, sizes and modification times.
+        :rtype: list
+        """
+
+        entries = []
+        if not os.path.isdir(self.__directory):
+            return entries
+
+        for entry in os.scandir(self.__directory):
+            if not entry.name.endswith(".cache"):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((entry.path, stat.st_size, stat.st_mtime))
+        return sorted(entries, key=lambda x: x[2])
+
+    def evict_content(self):
+        """
+        Evicts the least recently used entries until the cache fits its maximum size.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        entries = self.get_entries()
+        size = sum(entry[1] for entry in entries)
+        for path, entry_size, mtime in entries:
+            if size <= self.__maximum_size:
+                break
+
+            LOGGER.debug("> Evicting '{0}' cache entry.".format(path))
+            self.__remove_entry(path)
+            size -= entry_size
+        return True
+
+    def flush_content(self):
+        """
+        Flushes the cache content.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        LOGGER.debug("> Flushing '{0}' cache content.".format(self.__directory))
+
+        for path, size, mtime in self.get_entries():
+            self.__remove_entry(path)
+        return True
+
+    def __remove_entry(self, path):
+        """
+        Removes given cache entry.
+
+        :param path: Entry path.
+        :type path: unicode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
@@ -0,0 +1,523 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**indexes.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines files indexing related objects.
+
+**Others:**
+
+"""
+
+
+
+import os
+import re
+import time
+
+import foundations.cache
+import foundations.exceptions
+import foundations.io
+import foundations.verbose
+import foundations.walkers
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "ADDED", "REMOVED", "MODIFIED", "MODIFICATION_TIME_RESOLUTION", "FilesIndex"]
+
+LOGGER = foundations.verbose.install_logger()
+
+ADDED = "added"
+REMOVED = "removed"
+MODIFIED = "modified"
+MODIFICATION_TIME_RESOLUTION = 2000000000
+
+
+class FilesIndex(object):
+    """
+    | Defines a persistent files index yielding the files changes of a directory tree since its previous update.
+    | The index stores a snapshot of the walked directories modification times and of the files sizes and
+        modification times. On later updates, only the directories whose modification time changed are listed
+        again, the other ones being checked with a single :func:`os.stat` call.
+    | Adding, removing or renaming a file changes its directory modification time, modifying a file content
+        does not: modified files in unchanged directories are only reported when their stats are checked.
+
+    .. warning::
+
+        The snapshot is unpickled when loaded, its file must only be writable by trusted users.
+    """
+
+    magic = b"FNDI\x01"
+    """
+    :param magic: Snapshot header magic bytes.
+    :type magic: bytes
+    """
+
+    def __init__(self, directory=None, path=None, filters_in=None, filters_out=None, flags=0):
+        """
+        Initializes the class.
+
+        Usage::
+
+            >>> files_index = FilesIndex("./foundations/tests/tests_foundations/resources/standard",
+            ...                          "/tmp/standard.index",
+            ...                          filters_in=("\.ibl$",))
+            >>> for event, path in files_index.update():
+            ...     print(event, path)
+            ...
+            added ./foundations/tests/tests_foundations/resources/standard/standard.ibl
+            added ./foundations/tests/tests_foundations/resources/standard/level_0/standard.ibl
+            >>> list(files_index.update())
+            []
+
+        :param directory: Directory to index.
+        :type directory: unicode
+        :param path: Snapshot file path, the snapshot is kept in memory only if not given.
+        :type path: unicode
+        :param filters_in: Regex filters in list matched against the files paths.
+        :type filters_in: tuple or list
+        :param filters_out: Regex filters out list matched against the files paths.
+        :type filters_out: tuple or list
+        :param flags: Regex flags.
+        :type flags: int
+        """
+
+        LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+        # --- Setting class attributes. ---
+        self.__directory = None
+        self.directory = directory
+        self.__path = None
+        self.path = path
+        self.__filters_in = None
+        self.filters_in = filters_in
+        self.__filters_out = None
+        self.filters_out = filters_out
+        self.__flags = None
+        self.flags = flags
+
+        self.__directories = None
+
+    @property
+    def directory(self):
+        """
+        Property for **self.__directory** attribute.
+
+        :return: self.__directory.
+        :rtype: unicode
+        """
+
+        return self.__directory
+
+    @directory.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def directory(self, value):
+        """
+        Setter for **self.__directory** attribute.
+
+        :param value: Attribute value.
+        :type value: unicode
+        """
+
+        if value is not None:
+            assert type(value) is str, "'{0}' attribute: '{1}' type is not 'unicode'!".format("directory", value)
+        self.__directory = value
+
+    @directory.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def directory(self):
+        """
+        Deleter for **self.__directory** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "directory"))
+
+    @property
+    def path(self):
+        """
+        Property for **self.__path** attribute.
+
+        :return: self.__path.
+        :rtype: unicode
+        """
+
+        return self.__path
+
+    @path.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def path(self, value):
+        """
+        Setter for **self.__path** attribute.
+
+        :param value: Attribute value.
+        :type value: unicode
+        """
+
+        if value is not None:
+            assert type(value) is str, "'{0}' attribute: '{1}' type is not 'unicode'!".format("path", value)
+        self.__path = value
+
+    @path.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def path(self):
+        """
+        Deleter for **self.__path** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "path"))
+
+    @property
+    def filters_in(self):
+        """
+        Property for **self.__filters_in** attribute.
+
+        :return: self.__filters_in.
+        :rtype: tuple
+        """
+
+        return self.__filters_in
+
+    @filters_in.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def filters_in(self, value):
+        """
+        Setter for **self.__filters_in** attribute.
+
+        :param value: Attribute value.
+        :type value: tuple or list
+        """
+
+        if value is not None:
+            assert type(value) in (tuple, list), "'{0}' attribute: '{1}' type is not 'tuple' or 'list'!".format(
+                "filters_in", value)
+            value = tuple(value)
+        self.__filters_in = value
+
+    @filters_in.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def filters_in(self):
+        """
+        Deleter for **self.__filters_in** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "filters_in"))
+
+    @property
+    def filters_out(self):
+        """
+        Property for **self.__filters_out** attribute.
+
+        :return: self.__filters_out.
+        :rtype: tuple
+        """
+
+        return self.__filters_out
+
+    @filters_out.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def filters_out(self, value):
+        """
+        Setter for **self.__filters_out** attribute.
+
+        :param value: Attribute value.
+        :type value: tuple or list
+        """
+
+        if value is not None:
+            assert type(value) in (tuple, list), "'{0}' attribute: '{1}' type is not 'tuple' or 'list'!".format(
+                "filters_out", value)
+            value = tuple(value)
+        self.__filters_out = value
+
+    @filters_out.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def filters_out(self):
+        """
+        Deleter for **self.__filters_out** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "filters_out"))
+
+    @property
+    def flags(self):
+        """
+        Property for **self.__flags** attribute.
+
+        :return: self.__flags.
+        :rtype: int
+        """
+
+        return self.__flags
+
+    @flags.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def flags(self, value):
+        """
+        Setter for **self.__flags** attribute.
+
+        :param value: Attribute value.
+        :type value: int
+        """
+
+        if value is not None:
+            assert type(value) in (int, re.RegexFlag), "'{0}' attribute: '{1}' type is not 'int'!".format(
+                "flags", value)
+        self.__flags = value
+
+    @flags.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def flags(self):
+        """
+        Deleter for **self.__flags** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "flags"))
+
+    @property
+    def files(self):
+        """
+        Property for **self.files** attribute.
+
+        :return: self.files.
+        :rtype: dict
+        """
+
+        files = {}
+        for directory, (modification_time, directories, directory_files) in self.__get_directories().items():
+            for name, stat in directory_files.items():
+                files["/".join((directory, name))] = stat
+        return files
+
+    @files.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def files(self, value):
+        """
+        Setter for **self.files** attribute.
+
+        :param value: Attribute value.
+        :type value: dict
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "files"))
+
+    @files.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def files(self):
+        """
+        Deleter for **self.files** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "files"))
+
+    def __get_signature(self):
+        """
+        Returns the index signature, the snapshot is discarded when it does not match.
+
+        :return: Signature.
+        :rtype: tuple
+        """
+
+        return (os.path.abspath(self.__directory),
+                self.__filters_in or (),
+                self.__filters_out or (),
+                int(self.__flags or 0))
+
+    def __get_directories(self):
+        """
+        Returns the snapshot directories, loading them from the snapshot file if needed.
+
+        :return: Directories.
+        :rtype: dict
+        """
+
+        if self.__directories is None:
+            self.__directories = self.load() or {}
+        return self.__directories
+
+    def load(self):
+        """
+        Loads the snapshot from its file.
+
+        :return: Directories or None if no valid snapshot exists.
+        :rtype: dict
+        """
+
+        if not self.__path:
+            return
+
+        try:
+            with open(self.__path, "rb") as file:
+                data = file.read()
+        except (IOError, OSError):
+            return
+
+        try:
+            signature, directories = foundations.cache.unpack_entry(self.magic, data)
+        except Exception as error:
+            LOGGER.warning("!> {0} | '{1}' snapshot is corrupted and will be discarded: '{2}'.".format(
+                self.__class__.__name__, self.__path, error))
+            return
+
+        if signature != self.__get_signature():
+            LOGGER.debug("> '{0}' snapshot signature is stale and will be discarded.".format(self.__path))
+            return
+
+        LOGGER.debug("> Loaded '{0}' snapshot with '{1}' directories.".format(self.__path, len(directories)))
+        return directories
+
+    def save(self):
+        """
+        Saves the snapshot into its file.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        if not self.__path:
+            return False
+
+        directory = os.path.dirname(self.__path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        data = foundations.cache.pack_entry(self.magic, (self.__get_signature(), self.__get_directories()))
+        temporary_path = foundations.io.get_temporary_path(self.__path)
+        try:
+            with open(temporary_path, "wb") as file:
+                file.write(data)
+            foundations.io.atomic_replace(temporary_path, self.__path)
+        except Exception:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+
+        LOGGER.debug("> Saved '{0}' snapshot.".format(self.__path))
+        return True
+
+    def update(self, check_files=False):
+        """
+        | Defines a generator used to update the index and yield the files changes since the previous update.
+        | The changes are yielded as ( event, path ) tuples where event is one of :attr:`ADDED`,
+            :attr:`REMOVED` or :attr:`MODIFIED`, the updated snapshot is stored once the generator is exhausted.
+
+        :param check_files: Stats of the files in unchanged directories are checked to report their
+            modifications.
+        :type check_files: bool
+        :return: Event, path.
+        :rtype: tuple
+        """
+
+        if self.__filters_in:
+            LOGGER.debug("> Current filters in: '{0}'.".format(self.__filters_in))
+
+        if self.__filters_out:
+            LOGGER.debug("> Current filters out: '{0}'.".format(self.__filters_out))
+
+        filters_in = foundations.walkers.compile_filters(self.__filters_in, self.__flags or 0)
+        filters_out = foundations.walkers.compile_filters(self.__filters_out, self.__flags or 0)
+
+        # Directories modified within the modification time resolution of the update could be modified again
+        # without their modification time changing, they are listed again on next update.
+        racy_time = time.time_ns() - MODIFICATION_TIME_RESOLUTION
+
+        previous_directories = self.__get_directories()
+        directories = {}
+        stack = [(self.__directory.replace("\\", "/"), frozenset())]
+        while stack:
+            directory, ancestors = stack.pop()
+            try:
+                stat = os.stat(directory)
+            except OSError:
+                continue
+
+            ancestors = foundations.walkers.get_ancestors(directory, ancestors, stat=stat)
+            if ancestors is None:
+                continue
+
+            modification_time = stat.st_mtime_ns if stat.st_mtime_ns < racy_time else None
+            previous = previous_directories.get(directory)
+            if previous is not None and previous[0] == stat.st_mtime_ns:
+                sub_directories, previous_files = previous[1], previous[2]
+                files = previous_files
+                if check_files:
+                    files = {}
+                    for name, file_stat in previous_files.items():
+                        path = "/".join((directory, name))
+                        current_stat = self.__get_file_stat(path)
+                        if current_stat is None:
+                            yield REMOVED, path
+                            continue
+
+                        if current_stat != file_stat:
+                            yield MODIFIED, path
+                        files[name] = current_stat
+            else:
+                LOGGER.debug("> Listing '{0}' changed directory.".format(directory))
+                previous_files = previous[2] if previous is not None else {}
+                paths, sub_directories = foundations.walkers.scan_directory(directory)
+                sub_directories = [os.path.basename(path) for path in sub_directories]
+                files = {}
+                for path in paths:
+                    if not foundations.walkers.filter_path(path, filters_in, filters_out):
+                        continue
+
+                    file_stat = self.__get_file_stat(path)
+                    if file_stat is None:
+                        continue
+
+                    name = os.path.basename(path)
+                    files[name] = file_stat
+                    if name not in previous_files:
+                        yield ADDED, path
+                    elif previous_files[name] != file_stat:
+                        yield MODIFIED, path
+
+                for name in previous_files:
+                    if name not in files:
+                        yield REMOVED, "/".join((directory, name))
+
+            directories[directory] = (modification_time, sub_directories, files)
+            stack.extend(("/".join((directory, name)), ancestors) for name in reversed(sub_directories))
+
+        for directory, (modification_time, sub_directories, files) in previous_directories.items():
+            if directory in directories:
+                continue
+
+            for name in files:
+                yield REMOVED, "/".join((directory, name))
+
+        self.__directories = directories
+        self.save()
+
+    def __get_file_stat(self, path):
+        """
+        Returns given file size and modification time.
+
+        :param path: File path.
+        :type path: unicode
+        :return: Size, modification time or None if the file is not accessible.
+        :rtype: tuple
+        """
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+        return stat.st_size, stat.st_mtime_ns
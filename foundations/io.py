@@ -16,11 +16,26 @@
 
 
 
+import asyncio
 import codecs
+import concurrent.futures
+import hashlib
+import http.client
+import io
+import json
+import mmap
 import os
 import shutil
+import sys
+import threading
+import uuid
 import urllib.request, urllib.error, urllib.parse
 
+if sys.version_info[:2] <= (2, 6):
+    from ordereddict import OrderedDict
+else:
+    from collections import OrderedDict
+
 import foundations.common
 import foundations.verbose
 import foundations.exceptions
@@ -34,17 +49,56 @@ __maintainer__ = "Thomas Mansencal"
 __email__ = "thomas.mansencal@gmail.com"
 __status__ = "Production"
 
-__all__ = ["LOGGER", "File", "set_directory", "copy", "remove", "is_writable", "is_readable", "is_binary_file"]
+__all__ = ["LOGGER",
+           "CHUNK_SIZE",
+           "BUFFER_SIZE",
+           "ASYNC_WORKERS",
+           "BINARY_SAMPLE_SIZE",
+           "TEXT_CHARACTERS",
+           "HTTP_TIMEOUT",
+           "HTTP_CONNECTIONS",
+           "HTTP_REDIRECTIONS",
+           "File",
+           "HttpConnectionPool",
+           "get_async_executor",
+           "get_http_connection_pool",
+           "set_directory",
+           "copy",
+           "get_temporary_path",
+           "atomic_replace",
+           "remove",
+           "is_writable",
+           "is_readable",
+           "is_binary_file",
+           "classify_binary_files"]
 
 LOGGER = foundations.verbose.install_logger()
 
+CHUNK_SIZE = 65536
+BUFFER_SIZE = 1048576
+# Decoding holds the GIL, more workers than processors increases the event loop latency.
+ASYNC_WORKERS = min(32, (os.cpu_count() or 1) + 1)
+
+BINARY_SAMPLE_SIZE = 65536
+TEXT_CHARACTERS = bytes(bytearray([7, 8, 9, 10, 12, 13, 27]) + bytearray(range(32, 127)) + bytearray(range(128, 256)))
+
+HTTP_TIMEOUT = 30
+HTTP_CONNECTIONS = 8
+HTTP_REDIRECTIONS = 8
+
+_ASYNC_EXECUTOR = None
+_ASYNC_EXECUTOR_LOCK = threading.Lock()
+
+_HTTP_CONNECTION_POOL = None
+_HTTP_CONNECTION_POOL_LOCK = threading.Lock()
+
 
 class File(object):
     """
     Defines methods to read / write and append to files or retrieve online file content.
     """
 
-    def __init__(self, path=None, content=None):
+    def __init__(self, path=None, content=None, mmap=False):
         """
         Initializes the class.
 
@@ -56,11 +110,19 @@ class File(object):
             True
             >>> file.read()
             u'Some file content ...\\n... ready to be saved!\\n'
+            >>> file = File(u"file.txt", mmap=True)
+            >>> file.cache()
+            True
+            >>> list(file.iter_lines())
+            [u'Some file content ...\\n', u'... ready to be saved!\\n']
 
         :param path: File path.
         :type path: unicode
         :param content: Content.
         :type content: list
+        :param mmap: File is memory mapped when cached instead of being decoded into the content,
+            lines are decoded on iteration.
+        :type mmap: bool
         """
 
         LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
@@ -70,6 +132,9 @@ class File(object):
         self.path = path
         self.__content = None
         self.content = content or []
+        self.__mmap = None
+        self.mmap = mmap
+        self.__buffer = None
 
     @property
     def path(self):
@@ -141,12 +206,87 @@ class File(object):
         raise foundations.exceptions.ProgrammingError(
             "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "content"))
 
+    @property
+    def mmap(self):
+        """
+        Property for **self.__mmap** attribute.
+
+        :return: self.__mmap.
+        :rtype: bool
+        """
+
+        return self.__mmap
+
+    @mmap.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def mmap(self, value):
+        """
+        Setter for **self.__mmap** attribute.
+
+        :param value: Attribute value.
+        :type value: bool
+        """
+
+        if value is not None:
+            assert type(value) is bool, "'{0}' attribute: '{1}' type is not 'bool'!".format("mmap", value)
+        self.__mmap = value
+
+    @mmap.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def mmap(self):
+        """
+        Deleter for **self.__mmap** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "mmap"))
+
+    @property
+    def buffer(self):
+        """
+        Property for **self.__buffer** attribute, the memory mapped file content in
+            :obj:`File.mmap` mode once cached.
+
+        :return: self.__buffer.
+        :rtype: mmap.mmap
+        """
+
+        return self.__buffer
+
+    @buffer.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def buffer(self, value):
+        """
+        Setter for **self.__buffer** attribute.
+
+        :param value: Attribute value.
+        :type value: mmap.mmap
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "buffer"))
+
+    @buffer.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def buffer(self):
+        """
+        Deleter for **self.__buffer** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "buffer"))
+
     @foundations.exceptions.handle_exceptions(foundations.exceptions.UrlReadError,
                                               foundations.exceptions.FileReadError,
                                               IOError)
-    def cache(self, mode="r", encoding=Constants.default_codec, errors=Constants.codec_error):
+    def cache(self,
+              mode="r",
+              encoding=Constants.default_codec,
+              errors=Constants.codec_error,
+              buffering=BUFFER_SIZE):
         """
-        Reads given file content and stores it in the content cache.
+        | Reads given file content and stores it in the content cache.
+        | In :obj:`File.mmap` mode, the file is memory mapped into the :obj:`File.buffer` class property instead.
 
         :param mode: File read mode.
         :type mode: unicode
@@ -154,6 +294,8 @@ class File(object):
         :type encoding: unicode
         :param errors: File encoding errors handling.
         :type errors: unicode
+        :param buffering: File buffer size.
+        :type buffering: int
         :return: Method success.
         :rtype: bool
         """
@@ -161,21 +303,24 @@ class File(object):
         self.uncache()
 
         if foundations.strings.is_website(self.__path):
-            try:
-                LOGGER.debug("> Caching '{0}' online file content.".format(self.__path))
-                self.__content = urllib.request.urlopen(self.__path).readlines()
-                return True
-            except urllib.error.URLError as error:
-                raise foundations.exceptions.UrlReadError(
-                    "!> {0} | '{1}' url is not readable: '{2}'.".format(self.__class__.__name__, self.__path, error))
+            LOGGER.debug("> Caching '{0}' online file content.".format(self.__path))
+            self.__content = "".join(self.iter_chunks(CHUNK_SIZE, encoding, errors)).splitlines(True)
+            return True
         elif foundations.common.path_exists(self.__path):
             if not is_readable(self.__path):
                 raise foundations.exceptions.FileReadError(
                     "!> {0} | '{1}' file is not readable!".format(self.__class__.__name__, self.__path))
 
-            with codecs.open(self.__path, mode, encoding, errors) as file:
+            if self.__mmap:
+                with open(self.__path, "rb") as file:
+                    LOGGER.debug("> Mapping '{0}' file content.".format(self.__path))
+                    self.__buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) \
+                        if os.fstat(file.fileno()).st_size else b""
+                    return True
+
+            with io.open(self.__path, mode, buffering, encoding, errors, newline="") as file:
                 LOGGER.debug("> Caching '{0}' file content.".format(self.__path))
-                self.__content = file.readlines()
+                self.__content = file.read().splitlines(True)
                 return True
         return False
 
@@ -190,6 +335,9 @@ class File(object):
         LOGGER.debug("> Uncaching '{0}' file content.".format(self.__path))
 
         self.__content = []
+        if isinstance(self.__buffer, mmap.mmap):
+            self.__buffer.close()
+        self.__buffer = None
         return True
 
     def read(self):
@@ -200,20 +348,176 @@ class File(object):
         :rtype: unicode
         """
 
-        return "".join(self.__content) if self.cache() else ""
+        if not self.cache():
+            return ""
+
+        if self.__mmap:
+            return self.__buffer[:].decode(Constants.default_codec, Constants.codec_error)
+        return "".join(self.__content)
+
+    def iter_chunks(self, chunk_size=CHUNK_SIZE, encoding=Constants.default_codec, errors=Constants.codec_error):
+        """
+        | Defines a generator used to iterate over the file content in decoded chunks.
+        | The file is read by blocks of given size and decoded with an incremental decoder, thus multi-bytes
+            characters spanning blocks boundaries are preserved and the file is never entirely held in memory.
+        | Online files are streamed through :func:`get_http_connection_pool` definition connection pool.
+        | If the content is cached, its lines are yielded as is.
+
+        Usage::
+
+            >>> file = File(u"file.txt")
+            >>> for chunk in file.iter_chunks(chunk_size=16):
+            ...     print(repr(chunk))
+            ...
+            u'Some file conten'
+            u't ...\\n... ready '
+            u'to be saved!\\n'
+
+        :param chunk_size: Chunks size in bytes.
+        :type chunk_size: int
+        :param encoding: File encoding codec.
+        :type encoding: unicode
+        :param errors: File encoding errors handling.
+        :type errors: unicode
+        :return: Chunk.
+        :rtype: unicode
+        """
+
+        if self.__content:
+            for line in self.__content:
+                yield line
+            return
+
+        decoder = codecs.getincrementaldecoder(encoding)(errors)
+        if self.__mmap:
+            if self.__buffer is None:
+                self.cache()
+
+            buffer = self.__buffer
+            if buffer is None:
+                return
+
+            LOGGER.debug("> Iterating over '{0}' memory mapped file chunks.".format(self.__path))
+            for offset in range(0, len(buffer), chunk_size):
+                chunk = decoder.decode(buffer[offset:offset + chunk_size])
+                if chunk:
+                    yield chunk
+        elif foundations.strings.is_website(self.__path):
+            LOGGER.debug("> Iterating over '{0}' online file chunks.".format(self.__path))
+            for chunk in get_http_connection_pool().iter_content(self.__path, chunk_size):
+                chunk = decoder.decode(chunk)
+                if chunk:
+                    yield chunk
+        elif foundations.common.path_exists(self.__path):
+            if not is_readable(self.__path):
+                raise foundations.exceptions.FileReadError(
+                    "!> {0} | '{1}' file is not readable!".format(self.__class__.__name__, self.__path))
+
+            LOGGER.debug("> Iterating over '{0}' file chunks.".format(self.__path))
+            with open(self.__path, "rb") as handle:
+                for chunk in iter(lambda: handle.read(chunk_size), b""):
+                    chunk = decoder.decode(chunk)
+                    if chunk:
+                        yield chunk
+        else:
+            return
+
+        chunk = decoder.decode(b"", final=True)
+        if chunk:
+            yield chunk
+
+    def iter_lines(self, encoding=Constants.default_codec, errors=Constants.codec_error, chunk_size=CHUNK_SIZE):
+        """
+        | Defines a generator used to iterate over the file content lines.
+        | The file is streamed using :meth:`File.iter_chunks` method and split into lines the same way
+            :meth:`File.cache` method does, the content is not cached.
+        | In :obj:`File.mmap` mode, lines are split on line feeds in the memory mapped buffer and only
+            decoded when consumed, the encoding is expected to be ASCII compatible.
+        | If the content is cached, its lines are yielded as is.
+
+        Usage::
+
+            >>> file = File(u"file.txt", mmap=True)
+            >>> for line in file.iter_lines():
+            ...     print(line)
+            ...
+            Some file content ...
+            ... ready to be saved!
+
+        :param encoding: File encoding codec.
+        :type encoding: unicode
+        :param errors: File encoding errors handling.
+        :type errors: unicode
+        :param chunk_size: Chunks size in bytes, not used in :obj:`File.mmap` mode.
+        :type chunk_size: int
+        :return: Line.
+        :rtype: unicode
+        """
+
+        if self.__content:
+            for line in self.__content:
+                yield line
+            return
+
+        if not self.__mmap:
+            pending = ""
+            for chunk in self.iter_chunks(chunk_size, encoding, errors):
+                lines = (pending + chunk).splitlines(True)
+                # The last line might be incomplete or be a carriage return followed by a line feed in the next chunk.
+                pending = lines.pop()
+                for line in lines:
+                    yield line
+            if pending:
+                yield pending
+            return
+
+        if self.__buffer is None:
+            self.cache()
+
+        buffer = self.__buffer
+        if buffer is None:
+            return
+
+        start, size = 0, len(buffer)
+        while start < size:
+            end = buffer.find(b"\n", start)
+            end = size if end == -1 else end + 1
+            yield buffer[start:end].decode(encoding, errors)
+            start = end
 
     @foundations.exceptions.handle_exceptions(foundations.exceptions.UrlWriteError,
                                               foundations.exceptions.FileWriteError)
-    def write(self, mode="w", encoding=Constants.default_codec, errors=Constants.codec_error):
+    def write(self,
+              mode="w",
+              encoding=Constants.default_codec,
+              errors=Constants.codec_error,
+              atomic=False,
+              buffering=BUFFER_SIZE,
+              durable=False):
         """
         Writes content to defined file.
 
+        Usage::
+
+            >>> file = File(u"file.txt", [u"Some file content ...\\n"])
+            >>> file.write(atomic=True, durable=True)
+            True
+
         :param mode: File write mode.
         :type mode: unicode
         :param encoding: File encoding codec.
         :type encoding: unicode
         :param errors: File encoding errors handling.
         :type errors: unicode
+        :param atomic: Content is written to a temporary file renamed over defined file, or its symbolic link
+            target, so that readers never see a partially written file. The file is written in place when its
+            parent directory is not writable or its ownership cannot be preserved.
+        :type atomic: bool
+        :param buffering: File buffer size.
+        :type buffering: int
+        :param durable: Content is flushed to disk before returning, in atomic mode the file
+            parent directory is flushed too so that the file replacement survives a system crash.
+        :type durable: bool
         :return: Method success.
         :rtype: bool
         """
@@ -227,16 +531,50 @@ class File(object):
                 raise foundations.exceptions.FileWriteError(
                     "!> {0} | '{1}' file is not writable!".format(self.__class__.__name__, self.__path))
 
-        with codecs.open(self.__path, mode, encoding, errors) as file:
+        if atomic and "a" in mode:
+            raise foundations.exceptions.ProgrammingError(
+                "{0} | '{1}' file cannot be atomically written in '{2}' append mode!".format(
+                    self.__class__.__name__, self.__path, mode))
+
+        if isinstance(self.__buffer, mmap.mmap):
+            self.__buffer.close()
+        self.__buffer = None
+
+        path = os.path.realpath(self.__path)
+        if atomic and not _is_replaceable(path):
+            LOGGER.debug("> '{0}' file cannot be atomically replaced, writing it in place.".format(self.__path))
+            atomic = False
+
+        if atomic:
+            temporary_path = get_temporary_path(path)
+            try:
+                with io.open(temporary_path, mode, buffering, encoding, errors, newline="") as file:
+                    LOGGER.debug("> Writing '{0}' file content through '{1}' file.".format(self.__path,
+                                                                                         temporary_path))
+                    file.writelines(self.__content)
+                atomic_replace(temporary_path, path, durable)
+            except Exception:
+                if os.path.exists(temporary_path):
+                    os.remove(temporary_path)
+                raise
+            return True
+
+        with io.open(self.__path, mode, buffering, encoding, errors, newline="") as file:
             LOGGER.debug("> Writing '{0}' file content.".format(self.__path))
-            for line in self.__content:
-                file.write(line)
+            file.writelines(self.__content)
+            if durable:
+                file.flush()
+                os.fsync(file.fileno())
             return True
         return False
 
     @foundations.exceptions.handle_exceptions(foundations.exceptions.UrlWriteError,
                                               foundations.exceptions.FileWriteError)
-    def append(self, mode="a", encoding=Constants.default_codec, errors=Constants.codec_error):
+    def append(self,
+               mode="a",
+               encoding=Constants.default_codec,
+               errors=Constants.codec_error,
+               buffering=BUFFER_SIZE):
         """
         Appends content to defined file.
 
@@ -246,6 +584,8 @@ class File(object):
         :type encoding: unicode
         :param errors: File encoding errors handling.
         :type errors: unicode
+        :param buffering: File buffer size.
+        :type buffering: int
         :return: Method success.
         :rtype: bool
         """
@@ -259,10 +599,9 @@ class File(object):
                 raise foundations.exceptions.FileWriteError(
                     "!> {0} | '{1}' file is not writable!".format(self.__class__.__name__, self.__path))
 
-        with codecs.open(self.__path, mode, encoding, errors) as file:
+        with io.open(self.__path, mode, buffering, encoding, errors, newline="") as file:
             LOGGER.debug("> Appending to '{0}' file content.".format(self.__path))
-            for line in self.__content:
-                file.write(line)
+            file.writelines(self.__content)
             return True
         return False
 
@@ -287,6 +626,581 @@ class File(object):
         else:
             return False
 
+    async def acache(self,
+                     mode="r",
+                     encoding=Constants.default_codec,
+                     errors=Constants.codec_error,
+                     buffering=BUFFER_SIZE,
+                     executor=None):
+        """
+        | Coroutine reading given file content and storing it in the content cache.
+        | The blocking :meth:`File.cache` method is offloaded to given executor so that the event loop is not blocked.
+
+        Usage::
+
+            >>> file = File(u"file.txt")
+            >>> asyncio.run(file.acache())
+            True
+
+        :param mode: File read mode.
+        :type mode: unicode
+        :param encoding: File encoding codec.
+        :type encoding: unicode
+        :param errors: File encoding errors handling.
+        :type errors: unicode
+        :param buffering: File buffer size.
+        :type buffering: int
+        :param executor: Executor, defaults to :func:`get_async_executor` definition bounded executor.
+        :type executor: concurrent.futures.Executor
+        :return: Method success.
+        :rtype: bool
+        """
+
+        return await _run_in_executor(executor, self.cache, mode, encoding, errors, buffering)
+
+    async def aread(self, executor=None):
+        """
+        | Coroutine returning defined file content.
+        | The blocking :meth:`File.read` method is offloaded to given executor so that the event loop is not blocked.
+
+        Usage::
+
+            >>> asyncio.run(File(u"file.txt").aread())
+            u'Some file content ...\\n... ready to be saved!\\n'
+
+        :param executor: Executor, defaults to :func:`get_async_executor` definition bounded executor.
+        :type executor: concurrent.futures.Executor
+        :return: File content.
+        :rtype: unicode
+        """
+
+        return await _run_in_executor(executor, self.read)
+
+    async def awrite(self,
+                     mode="w",
+                     encoding=Constants.default_codec,
+                     errors=Constants.codec_error,
+                     atomic=False,
+                     buffering=BUFFER_SIZE,
+                     durable=False,
+                     executor=None):
+        """
+        | Coroutine writing content to defined file.
+        | The blocking :meth:`File.write` method is offloaded to given executor so that the event loop is not blocked.
+
+        Usage::
+
+            >>> file = File(u"file.txt", [u"Some file content ...\\n"])
+            >>> asyncio.run(file.awrite(atomic=True))
+            True
+
+        :param mode: File write mode.
+        :type mode: unicode
+        :param encoding: File encoding codec.
+        :type encoding: unicode
+        :param errors: File encoding errors handling.
+        :type errors: unicode
+        :param atomic: Content is written to a temporary file renamed over defined file.
+        :type atomic: bool
+        :param buffering: File buffer size.
+        :type buffering: int
+        :param durable: Content is flushed to disk before returning.
+        :type durable: bool
+        :param executor: Executor, defaults to :func:`get_async_executor` definition bounded executor.
+        :type executor: concurrent.futures.Executor
+        :return: Method success.
+        :rtype: bool
+        """
+
+        return await _run_in_executor(executor, self.write, mode, encoding, errors, atomic, buffering, durable)
+
+
+class HttpConnectionPool(object):
+    """
+    | Defines a thread safe pool of persistent HTTP / HTTPS connections used to fetch online files.
+    | Idle connections are kept alive and reused per host, the concurrent connections count per host is bounded.
+    | If a cache directory is defined, responses bearing an **ETag** or **Last-Modified** header are stored
+        and revalidated with conditional requests, a **304 Not Modified** response is served from the cache.
+    """
+
+    def __init__(self, timeout=HTTP_TIMEOUT, maximum_connections=HTTP_CONNECTIONS, cache_directory=None):
+        """
+        Initializes the class.
+
+        Usage::
+
+            >>> pool = HttpConnectionPool(timeout=10, cache_directory="/tmp/http_cache")
+            >>> pool.get_content("http://www.example.com/standard.ibl")
+            b'[Header]\\nICOfile = "Standard.jpg"\\n...'
+
+        :param timeout: Connections timeout in seconds.
+        :type timeout: int or float
+        :param maximum_connections: Maximum concurrent connections count per host.
+        :type maximum_connections: int
+        :param cache_directory: Conditional requests content cache directory.
+        :type cache_directory: unicode
+        """
+
+        LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+        # --- Setting class attributes. ---
+        self.__timeout = None
+        self.timeout = timeout
+        self.__maximum_connections = None
+        self.maximum_connections = maximum_connections
+        self.__cache_directory = None
+        self.cache_directory = cache_directory
+
+        self.__connections = {}
+        self.__semaphores = {}
+        self.__lock = threading.Lock()
+
+    @property
+    def timeout(self):
+        """
+        Property for **self.__timeout** attribute.
+
+        :return: self.__timeout.
+        :rtype: int or float
+        """
+
+        return self.__timeout
+
+    @timeout.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def timeout(self, value):
+        """
+        Setter for **self.__timeout** attribute.
+
+        :param value: Attribute value.
+        :type value: int or float
+        """
+
+        if value is not None:
+            assert type(value) in (int, float), "'{0}' attribute: '{1}' type is not 'int' or 'float'!".format(
+                "timeout", value)
+            assert value > 0, "'{0}' attribute: '{1}' need to be exactly positive!".format("timeout", value)
+        self.__timeout = value
+
+    @timeout.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def timeout(self):
+        """
+        Deleter for **self.__timeout** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "timeout"))
+
+    @property
+    def maximum_connections(self):
+        """
+        Property for **self.__maximum_connections** attribute.
+
+        :return: self.__maximum_connections.
+        :rtype: int
+        """
+
+        return self.__maximum_connections
+
+    @maximum_connections.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def maximum_connections(self, value):
+        """
+        Setter for **self.__maximum_connections** attribute, the value applies to hosts connected afterwards.
+
+        :param value: Attribute value.
+        :type value: int
+        """
+
+        if value is not None:
+            assert type(value) is int, "'{0}' attribute: '{1}' type is not 'int'!".format("maximum_connections",
+                                                                                         value)
+            assert value > 0, "'{0}' attribute: '{1}' need to be exactly positive!".format("maximum_connections",
+                                                                                          value)
+        self.__maximum_connections = value
+
+    @maximum_connections.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def maximum_connections(self):
+        """
+        Deleter for **self.__maximum_connections** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "maximum_connections"))
+
+    @property
+    def cache_directory(self):
+        """
+        Property for **self.__cache_directory** attribute.
+
+        :return: self.__cache_directory.
+        :rtype: unicode
+        """
+
+        return self.__cache_directory
+
+    @cache_directory.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def cache_directory(self, value):
+        """
+        Setter for **self.__cache_directory** attribute.
+
+        :param value: Attribute value.
+        :type value: unicode
+        """
+
+        if value is not None:
+            assert type(value) is str, "'{0}' attribute: '{1}' type is not 'str'!".format("cache_directory", value)
+        self.__cache_directory = value
+
+    @cache_directory.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def cache_directory(self):
+        """
+        Deleter for **self.__cache_directory** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "cache_directory"))
+
+    def __get_connection(self, key):
+        """
+        Returns an idle or new connection for given host key once a connection slot is available.
+
+        :param key: Host key, scheme and network location.
+        :type key: tuple
+        :return: Semaphore, connection, connection is reused.
+        :rtype: tuple
+        """
+
+        with self.__lock:
+            semaphore = self.__semaphores.get(key)
+            if semaphore is None:
+                semaphore = self.__semaphores[key] = threading.BoundedSemaphore(self.__maximum_connections)
+
+        if not semaphore.acquire(timeout=self.__timeout):
+            raise foundations.exceptions.UrlReadError(
+                "!> {0} | '{1}' host connections slots are exhausted!".format(self.__class__.__name__, key[1]))
+
+        with self.__lock:
+            connections = self.__connections.get(key)
+            if connections:
+                return semaphore, connections.pop(), True
+
+        scheme, netloc = key
+        LOGGER.debug("> Opening '{0}' host connection.".format(netloc))
+        connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return semaphore, connection_class(netloc, timeout=self.__timeout), False
+
+    def __release_connection(self, key, semaphore, connection, reusable):
+        """
+        Releases given connection, keeping it alive for reuse if possible.
+
+        :param key: Host key, scheme and network location.
+        :type key: tuple
+        :param semaphore: Host connections semaphore.
+        :type semaphore: BoundedSemaphore
+        :param connection: Connection.
+        :type connection: HTTPConnection
+        :param reusable: Connection can be reused.
+        :type reusable: bool
+        """
+
+        if reusable:
+            with self.__lock:
+                self.__connections.setdefault(key, []).append(connection)
+        else:
+            connection.close()
+        semaphore.release()
+
+    def __request(self, url, headers):
+        """
+        Sends a **GET** request for given url, a stale kept alive connection is transparently replaced.
+
+        :param url: Url.
+        :type url: unicode
+        :param headers: Request headers.
+        :type headers: dict
+        :return: Host key, semaphore, connection, response.
+        :rtype: tuple
+        """
+
+        parts = urllib.parse.urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        target = urllib.parse.urlunsplit(("", "", parts.path or "/", parts.query, ""))
+        while True:
+            semaphore, connection, reused = self.__get_connection(key)
+            try:
+                connection.request("GET", target, headers=headers)
+                return key, semaphore, connection, connection.getresponse()
+            except (http.client.HTTPException, OSError) as error:
+                self.__release_connection(key, semaphore, connection, False)
+                if reused and isinstance(error, (http.client.RemoteDisconnected, ConnectionError)):
+                    LOGGER.debug("> Replacing stale '{0}' host connection.".format(key[1]))
+                    continue
+
+                raise foundations.exceptions.UrlReadError(
+                    "!> {0} | '{1}' url is not readable: '{2}'.".format(self.__class__.__name__, url, error))
+
+    def __get_entry_path(self, url):
+        """
+        Returns given url cache entry path.
+
+        :param url: Url.
+        :type url: unicode
+        :return: Entry path.
+        :rtype: unicode
+        """
+
+        return os.path.join(self.__cache_directory,
+                            "{0}.http".format(hashlib.sha1(url.encode(Constants.default_codec)).hexdigest()))
+
+    def __get_entry_metadata(self, path):
+        """
+        Returns given cache entry metadata, the entry first line.
+
+        :param path: Entry path.
+        :type path: unicode
+        :return: Entry metadata.
+        :rtype: dict
+        """
+
+        try:
+            with open(path, "rb") as file:
+                return json.loads(file.readline().decode(Constants.default_codec))
+        except (IOError, OSError, ValueError):
+            return None
+
+    def __iter_entry(self, path, chunk_size):
+        """
+        Defines a generator used to iterate over given cache entry content.
+
+        :param path: Entry path.
+        :type path: unicode
+        :param chunk_size: Chunks size in bytes.
+        :type chunk_size: int
+        :return: Chunk.
+        :rtype: bytes
+        """
+
+        with open(path, "rb") as file:
+            file.readline()
+            for chunk in iter(lambda: file.read(chunk_size), b""):
+                yield chunk
+
+    def iter_content(self, url, chunk_size=CHUNK_SIZE):
+        """
+        | Defines a generator used to iterate over given url content.
+        | The response body is streamed by chunks of given size and stored in the cache while being read,
+            redirections are followed. Urls other than HTTP / HTTPS ones are read with
+            :func:`urllib.request.urlopen` definition.
+
+        Usage::
+
+            >>> pool = HttpConnectionPool()
+            >>> for chunk in pool.iter_content("http://www.example.com/standard.ibl", chunk_size=16):
+            ...     print(chunk)
+            ...
+            b'[Header]\\nICOfile '
+            ...
+
+        :param url: Url.
+        :type url: unicode
+        :param chunk_size: Chunks size in bytes.
+        :type chunk_size: int
+        :return: Chunk.
+        :rtype: bytes
+        """
+
+        if urllib.parse.urlsplit(url).scheme not in ("http", "https"):
+            try:
+                handle = urllib.request.urlopen(url, timeout=self.__timeout)
+            except (urllib.error.URLError, OSError) as error:
+                raise foundations.exceptions.UrlReadError(
+                    "!> {0} | '{1}' url is not readable: '{2}'.".format(self.__class__.__name__, url, error))
+
+            with handle:
+                for chunk in iter(lambda: handle.read(chunk_size), b""):
+                    yield chunk
+            return
+
+        headers = {"Accept-Encoding": "identity"}
+        entry = metadata = None
+        if self.__cache_directory is not None:
+            entry = self.__get_entry_path(url)
+            metadata = self.__get_entry_metadata(entry)
+            if metadata is not None:
+                if metadata.get("etag"):
+                    headers["If-None-Match"] = metadata["etag"]
+                if metadata.get("last_modified"):
+                    headers["If-Modified-Since"] = metadata["last_modified"]
+
+        location = url
+        for i in range(HTTP_REDIRECTIONS + 1):
+            key, semaphore, connection, response = self.__request(location, headers)
+            if response.status not in (301, 302, 303, 307, 308) or not response.getheader("Location"):
+                break
+
+            response.read()
+            self.__release_connection(key, semaphore, connection, not response.will_close)
+            location = urllib.parse.urljoin(location, response.getheader("Location"))
+            LOGGER.debug("> Following '{0}' url redirection to '{1}'.".format(url, location))
+        else:
+            raise foundations.exceptions.UrlReadError(
+                "!> {0} | '{1}' url exceeded '{2}' redirections!".format(self.__class__.__name__, url,
+                                                                        HTTP_REDIRECTIONS))
+
+        reusable, temporary_path = False, None
+        try:
+            if response.status == 304 and metadata is not None:
+                response.read()
+                self.__release_connection(key, semaphore, connection, not response.will_close)
+                connection = None
+                LOGGER.debug("> '{0}' url is not modified, reading cached content.".format(url))
+                for chunk in self.__iter_entry(entry, chunk_size):
+                    yield chunk
+                return
+
+            if response.status != 200:
+                raise foundations.exceptions.UrlReadError(
+                    "!> {0} | '{1}' url is not readable: '{2} {3}'.".format(self.__class__.__name__, url,
+                                                                           response.status, response.reason))
+
+            metadata = {"url": url,
+                        "etag": response.getheader("ETag"),
+                        "last_modified": response.getheader("Last-Modified")}
+            cache = None
+            if entry is not None and (metadata["etag"] or metadata["last_modified"]):
+                foundations.common.path_exists(self.__cache_directory) or set_directory(self.__cache_directory)
+                temporary_path = get_temporary_path(entry)
+                cache = open(temporary_path, "wb")
+                cache.write(json.dumps(metadata).encode(Constants.default_codec) + b"\n")
+
+            try:
+                for chunk in iter(lambda: response.read(chunk_size), b""):
+                    if cache is not None:
+                        cache.write(chunk)
+                    yield chunk
+            except (http.client.HTTPException, OSError) as error:
+                raise foundations.exceptions.UrlReadError(
+                    "!> {0} | '{1}' url is not readable: '{2}'.".format(self.__class__.__name__, url, error))
+            finally:
+                if cache is not None:
+                    cache.close()
+            reusable = not response.will_close
+
+            if cache is not None:
+                LOGGER.debug("> Caching '{0}' url content.".format(url))
+                atomic_replace(temporary_path, entry)
+                temporary_path = None
+        finally:
+            if connection is not None:
+                self.__release_connection(key, semaphore, connection, reusable)
+            if temporary_path is not None and os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    def get_content(self, url):
+        """
+        Returns given url content.
+
+        Usage::
+
+            >>> HttpConnectionPool().get_content("http://www.example.com/standard.ibl")
+            b'[Header]\\nICOfile = "Standard.jpg"\\n...'
+
+        :param url: Url.
+        :type url: unicode
+        :return: Content.
+        :rtype: bytes
+        """
+
+        return b"".join(self.iter_content(url))
+
+    def close(self):
+        """
+        Closes the idle connections.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        with self.__lock:
+            connections, self.__connections = self.__connections, {}
+
+        for host_connections in connections.values():
+            for connection in host_connections:
+                connection.close()
+        return True
+
+
+def get_async_executor():
+    """
+    | Returns the shared executor used by :class:`File` class coroutines.
+    | The executor is created on first call with :data:`ASYNC_WORKERS` threads, as files are opened and closed
+        within the workers, the concurrently opened files count is bounded by the workers count whatever
+        the number of pending coroutines is.
+
+    Usage::
+
+        >>> get_async_executor()
+        <concurrent.futures.thread.ThreadPoolExecutor object at 0x10bfd2a50>
+
+    :return: Executor.
+    :rtype: concurrent.futures.ThreadPoolExecutor
+    """
+
+    global _ASYNC_EXECUTOR
+
+    with _ASYNC_EXECUTOR_LOCK:
+        if _ASYNC_EXECUTOR is None:
+            LOGGER.debug("> Creating asynchronous executor with '{0}' workers.".format(ASYNC_WORKERS))
+            _ASYNC_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=ASYNC_WORKERS,
+                                                                    thread_name_prefix="foundations.io")
+        return _ASYNC_EXECUTOR
+
+
+def get_http_connection_pool():
+    """
+    | Returns the shared connection pool used by :class:`File` class to read online files.
+    | The pool is created on first call, its timeout, connections count and cache directory can be configured
+        through its properties.
+
+    Usage::
+
+        >>> get_http_connection_pool().cache_directory = "/tmp/http_cache"
+        >>> File("http://www.example.com/standard.ibl").cache()
+        True
+
+    :return: Connection pool.
+    :rtype: HttpConnectionPool
+    """
+
+    global _HTTP_CONNECTION_POOL
+
+    with _HTTP_CONNECTION_POOL_LOCK:
+        if _HTTP_CONNECTION_POOL is None:
+            _HTTP_CONNECTION_POOL = HttpConnectionPool()
+        return _HTTP_CONNECTION_POOL
+
+
+def _run_in_executor(executor, callable, *args):
+    """
+    Runs given callable with given arguments in given executor from the running event loop.
+
+    :param executor: Executor, defaults to :func:`get_async_executor` definition bounded executor.
+    :type executor: concurrent.futures.Executor
+    :param callable: Callable.
+    :type callable: object
+    :param \*args: Arguments.
+    :type \*args: \*
+    :return: Future.
+    :rtype: asyncio.Future
+    """
+
+    return asyncio.get_running_loop().run_in_executor(executor or get_async_executor(), callable, *args)
+
 
 @foundations.exceptions.handle_exceptions(foundations.exceptions.DirectoryCreationError)
 def set_directory(path):
@@ -315,7 +1229,7 @@ def set_directory(path):
 
 
 @foundations.exceptions.handle_exceptions(foundations.exceptions.PathCopyError)
-def copy(source, destination):
+def copy(source, destination, atomic=False, durable=False):
     """
     Copies given file or directory to destination.
 
@@ -323,23 +1237,141 @@ def copy(source, destination):
     :type source: unicode
     :param destination: Destination to copy to.
     :type destination: unicode
+    :param atomic: Source is copied to a temporary path renamed over destination,
+        a directory destination must not exist.
+    :type atomic: bool
+    :param durable: Copied file is flushed to disk, see :func:`atomic_replace` definition.
+    :type durable: bool
     :return: Method success.
     :rtype: bool
     """
 
+    path = get_temporary_path(destination) if atomic else destination
     try:
         if os.path.isfile(source):
-            LOGGER.debug("> Copying '{0}' file to '{1}'.".format(source, destination))
-            shutil.copyfile(source, destination)
+            LOGGER.debug("> Copying '{0}' file to '{1}'.".format(source, path))
+            shutil.copyfile(source, path)
         else:
-            LOGGER.debug("> Copying '{0}' directory to '{1}'.".format(source, destination))
-            shutil.copytree(source, destination)
+            LOGGER.debug("> Copying '{0}' directory to '{1}'.".format(source, path))
+            shutil.copytree(source, path)
+
+        if atomic:
+            atomic_replace(path, destination, durable)
+        elif durable and os.path.isfile(path):
+            _fsync(path)
         return True
     except Exception as error:
+        if atomic:
+            remove(path)
         raise foundations.exceptions.PathCopyError(
             "!> {0} | Cannot copy '{1}' path: '{2}'".format(__name__, source, error))
 
 
+def get_temporary_path(path):
+    """
+    Returns a unique temporary path next to given path, suitable for :func:`atomic_replace` definition.
+
+    Usage::
+
+        >>> get_temporary_path("/Users/JohnDoe/file.txt")
+        u'/Users/JohnDoe/.file.txt.3ff2b8a4.tmp'
+
+    :param path: Path.
+    :type path: unicode
+    :return: Temporary path.
+    :rtype: unicode
+    """
+
+    directory, name = os.path.split(os.path.abspath(path))
+    return os.path.join(directory, ".{0}.{1}.tmp".format(name, uuid.uuid4().hex[:8]))
+
+
+def _is_replaceable(path):
+    """
+    Returns if given file can be replaced by :func:`atomic_replace` definition without altering it: its parent
+        directory is writable and its owner and group can be preserved.
+
+    :param path: Path.
+    :type path: unicode
+    :return: Is replaceable.
+    :rtype: bool
+    """
+
+    if not os.access(os.path.dirname(os.path.abspath(path)), os.W_OK | os.X_OK):
+        return False
+
+    if not os.path.isfile(path) or not hasattr(os, "geteuid") or os.geteuid() == 0:
+        return True
+
+    stat = os.stat(path)
+    return stat.st_uid == os.geteuid() and (stat.st_gid == os.getegid() or stat.st_gid in os.getgroups())
+
+
+def _fsync(path):
+    """
+    Flushes given file or directory to disk.
+
+    :param path: Path.
+    :type path: unicode
+    """
+
+    try:
+        descriptor = os.open(path, os.O_RDONLY if os.path.isdir(path) else os.O_RDWR)
+    except OSError:
+        # Directories cannot be opened on Windows.
+        return
+
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+def atomic_replace(source, destination, durable=False):
+    """
+    | Atomically replaces given destination with given source, destination file mode, owner and group are
+        preserved when possible.
+    | Source is expected to be on the same file system than destination, readers and concurrent writers
+        will see either the previous or the new destination, never a partial one.
+
+    Usage::
+
+        >>> path = get_temporary_path("/Users/JohnDoe/file.txt")
+        >>> File(path, [u"Some file content ...\\n"]).write()
+        True
+        >>> atomic_replace(path, "/Users/JohnDoe/file.txt", durable=True)
+        True
+
+    :param source: Source path.
+    :type source: unicode
+    :param destination: Destination path.
+    :type destination: unicode
+    :param durable: Source and destination directory are flushed to disk.
+    :type durable: bool
+    :return: Definition success.
+    :rtype: bool
+    """
+
+    if durable and os.path.isfile(source):
+        _fsync(source)
+
+    if os.path.isfile(destination):
+        shutil.copymode(destination, source)
+        if hasattr(os, "chown"):
+            stat = os.stat(destination)
+            try:
+                os.chown(source, stat.st_uid, stat.st_gid)
+            except OSError:
+                pass
+
+    LOGGER.debug("> Replacing '{0}' path with '{1}' path.".format(destination, source))
+    os.replace(source, destination)
+
+    if durable:
+        _fsync(os.path.dirname(os.path.abspath(destination)))
+    return True
+
+
 @foundations.exceptions.handle_exceptions(foundations.exceptions.PathRemoveError)
 def remove(path):
     """
@@ -400,25 +1432,81 @@ def is_writable(path):
         return False
 
 
-def is_binary_file(file):
+def is_binary_file(file, sample_size=BINARY_SAMPLE_SIZE, threshold=None):
     """
-    Returns if given file is a binary file.
+    | Returns if given file is a binary file.
+    | Only the file head and tail samples of given size are read and searched for a null byte, if a threshold
+        is given, the file is also binary when the share of bytes not in :data:`TEXT_CHARACTERS` exceeds it.
+
+    Usage::
+
+        >>> is_binary_file("/usr/lib/libfreeimage.so")
+        True
+        >>> is_binary_file("file.txt", threshold=0.3)
+        False
 
     :param file: File path.
     :type file: unicode
+    :param sample_size: Head and tail samples size in bytes.
+    :type sample_size: int
+    :param threshold: Non text bytes share above which the file is binary.
+    :type threshold: float
     :return: Is file binary.
     :rtype: bool
     """
 
-    file_handle = open(file, "rb")
-    try:
-        chunk_size = 1024
-        while True:
-            chunk = file_handle.read(chunk_size)
-            if chr(0) in chunk:
-                return True
-            if len(chunk) < chunk_size:
-                break
-    finally:
-        file_handle.close()
+    with open(file, "rb", buffering=0) as file_handle:
+        size = os.fstat(file_handle.fileno()).st_size
+        sample = file_handle.read(sample_size)
+        if size > sample_size:
+            file_handle.seek(max(sample_size, size - sample_size))
+            sample += file_handle.read(sample_size)
+
+    if not sample:
+        return False
+
+    if sample.find(b"\x00") != -1:
+        return True
+
+    if threshold is not None:
+        return len(sample.translate(None, TEXT_CHARACTERS)) / len(sample) > threshold
     return False
+
+
+def classify_binary_files(paths, sample_size=BINARY_SAMPLE_SIZE, threshold=None, workers=None):
+    """
+    | Classifies given files concurrently with :func:`is_binary_file` definition.
+    | Files that cannot be read are classified as **None**.
+
+    Usage::
+
+        >>> classify_binary_files(["file.txt", "/usr/lib/libfreeimage.so", "missing.txt"])
+        OrderedDict([('file.txt', False), ('/usr/lib/libfreeimage.so', True), ('missing.txt', None)])
+
+    :param paths: Files paths.
+    :type paths: iterable
+    :param sample_size: Head and tail samples size in bytes.
+    :type sample_size: int
+    :param threshold: Non text bytes share above which a file is binary.
+    :type threshold: float
+    :param workers: Maximum workers count, defaults to :data:`ASYNC_WORKERS` attribute.
+    :type workers: int
+    :return: Files classification in input order.
+    :rtype: OrderedDict
+    """
+
+    def classify(path):
+        try:
+            return is_binary_file(path, sample_size, threshold)
+        except (IOError, OSError) as error:
+            LOGGER.debug("> Cannot classify '{0}' file: '{1}'.".format(path, error))
+
+    paths = list(OrderedDict.fromkeys(paths))
+    classification = OrderedDict()
+    if not paths:
+        return classification
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(workers or ASYNC_WORKERS, len(paths))) as executor:
+        for path, binary in zip(paths, executor.map(classify, paths)):
+            classification[path] = binary
+    return classification
@@ -18,8 +18,17 @@
 
 
 import base64
+import concurrent.futures
 import datetime
+import functools
+import hashlib
+import io
+import itertools
+import mmap
+import os
+import plistlib
 import re
+import struct
 import sys
 from xml.etree import ElementTree
 
@@ -28,14 +37,17 @@ if sys.version_info[:2] <= (2, 6):
 else:
     from collections import OrderedDict
 
+import foundations.cache
 import foundations.common
 import foundations.data_structures
+import foundations.decorators
 import foundations.exceptions
 import foundations.io
 import foundations.namespace
 import foundations.strings
 import foundations.verbose
 import foundations.walkers
+from foundations.globals.constants import Constants
 
 __author__ = "Thomas Mansencal"
 __copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
@@ -44,10 +56,29 @@ __maintainer__ = "Thomas Mansencal"
 __email__ = "thomas.mansencal@gmail.com"
 __status__ = "Production"
 
-__all__ = ["LOGGER", "AttributeCompound", "SectionsFileParser", "PlistFileParser", "get_attribute_compound"]
+__all__ = ["LOGGER",
+           "AttributeCompound",
+           "CompactAttributeCompound",
+           "SectionsFileParser",
+           "PlistFileParser",
+           "BinaryPlistFileParser",
+           "get_sections_file_tokenizer",
+           "get_binding_pattern",
+           "get_attribute_compound",
+           "get_attribute_compounds",
+           "ATTRIBUTE_COMPOUNDS_CACHE_SIZE",
+           "PARSERS_STATE_ATTRIBUTES",
+           "PATTERN_CHARACTERS",
+           "parse_many"]
 
 LOGGER = foundations.verbose.install_logger()
 
+PARSERS_STATE_ATTRIBUTES = ("sections", "comments", "elements", "parsing_errors")
+
+PATTERN_CHARACTERS = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+ATTRIBUTE_COMPOUNDS_CACHE_SIZE = 4096
+
 
 class AttributeCompound(foundations.data_structures.Structure):
     """
@@ -83,6 +114,97 @@ class AttributeCompound(foundations.data_structures.Structure):
         foundations.data_structures.Structure.__init__(self, **kwargs)
 
 
+class CompactAttributeCompound(object):
+    """
+    | Defines a lightweight read oriented storage object for attributes compounds.
+    | Unlike :class:`AttributeCompound` class, it is not a dictionary and stores its fields into slots,
+        it is returned by :func:`get_attribute_compounds` definition.
+    """
+
+    __slots__ = ("name", "value", "link", "type", "alias")
+
+    def __init__(self, name=None, value=None, link=None, type=None, alias=None):
+        """
+        Initializes the class.
+
+        Usage::
+
+            CompactAttributeCompound(name="showCamerasDialog",
+                                     value="0",
+                                     link="@showCamerasDialog",
+                                     type="Boolean",
+                                     alias="Cameras Selection Dialog")
+
+        :param name: Attribute name.
+        :type name: unicode
+        :param value: Attribute value.
+        :type value: object
+        :param link: Attribute link.
+        :type link: unicode
+        :param type: Attribute type.
+        :type type: unicode
+        :param alias: Attribute alias.
+        :type alias: unicode
+        """
+
+        self.name = name
+        self.value = value
+        self.link = link
+        self.type = type
+        self.alias = alias
+
+    def __getitem__(self, field):
+        """
+        Reimplements the :meth:`object.__getitem__` method.
+
+        :param field: Field name.
+        :type field: unicode
+        :return: Field value.
+        :rtype: object
+        """
+
+        if field not in self.__slots__:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def __eq__(self, other):
+        """
+        Reimplements the :meth:`object.__eq__` method.
+
+        :param other: Other object.
+        :type other: object
+        :return: Objects are equal.
+        :rtype: bool
+        """
+
+        if isinstance(other, CompactAttributeCompound):
+            return all(getattr(self, field) == getattr(other, field) for field in self.__slots__)
+        elif isinstance(other, dict):
+            return all(getattr(self, field) == other.get(field) for field in self.__slots__)
+        return NotImplemented
+
+    def __repr__(self):
+        """
+        Reimplements the :meth:`object.__repr__` method.
+
+        :return: Object representation.
+        :rtype: unicode
+        """
+
+        return "{0}({1})".format(self.__class__.__name__,
+                                 ", ".join("{0}={1!r}".format(field, getattr(self, field)) for field in self.__slots__))
+
+    def as_attribute_compound(self):
+        """
+        Returns the compound as an :class:`AttributeCompound` class instance.
+
+        :return: Attribute compound.
+        :rtype: AttributeCompound
+        """
+
+        return AttributeCompound(**dict((field, getattr(self, field)) for field in self.__slots__))
+
+
 class SectionsFileParser(foundations.io.File):
     """
     Defines methods to parse sections file format files,
@@ -112,7 +234,9 @@ class SectionsFileParser(foundations.io.File):
                  quotation_markers=("\"", "'", "`"),
                  raw_section_content_identifier="__raw__",
                  defaults_section="_defaults",
-                 preserve_order=True):
+                 preserve_order=True,
+                 persistent_cache=None,
+                 mmap=False):
         """
         Initializes the class.
 
@@ -147,11 +271,15 @@ class SectionsFileParser(foundations.io.File):
         :type defaults_section: unicode
         :param preserve_order: Data order is preserved.
         :type preserve_order: bool
+        :param persistent_cache: Persistent cache used to store parsed files.
+        :type persistent_cache: PersistentCache
+        :param mmap: File is memory mapped and its lines decoded while being parsed.
+        :type mmap: bool
         """
 
         LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
 
-        foundations.io.File.__init__(self, file)
+        foundations.io.File.__init__(self, file, mmap=mmap)
 
         # --- Setting class attributes. ---
         self.__splitters = None
@@ -170,6 +298,8 @@ class SectionsFileParser(foundations.io.File):
         self.defaults_section = defaults_section
         self.__preserve_order = None
         self.preserve_order = preserve_order
+        self.__persistent_cache = None
+        self.persistent_cache = persistent_cache
 
         if not preserve_order:
             self.__sections = {}
@@ -179,6 +309,15 @@ class SectionsFileParser(foundations.io.File):
             self.__comments = OrderedDict()
         self.__parsing_errors = []
 
+        self.__lazy_sections = {}
+        self.__lazy_options = None
+        self.__lazy_signature = None
+
+        self.__attributes_indexes = {}
+
+        self.__blocks = {}
+        self.__blocks_options = None
+
     @property
     def splitters(self):
         """
@@ -463,6 +602,7 @@ class SectionsFileParser(foundations.io.File):
         :rtype: OrderedDict or dict
         """
 
+        self.__materialize_sections()
         return self.__sections
 
     @sections.setter
@@ -484,6 +624,8 @@ class SectionsFileParser(foundations.io.File):
                 assert type(element) in (OrderedDict, dict), "'{0}' attribute: '{1}' type is not \
                 'OrderedDict' or 'dict'!".format("sections", key)
         self.__sections = value
+        self.__lazy_sections = {}
+        self.__attributes_indexes = {}
 
     @sections.deleter
     @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
@@ -610,6 +752,42 @@ class SectionsFileParser(foundations.io.File):
         raise foundations.exceptions.ProgrammingError(
             "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "preserve_order"))
 
+    @property
+    def persistent_cache(self):
+        """
+        Property for **self.__persistent_cache** attribute.
+
+        :return: self.__persistent_cache.
+        :rtype: PersistentCache
+        """
+
+        return self.__persistent_cache
+
+    @persistent_cache.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def persistent_cache(self, value):
+        """
+        Setter for **self.__persistent_cache** attribute.
+
+        :param value: Attribute value.
+        :type value: PersistentCache
+        """
+
+        if value is not None:
+            assert type(value) is foundations.cache.PersistentCache, \
+                "'{0}' attribute: '{1}' type is not 'PersistentCache'!".format("persistent_cache", value)
+        self.__persistent_cache = value
+
+    @persistent_cache.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def persistent_cache(self):
+        """
+        Deleter for **self.__persistent_cache** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "persistent_cache"))
+
     def __getitem__(self, section):
         """
         Reimplements the :meth:`object.__getitem__` method.
@@ -620,6 +798,7 @@ class SectionsFileParser(foundations.io.File):
         :rtype: Layout
         """
 
+        self.__materialize_section(section)
         return self.__sections.__getitem__(section)
 
     def __setitem__(self, section, value):
@@ -634,6 +813,8 @@ class SectionsFileParser(foundations.io.File):
         :rtype: Layout
         """
 
+        self.__lazy_sections.pop(section, None)
+        self.__attributes_indexes.pop(section, None)
         return self.__sections.__setitem__(section, value)
 
     def __iter__(self):
@@ -642,9 +823,14 @@ class SectionsFileParser(foundations.io.File):
 
         :return: Layouts iterator.
         :rtype: object
+
+        :note: Lazily parsed sections are materialized one at a time while iterating.
         """
 
-        return iter(self.__sections.items())
+        if not self.__lazy_sections:
+            return iter(self.__sections.items())
+
+        return ((section, self[section]) for section in list(self.__sections))
 
     def __contains__(self, section):
         """
@@ -675,7 +861,9 @@ class SectionsFileParser(foundations.io.File):
               strip_comments=True,
               strip_whitespaces=True,
               strip_quotation_markers=True,
-              raise_parsing_errors=True):
+              raise_parsing_errors=True,
+              stream=False,
+              lazy=False):
         """
         Process the file content and extracts the sections / attributes
             as nested :class:`collections.OrderedDict` dictionaries or dictionaries.
@@ -705,6 +893,16 @@ class SectionsFileParser(foundations.io.File):
             <foundations.parsers.SectionsFileParser object at 0x860323123>
             >>> sections_file_parser.sections["_defaults"]
             OrderedDict([(u'Attribute 1', u'Value A'), (u'Attribute 2', u'Value B')])
+            >>> sections_file_parser = SectionsFileParser()
+            >>> sections_file_parser.parse(stream=iter(content))
+            <foundations.parsers.SectionsFileParser object at 0x860323123>
+            >>> sections_file_parser.content
+            []
+            >>> sections_file_parser = SectionsFileParser("SectionsFile.rc")
+            >>> sections_file_parser.parse(lazy=True)
+            <foundations.parsers.SectionsFileParser object at 0x860323123>
+            >>> sections_file_parser.get_value("Attribute 1", "Section A")
+            u'Value A'
 
         :param raw_sections: Ignored raw sections.
         :type raw_sections: tuple or list
@@ -718,84 +916,575 @@ class SectionsFileParser(foundations.io.File):
         :type strip_quotation_markers: bool
         :param raise_parsing_errors: Raise parsing errors.
         :type raise_parsing_errors: bool
+        :param stream: Lines are lazily read from the file handle instead of being cached into
+            :obj:`SectionsFileParser.content` class property, an iterable of lines can also be given.
+        :type stream: bool or object
+        :param lazy: Only sections offsets are indexed, sections attributes are parsed
+            on first access, file is expected to use an ASCII compatible encoding.
+        :type lazy: bool
+
+        .. note::
+
+            If a :obj:`SectionsFileParser.persistent_cache` class property is set, the file has not been read
+            and nothing has been parsed yet, the sections and comments are retrieved from the persistent cache
+            as long as the file and parsing options are unchanged.
         :return: SectionFileParser instance.
         :rtype: SectionFileParser
         """
 
         LOGGER.debug("> Reading sections from: '{0}'.".format(self.path))
 
-        if not self.content:
-            self.read()
+        if self.__lazy_sections and (not foundations.common.path_exists(self.path) or
+                                     self.__get_stat_signature(self.path) != self.__lazy_signature):
+            LOGGER.debug("> Discarding '{0}' file outdated lazily indexed sections.".format(self.path))
+            self.__lazy_sections = {}
+        self.__materialize_sections()
+        self.__attributes_indexes = {}
+
+        cacheable = self.__persistent_cache is not None and isinstance(stream, bool) and not self.content and \
+                    not self.__sections and not self.__comments and foundations.common.path_exists(self.path)
+        if cacheable:
+            cache_options = self.__get_cache_options(raw_sections, namespaces, strip_comments, strip_whitespaces,
+                                                     strip_quotation_markers)
+            content = self.__persistent_cache.get_content(self.path, cache_options)
+            if content is not None:
+                LOGGER.debug("> Retrieved '{0}' file sections from persistent cache.".format(self.path))
+                self.__sections, self.__comments = content
+                return self
+
+            # The signature is taken before reading so that a file modified meanwhile is not cached as current.
+            try:
+                cache_signature = self.__persistent_cache.get_signature(self.path, cache_options)
+            except OSError:
+                cacheable = False
+
+        if lazy and not self.content and foundations.common.path_exists(self.path):
+            self.__index_sections(raw_sections, namespaces, strip_comments, strip_whitespaces, strip_quotation_markers)
+        elif not isinstance(stream, bool):
+            self.__parse_lines(stream, raw_sections, namespaces, strip_comments, strip_whitespaces,
+                               strip_quotation_markers)
+        elif (stream or self.mmap) and not self.content and foundations.common.path_exists(self.path):
+            LOGGER.debug("> Streaming '{0}' file content.".format(self.path))
+            self.__parse_lines(self.iter_lines(), raw_sections, namespaces, strip_comments, strip_whitespaces,
+                               strip_quotation_markers)
+            self.uncache()
+        else:
+            if not self.content:
+                self.read()
+
+            self.__parse_lines(self.content, raw_sections, namespaces, strip_comments, strip_whitespaces,
+                               strip_quotation_markers)
 
-        attributes = {} if not self.__preserve_order else OrderedDict()
-        section = self.__defaults_section
+        LOGGER.debug("> Sections count: '{0}'.".format(len(self.__sections)))
+        LOGGER.debug("> '{0}' file parsing done!".format(self.path))
+
+        if cacheable and not lazy and not self.__parsing_errors:
+            self.__persistent_cache.set_content(self.path,
+                                                (self.__sections, self.__comments),
+                                                cache_options,
+                                                cache_signature)
+
+        if self.__parsing_errors and raise_parsing_errors:
+            raise foundations.exceptions.FileStructureParsingError(
+                "{0} | '{1}' structure is invalid, parsing exceptions occured!".format(self.__class__.__name__,
+                                                                                       self.path))
+
+        return self
+
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.FileStructureParsingError)
+    def reparse(self,
+                content=None,
+                raw_sections=None,
+                namespaces=True,
+                strip_comments=True,
+                strip_whitespaces=True,
+                strip_quotation_markers=True,
+                raise_parsing_errors=True):
+        """
+        | Incrementally process the file content after it has been changed, replacing the current sections,
+            comments and parsing errors.
+        | The content is split into sections blocks, only the blocks that changed since the previous call
+            are parsed again, the unchanged sections attributes dictionaries are reused.
+        | The first call or a call with different options parses the whole content.
+
+        Usage::
+
+            >>> sections_file_parser = SectionsFileParser()
+            >>> sections_file_parser.reparse(["[Section A]\\n", "Attribute 1 = Value A\\n", \
+"[Section B]\\n", "Attribute 2 = Value B\\n"])
+            <foundations.parsers.SectionsFileParser object at 0x860323123>
+            >>> attributes = sections_file_parser.sections["Section A"]
+            >>> sections_file_parser.reparse(["[Section A]\\n", "Attribute 1 = Value A\\n", \
+"[Section B]\\n", "Attribute 2 = Value C\\n"])
+            <foundations.parsers.SectionsFileParser object at 0x860323123>
+            >>> sections_file_parser.sections["Section A"] is attributes
+            True
+
+        :param content: Content lines to parse, the file is read again if not given.
+        :type content: list
+        :param raw_sections: Ignored raw sections.
+        :type raw_sections: tuple or list
+        :param namespaces: Attributes and comments are namespaced.
+        :type namespaces: bool
+        :param strip_comments: Comments are stripped.
+        :type strip_comments: bool
+        :param strip_whitespaces: Whitespaces are stripped.
+        :type strip_whitespaces: bool
+        :param strip_quotation_markers: Attributes values quotation markers are stripped.
+        :type strip_quotation_markers: bool
+        :param raise_parsing_errors: Raise parsing errors.
+        :type raise_parsing_errors: bool
+        :return: SectionFileParser instance.
+        :rtype: SectionFileParser
+        """
+
+        LOGGER.debug("> Reparsing sections from: '{0}'.".format(self.path))
+
+        if content is None:
+            self.cache()
+            if self.mmap:
+                content = list(self.iter_lines())
+                self.uncache()
+                self.content = content
+        else:
+            self.content = content
+
+        options = (tuple(raw_sections or ()), namespaces, strip_comments, strip_whitespaces, strip_quotation_markers)
+        blocks = self.__blocks if self.__blocks_options == options else {}
+
+        sections = OrderedDict() if self.__preserve_order else dict()
+        comments = OrderedDict() if self.__preserve_order else dict()
+        parsing_errors = []
+        parsed_blocks = {}
+        commentId = 0
+        for section, start, end in self.__get_blocks(self.content, strip_whitespaces):
+            lines = self.content[start:end]
+            digest = hashlib.sha1("".join(lines).encode(Constants.default_codec, Constants.codec_error)).digest()
+            block = parsed_blocks.get(digest) or blocks.get(digest)
+            if block is None:
+                block = self.__parse_block(lines, options)
+            parsed_blocks[digest] = block
+
+            attributes, block_comments, block_parsing_errors = block
+            if attributes is not None:
+                sections[section] = attributes
+
+            for comment_content in block_comments:
+                comment = "{0}{1}".format(self.__comment_marker, commentId)
+                if namespaces:
+                    comment = "{0}{1}{2}".format(section, self.__namespace_splitter, comment)
+                comments[comment] = {"id": commentId, "content": comment_content}
+                commentId += 1
+
+            for line, value in block_parsing_errors:
+                parsing_errors.append(foundations.exceptions.AttributeStructureParsingError(value, start + line))
+
+        LOGGER.debug("> Reparsed '{0}' changed sections blocks out of '{1}'.".format(
+            len(set(parsed_blocks).difference(blocks)), len(parsed_blocks)))
+
+        self.__blocks, self.__blocks_options = parsed_blocks, options
+        self.__sections, self.__comments, self.__parsing_errors = sections, comments, parsing_errors
+        self.__lazy_sections = {}
+        self.__attributes_indexes = dict((section, index) for section, index in self.__attributes_indexes.items()
+                                         if section in sections)
+
+        if self.__parsing_errors and raise_parsing_errors:
+            raise foundations.exceptions.FileStructureParsingError(
+                "{0} | '{1}' structure is invalid, parsing exceptions occured!".format(self.__class__.__name__,
+                                                                                       self.path))
+
+        return self
+
+    def __get_blocks(self, lines, strip_whitespaces):
+        """
+        Splits given lines into sections blocks, a block starts at its section line and ends before the next one.
+
+        :param lines: Lines to split.
+        :type lines: list
+        :param strip_whitespaces: Whitespaces are stripped.
+        :type strip_whitespaces: bool
+        :return: Blocks sections, start and end lines indexes.
+        :rtype: list
+        """
+
+        tokenizer = get_sections_file_tokenizer(tuple(self.__comment_limiters), tuple(self.__splitters))
+
+        blocks = []
+        section, start = self.__defaults_section, 0
+        for i, line in enumerate(lines):
+            if "[" not in line:
+                continue
+
+            search = tokenizer.match(line)
+            if search and search.lastgroup == "section":
+                if i != start:
+                    blocks.append((section, start, i))
+                section = strip_whitespaces and search.group("section").strip() or search.group("section")
+                start = i
+        if start != len(lines):
+            blocks.append((section, start, len(lines)))
+        return blocks
+
+    def __parse_block(self, lines, options):
+        """
+        Parses given section block lines in isolation.
+
+        :param lines: Block lines.
+        :type lines: list
+        :param options: Parsing options.
+        :type options: tuple
+        :return: Block attributes, comments content and parsing errors relative lines and values.
+        :rtype: tuple
+        """
+
+        sections, comments, parsing_errors = self.__sections, self.__comments, self.__parsing_errors
+        self.__sections = OrderedDict() if self.__preserve_order else dict()
+        self.__comments = OrderedDict() if self.__preserve_order else dict()
+        self.__parsing_errors = []
+        try:
+            self.__parse_lines(lines, *options)
+            return (foundations.common.get_first_item(list(self.__sections.values())),
+                    [comment["content"] for comment in self.__comments.values()],
+                    [(error.line, error.value) for error in self.__parsing_errors])
+        finally:
+            self.__sections, self.__comments, self.__parsing_errors = sections, comments, parsing_errors
+
+    def __get_cache_options(self,
+                            raw_sections,
+                            namespaces,
+                            strip_comments,
+                            strip_whitespaces,
+                            strip_quotation_markers):
+        """
+        Returns the options the parsed sections depend on, used as persistent cache key.
+
+        :param raw_sections: Ignored raw sections.
+        :type raw_sections: tuple or list
+        :param namespaces: Attributes and comments are namespaced.
+        :type namespaces: bool
+        :param strip_comments: Comments are stripped.
+        :type strip_comments: bool
+        :param strip_whitespaces: Whitespaces are stripped.
+        :type strip_whitespaces: bool
+        :param strip_quotation_markers: Attributes values quotation markers are stripped.
+        :type strip_quotation_markers: bool
+        :return: Options.
+        :rtype: tuple
+        """
+
+        return (self.__class__.__name__,
+                tuple(self.__splitters),
+                self.__namespace_splitter,
+                tuple(self.__comment_limiters),
+                self.__comment_marker,
+                tuple(self.__quotation_markers),
+                self.__raw_section_content_identifier,
+                self.__defaults_section,
+                self.__preserve_order,
+                tuple(raw_sections or ()),
+                namespaces,
+                strip_comments,
+                strip_whitespaces,
+                strip_quotation_markers)
+
+    def __parse_lines(self,
+                      lines,
+                      raw_sections,
+                      namespaces,
+                      strip_comments,
+                      strip_whitespaces,
+                      strip_quotation_markers,
+                      section=None,
+                      attributes=None,
+                      line_number=0):
+        """
+        Extracts the sections / attributes and comments from given lines.
+
+        :param lines: Lines to parse.
+        :type lines: object
+        :param raw_sections: Ignored raw sections.
+        :type raw_sections: tuple or list
+        :param namespaces: Attributes and comments are namespaced.
+        :type namespaces: bool
+        :param strip_comments: Comments are stripped.
+        :type strip_comments: bool
+        :param strip_whitespaces: Whitespaces are stripped.
+        :type strip_whitespaces: bool
+        :param strip_quotation_markers: Attributes values quotation markers are stripped.
+        :type strip_quotation_markers: bool
+        :param section: Section the lines start into.
+        :type section: unicode
+        :param attributes: Attributes the lines start into.
+        :type attributes: OrderedDict or dict
+        :param line_number: First line number.
+        :type line_number: int
+        :return: Method success.
+        :rtype: bool
+        """
+
+        tokenizer = get_sections_file_tokenizer(tuple(self.__comment_limiters), tuple(self.__splitters))
+        attributes_type = OrderedDict if self.__preserve_order else dict
+        quotation_markers = "".join(self.__quotation_markers)
+        namespace_splitter = self.__namespace_splitter
+        comment_marker = self.__comment_marker
+        sections = self.__sections
+        comments = self.__comments
+
+        attributes = attributes_type() if attributes is None else attributes
+        section = self.__defaults_section if section is None else section
+        namespace = "{0}{1}".format(section, namespace_splitter)
         raw_sections = raw_sections or []
+        raw_content = []
 
         commentId = 0
-        for i, line in enumerate(self.content):
+        for i, line in enumerate(lines, line_number):
+            search = tokenizer.match(line)
+            token = search.lastgroup if search else None
+
             # Comments matching.
-            search = re.search(r"^\s*[{0}](?P<comment>.+)$".format("".join(self.__comment_limiters)), line)
-            if search:
+            if token == "comment":
                 if not strip_comments:
-                    comment = namespaces and foundations.namespace.set_namespace(section, "{0}{1}".format(
-                        self.__comment_marker, commentId), self.__namespace_splitter) or \
-                              "{0}{1}".format(self.__comment_marker, commentId)
-                    self.__comments[comment] = {"id": commentId, "content": strip_whitespaces and
-                                                                            search.group(
-                                                                                "comment").strip() or search.group(
-                        "comment")}
+                    comment = "{0}{1}".format(comment_marker, commentId)
+                    if namespaces:
+                        comment = "{0}{1}".format(namespace, comment)
+                    content = search.group("comment")
+                    comments[comment] = {"id": commentId, "content": strip_whitespaces and content.strip() or content}
                     commentId += 1
                 continue
 
             # Sections matching.
-            search = re.search(r"^\s*\[(?P<section>.+)\]\s*$", line)
-            if search:
+            if token == "section":
                 section = strip_whitespaces and search.group("section").strip() or search.group("section")
-                if not self.__preserve_order:
-                    attributes = {}
-                else:
-                    attributes = OrderedDict()
-                rawContent = []
+                namespace = "{0}{1}".format(section, namespace_splitter)
+                attributes = attributes_type()
+                raw_content = []
                 continue
 
             if section in raw_sections:
-                rawContent.append(line)
-                attributes[self.__raw_section_content_identifier] = rawContent
+                raw_content.append(line)
+                attributes[self.__raw_section_content_identifier] = raw_content
             else:
                 # Empty line matching.
-                search = re.search(r"^\s*$", line)
-                if search:
+                if token == "empty":
                     continue
 
                 # Attributes matching.
-                search = re.search(r"^(?P<attribute>.+?)[{0}](?P<value>.+)$".format("".join(self.__splitters)), line) \
-                    or re.search(r"^(?P<attribute>.+?)[{0}]\s*$".format("".join(self.__splitters)), line)
-                if search:
+                if token is not None:
                     attribute = search.group("attribute").strip() if strip_whitespaces else search.group("attribute")
-                    attribute = foundations.namespace.set_namespace(section, attribute, self.__namespace_splitter) \
-                        if namespaces else attribute
+                    if namespaces:
+                        attribute = "{0}{1}".format(namespace, attribute)
 
-                    if len(search.groups()) == 2:
+                    if token == "value":
                         value = search.group("value").strip() if strip_whitespaces else search.group("value")
-                        attributes[attribute] = value.strip("".join(self.__quotation_markers)) \
-                            if strip_quotation_markers else value
+                        attributes[attribute] = value.strip(quotation_markers) if strip_quotation_markers else value
                     else:
                         attributes[attribute] = None
                 else:
                     self.__parsing_errors.append(foundations.exceptions.AttributeStructureParsingError(
                         "Attribute structure is invalid: {0}".format(line), i + 1))
 
-            self.__sections[section] = attributes
+            sections[section] = attributes
 
-        LOGGER.debug("> Sections: '{0}'.".format(self.__sections))
-        LOGGER.debug("> '{0}' file parsing done!".format(self.path))
+        return True
 
-        if self.__parsing_errors and raise_parsing_errors:
-            raise foundations.exceptions.FileStructureParsingError(
-                "{0} | '{1}' structure is invalid, parsing exceptions occured!".format(self.__class__.__name__,
-                                                                                       self.path))
+    def __index_sections(self,
+                         raw_sections,
+                         namespaces,
+                         strip_comments,
+                         strip_whitespaces,
+                         strip_quotation_markers):
+        """
+        Indexes the file sections bytes offsets without parsing their attributes,
+            comments are extracted during indexing.
 
-        return self
+        :param raw_sections: Ignored raw sections.
+        :type raw_sections: tuple or list
+        :param namespaces: Attributes and comments are namespaced.
+        :type namespaces: bool
+        :param strip_comments: Comments are stripped.
+        :type strip_comments: bool
+        :param strip_whitespaces: Whitespaces are stripped.
+        :type strip_whitespaces: bool
+        :param strip_quotation_markers: Attributes values quotation markers are stripped.
+        :type strip_quotation_markers: bool
+        :return: Method success.
+        :rtype: bool
+        """
+
+        LOGGER.debug("> Indexing '{0}' file sections.".format(self.path))
+
+        tokenizer = get_sections_file_tokenizer(tuple(self.__comment_limiters), tuple(self.__splitters))
+        attributes_type = OrderedDict if self.__preserve_order else dict
+        namespace_splitter = self.__namespace_splitter
+        comment_marker = self.__comment_marker
+        sections = self.__sections
+        comments = self.__comments
+
+        self.__lazy_options = (raw_sections, namespaces, strip_whitespaces, strip_quotation_markers)
+
+        section = self.__defaults_section
+        namespace = "{0}{1}".format(section, namespace_splitter)
+        raw_sections = raw_sections or []
+        start = offset = line_number = 0
+        has_content = False
+
+        commentId = 0
+        with open(self.path, "rb") as file:
+            self.__lazy_signature = self.__get_stat_signature(file)
+            for i, line in enumerate(file):
+                # Only section lines can change the current section once it has content.
+                if has_content and strip_comments and b"[" not in line:
+                    offset += len(line)
+                    continue
+
+                text = line.decode(Constants.default_codec, Constants.codec_error)
+                search = tokenizer.match(text)
+                token = search.lastgroup if search else None
+                if token == "comment":
+                    if not strip_comments:
+                        comment = "{0}{1}".format(comment_marker, commentId)
+                        if namespaces:
+                            comment = "{0}{1}".format(namespace, comment)
+                        content = search.group("comment")
+                        comments[comment] = {"id": commentId,
+                                             "content": strip_whitespaces and content.strip() or content}
+                        commentId += 1
+                elif token == "section":
+                    if has_content:
+                        self.__lazy_sections[section] = (start, offset, line_number)
+                    section = strip_whitespaces and search.group("section").strip() or search.group("section")
+                    namespace = "{0}{1}".format(section, namespace_splitter)
+                    start, line_number = offset + len(line), i + 1
+                    has_content = False
+                elif not has_content and (token != "empty" or section in raw_sections):
+                    sections[section] = attributes_type()
+                    has_content = True
+                offset += len(line)
+
+        if has_content:
+            self.__lazy_sections[section] = (start, offset, line_number)
+
+        return True
+
+    @staticmethod
+    def __get_stat_signature(file):
+        """
+        Returns given file stat signature used to detect lazily indexed files modifications.
+
+        :param file: File object or path.
+        :type file: object or unicode
+        :return: File size and modification time.
+        :rtype: tuple
+        """
+
+        stat = os.fstat(file.fileno()) if hasattr(file, "fileno") else os.stat(file)
+        return stat.st_size, stat.st_mtime_ns
+
+    def __materialize_section(self, section):
+        """
+        Parses given lazily indexed section attributes.
+
+        :param section: Section to materialize.
+        :type section: unicode
+        :return: Section has been materialized.
+        :rtype: bool
+        """
+
+        if not self.__lazy_sections or section not in self.__lazy_sections:
+            return False
+
+        LOGGER.debug("> Materializing '{0}' section.".format(section))
+
+        with open(self.path, "rb") as file:
+            if self.__get_stat_signature(file) != self.__lazy_signature:
+                raise foundations.exceptions.FileStructureParsingError(
+                    "{0} | '{1}' file has been modified since it has been lazily parsed!".format(
+                        self.__class__.__name__, self.path))
+
+            start, end, line_number = self.__lazy_sections.pop(section)
+            file.seek(start)
+            lines = [line.decode(Constants.default_codec, Constants.codec_error)
+                     for line in io.BytesIO(file.read(end - start))]
+
+        raw_sections, namespaces, strip_whitespaces, strip_quotation_markers = self.__lazy_options
+        return self.__parse_lines(lines,
+                                  raw_sections,
+                                  namespaces,
+                                  True,
+                                  strip_whitespaces,
+                                  strip_quotation_markers,
+                                  section=section,
+                                  attributes=self.__sections[section],
+                                  line_number=line_number)
+
+    def __materialize_sections(self):
+        """
+        Parses all the lazily indexed sections attributes.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        for section in list(self.__lazy_sections):
+            self.__materialize_section(section)
+        return True
+
+    def __get_attributes_index(self, section, rebuild=False):
+        """
+        Returns given section attributes index, mapping the attributes with their root namespace stripped
+            to the attributes.
+
+        | The index is built on first access and updated by :meth:`SectionsFileParser.set_value` method.
+        | It is rebuilt when given rebuild or when the section attributes have been replaced, or modified in place
+            so that their count or last attribute changed: added attributes are always last.
+
+        :param section: Section.
+        :type section: unicode
+        :param rebuild: Index is rebuilt.
+        :type rebuild: bool
+        :return: Attributes index.
+        :rtype: dict
+        """
+
+        attributes = self.__sections.get(section)
+        if attributes is None:
+            return {}
+
+        index = self.__attributes_indexes.get(section)
+        if rebuild or index is None or index[0] is not attributes or \
+                index[1:3] != (len(attributes), next(reversed(attributes), None)):
+            keys = {}
+            for attribute in attributes:
+                keys.setdefault(_remove_root_namespace(attribute), attribute)
+            index = self.__attributes_indexes[section] = (attributes,
+                                                          len(attributes),
+                                                          next(reversed(attributes), None),
+                                                          keys)
+        return index[3]
+
+    def __get_attribute_key(self, attribute, section):
+        """
+        | Returns given section attribute key, the attribute with or without its root namespace.
+        | A miss on a current index is a plain miss, a resolved key removed from the attributes in place rebuilds
+            the index before concluding.
+
+        :param attribute: Attribute.
+        :type attribute: unicode
+        :param section: Section.
+        :type section: unicode
+        :return: Attribute key or None if the attribute doesn't exists.
+        :rtype: unicode
+        """
+
+        attributes = self.__sections.get(section)
+        if attributes is None:
+            return
+
+        name = _remove_root_namespace(attribute)
+        key = self.__get_attributes_index(section).get(name)
+        if key is not None and key not in attributes:
+            key = self.__get_attributes_index(section, rebuild=True).get(name)
+        return key
 
     def section_exists(self, section):
         """
@@ -852,8 +1541,8 @@ class SectionsFileParser(foundations.io.File):
         :rtype: bool
         """
 
-        if foundations.namespace.remove_namespace(attribute, root_only=True) in self.get_attributes(section,
-                                                                                                    strip_namespaces=True):
+        self.__materialize_section(section)
+        if self.__get_attribute_key(attribute, section) is not None:
             LOGGER.debug("> '{0}' attribute exists in '{1}' section.".format(attribute, section))
             return True
         else:
@@ -895,6 +1584,8 @@ class SectionsFileParser(foundations.io.File):
         if not self.section_exists(section):
             return attributes
 
+        self.__materialize_section(section)
+
         if strip_namespaces:
             for attribute, value in self.__sections[section].items():
                 attributes[foundations.namespace.remove_namespace(attribute, root_only=True)] = value
@@ -927,6 +1618,7 @@ class SectionsFileParser(foundations.io.File):
 
         all_attributes = OrderedDict() if self.__preserve_order else dict()
 
+        self.__materialize_sections()
         for attributes in self.__sections.values():
             for attribute, value in attributes.items():
                 all_attributes[attribute] = value
@@ -958,13 +1650,20 @@ class SectionsFileParser(foundations.io.File):
         :rtype: unicode
         """
 
-        if not self.attribute_exists(attribute, section):
+        self.__materialize_section(section)
+        attributes = self.__sections.get(section)
+        if attributes is None:
             return default
 
-        if attribute in self.__sections[section]:
-            value = self.__sections[section][attribute]
-        elif foundations.namespace.set_namespace(section, attribute) in self.__sections[section]:
-            value = self.__sections[section][foundations.namespace.set_namespace(section, attribute)]
+        if attribute in attributes:
+            value = attributes[attribute]
+        else:
+            key = self.__get_attribute_key(attribute, section)
+            if key is None:
+                return default
+
+            namespaced_attribute = "{0}{1}{2}".format(section, foundations.namespace.NAMESPACE_SPLITTER, attribute)
+            value = attributes[namespaced_attribute] if namespaced_attribute in attributes else attributes[key]
         LOGGER.debug("> Attribute: '{0}', value: '{1}'.".format(attribute, value))
         return value
 
@@ -997,7 +1696,21 @@ class SectionsFileParser(foundations.io.File):
             LOGGER.debug("> Adding '{0}' section.".format(section))
             self.__sections[section] = OrderedDict() if self.__preserve_order else dict()
 
-        self.__sections[section][attribute] = value
+        self.__materialize_section(section)
+
+        attributes = self.__sections[section]
+        index = self.__attributes_indexes.get(section)
+        if index is not None and index[0] is attributes and \
+                index[1:3] == (len(attributes), next(reversed(attributes), None)):
+            if attribute not in attributes:
+                index[3].setdefault(_remove_root_namespace(attribute), attribute)
+            attributes[attribute] = value
+            self.__attributes_indexes[section] = (attributes,
+                                                  len(attributes),
+                                                  next(reversed(attributes), None),
+                                                  index[3])
+        else:
+            attributes[attribute] = value
 
         return True
 
@@ -1006,7 +1719,8 @@ class SectionsFileParser(foundations.io.File):
               splitter="=",
               comment_limiter=(";"),
               spaces_around_splitter=True,
-              space_after_comment_limiter=True):
+              space_after_comment_limiter=True,
+              durable=False):
         """
         Writes defined file using :obj:`SectionsFileParser.sections` and
             :obj:`SectionsFileParser.comments` class properties content.
@@ -1032,11 +1746,14 @@ class SectionsFileParser(foundations.io.File):
         :type spaces_around_splitter: bool
         :param space_after_comment_limiter: Space after comments limiter.
         :type space_after_comment_limiter: bool
+        :param durable: File is flushed to disk, see :meth:`foundations.io.File.write` method.
+        :type durable: bool
         :return: Method success.
         :rtype: bool
         """
 
         self.uncache()
+        self.__materialize_sections()
 
         LOGGER.debug("> Setting '{0}' file content.".format(self.path))
         attribute_template = "{{0}} {0} {{1}}\n".format(splitter) if spaces_around_splitter else \
@@ -1044,57 +1761,53 @@ class SectionsFileParser(foundations.io.File):
         attribute_template = foundations.strings.replace(attribute_template, {"{{": "{", "}}": "}"})
         comment_template = space_after_comment_limiter and "{0} {{0}}\n".format(comment_limiter) or \
                            "{0}{{0}}\n".format(comment_limiter)
+        namespace_splitter = self.__namespace_splitter
+        raw_section_content_identifier = self.__raw_section_content_identifier
+
+        sections_comments = {}
+        for comment, value in self.__comments.items():
+            sections_comments.setdefault(comment.rpartition(namespace_splitter)[0], []).append(
+                comment_template.format(value["content"] or ""))
+
+        lines = []
         if self.__defaults_section in self.__sections:
             LOGGER.debug("> Appending '{0}' default section.".format(self.__defaults_section))
-            if self.__comments:
-                for comment, value in self.__comments.items():
-                    if self.__defaults_section in comment:
-                        value = value["content"] or ""
-                        LOGGER.debug("> Appending '{0}' comment with '{1}' value.".format(comment, value))
-                        self.content.append(comment_template.format(value))
+            lines.extend(sections_comments.get(self.__defaults_section, ()))
             for attribute, value in self.__sections[self.__defaults_section].items():
-                attribute = namespaces and attribute or foundations.namespace.remove_namespace(attribute,
-                                                                                               self.__namespace_splitter,
-                                                                                               root_only=True)
-                value = value or ""
-                LOGGER.debug("> Appending '{0}' attribute with '{1}' value.".format(attribute, value))
-                self.content.append(attribute_template.format(attribute, value))
-            self.content.append("\n")
-
-        for i, section in enumerate(self.__sections):
-            LOGGER.debug("> Appending '{0}' section.".format(section))
-            self.content.append("[{0}]\n".format(section))
-            if self.__comments:
-                for comment, value in self.__comments.items():
-                    if section in comment:
-                        value = value["content"] or ""
-                        LOGGER.debug("> Appending '{0}' comment with '{1}' value.".format(comment, value))
-                        self.content.append(comment_template.format(value))
-            for attribute, value in self.__sections[section].items():
-                if foundations.namespace.remove_namespace(attribute) == self.__raw_section_content_identifier:
-                    LOGGER.debug("> Appending '{0}' raw section content.".format(section))
-                    for line in value:
-                        self.content.append(line)
+                if not namespaces:
+                    attribute = _remove_root_namespace(attribute, namespace_splitter)
+                lines.append(attribute_template.format(attribute, value or ""))
+            lines.append("\n")
+
+        for section, attributes in self.__sections.items():
+            lines.append("[{0}]\n".format(section))
+            lines.extend(sections_comments.get(section, ()))
+            for attribute, value in attributes.items():
+                if attribute.rpartition(foundations.namespace.NAMESPACE_SPLITTER)[2] == \
+                        raw_section_content_identifier:
+                    lines.extend(value)
                 else:
-                    LOGGER.debug("> Appending '{0}' section.".format(section))
-                    attribute = namespaces and attribute or foundations.namespace.remove_namespace(attribute,
-                                                                                                   self.__namespace_splitter,
-                                                                                                   root_only=True)
-                    value = value or ""
-                    LOGGER.debug("> Appending '{0}' attribute with '{1}' value.".format(attribute, value))
-                    self.content.append(attribute_template.format(attribute, value))
-            if i != len(self.__sections) - 1:
-                self.content.append("\n")
-        foundations.io.File.write(self)
+                    if not namespaces:
+                        attribute = _remove_root_namespace(attribute, namespace_splitter)
+                    lines.append(attribute_template.format(attribute, value or ""))
+            lines.append("\n")
+        if self.__sections:
+            lines.pop()
+
+        LOGGER.debug("> Writing '{0}' sections into '{1}' lines.".format(len(self.__sections), len(lines)))
+        self.content = lines
+        foundations.io.File.write(self, atomic=True, durable=durable)
         return True
 
 
 class PlistFileParser(foundations.io.File):
     """
-    Defines methods to parse plist files.
+    | Defines methods to parse plist files.
+    | The elements are indexed on first lookup: values replaced or elements removed in place are detected, elements
+        added in place are only found once the :attr:`PlistFileParser.elements` attribute has been reassigned.
     """
 
-    def __init__(self, file=None):
+    def __init__(self, file=None, persistent_cache=None):
         """
         Initializes the class.
 
@@ -1110,6 +1823,8 @@ class PlistFileParser(foundations.io.File):
 
         :param file: Current file path.
         :type file: unicode
+        :param persistent_cache: Persistent cache used to store parsed files.
+        :type persistent_cache: PersistentCache
         """
 
         LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
@@ -1119,12 +1834,18 @@ class PlistFileParser(foundations.io.File):
         # --- Setting class attributes. ---
         self.__elements = None
         self.__parsing_errors = None
+        self.__persistent_cache = None
+        self.persistent_cache = persistent_cache
+
+        self.__leaves = None
+        self.__leaves_index = None
 
         self.__unserializers = {"array": lambda x: [value.text for value in x],
                                 "dict": lambda x: dict((x[i].text, x[i + 1].text) for i in range(0, len(x), 2)),
-                                "key": lambda x: foundations.strings.to_string(x.text) or "",
-                                "string": lambda x: foundations.strings.to_string(x.text) or "",
-                                "data": lambda x: base64.decodestring(x.text or ""),
+                                "key": lambda x: x.text or "",
+                                "string": lambda x: x.text or "",
+                                "data": lambda x: base64.b64decode(x.text or "").decode(Constants.default_codec,
+                                                                                        Constants.codec_error),
                                 "date": lambda x: datetime.datetime(*list(map(int, re.findall("\d+", x.text)))),
                                 "true": lambda x: True,
                                 "false": lambda x: False,
@@ -1155,6 +1876,7 @@ class PlistFileParser(foundations.io.File):
         if value is not None:
             assert type(value) is dict, "'{0}' attribute: '{1}' type is not  dict'!".format("elements", value)
         self.__elements = value
+        self.__leaves = self.__leaves_index = None
 
     @elements.deleter
     @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
@@ -1239,6 +1961,42 @@ class PlistFileParser(foundations.io.File):
         raise foundations.exceptions.ProgrammingError(
             "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "unserializers"))
 
+    @property
+    def persistent_cache(self):
+        """
+        Property for **self.__persistent_cache** attribute.
+
+        :return: self.__persistent_cache.
+        :rtype: PersistentCache
+        """
+
+        return self.__persistent_cache
+
+    @persistent_cache.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def persistent_cache(self, value):
+        """
+        Setter for **self.__persistent_cache** attribute.
+
+        :param value: Attribute value.
+        :type value: PersistentCache
+        """
+
+        if value is not None:
+            assert type(value) is foundations.cache.PersistentCache, \
+                "'{0}' attribute: '{1}' type is not 'PersistentCache'!".format("persistent_cache", value)
+        self.__persistent_cache = value
+
+    @persistent_cache.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def persistent_cache(self):
+        """
+        Deleter for **self.__persistent_cache** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "persistent_cache"))
+
     @foundations.exceptions.handle_exceptions(foundations.exceptions.FileStructureParsingError)
     def parse(self, raise_parsing_errors=True):
         """
@@ -1260,6 +2018,23 @@ class PlistFileParser(foundations.io.File):
 
         LOGGER.debug("> Reading elements from: '{0}'.".format(self.path))
 
+        cache_options = (self.__class__.__name__, tuple(sorted(self.__unserializers)))
+        cache_signature = None
+        if self.__persistent_cache is not None:
+            elements = self.__persistent_cache.get_content(self.path, cache_options)
+            if elements is not None:
+                LOGGER.debug("> Retrieved '{0}' file elements from persistent cache.".format(self.path))
+                self.__parsing_errors = []
+                self.__elements = elements
+                self.__index_elements()
+                return True
+
+            # The signature is taken before reading so that a file modified meanwhile is not cached as current.
+            try:
+                cache_signature = self.__persistent_cache.get_signature(self.path, cache_options)
+            except OSError:
+                pass
+
         element_tree_parser = ElementTree.iterparse(self.path)
 
         self.__parsing_errors = []
@@ -1280,8 +2055,84 @@ class PlistFileParser(foundations.io.File):
                                                                                            self.path))
         else:
             self.__elements = foundations.common.get_first_item(element_tree_parser.root).text
+            self.__index_elements()
+            if cache_signature is not None:
+                self.__persistent_cache.set_content(self.path, self.__elements, cache_options, cache_signature)
             return True
 
+    def iter_elements(self, predicate=None):
+        """
+        | Defines a generator used to stream the file elements as they are parsed.
+        | Elements are yielded as they complete with the same path, key, value tuples than
+            :func:`foundations.walkers.dictionaries_walker` definition, consumed elements are removed from the
+            tree so that memory usage stays bounded, arrays are yielded once complete.
+        | The file is closed and parsing stops as soon as the generator is closed, i.e. when breaking out of
+            the iteration.
+
+        Usage::
+
+            >>> plist_file_parser = PlistFileParser("standard.plist")
+            >>> for path, key, value in plist_file_parser.iter_elements(lambda path, key, value: key == "String A"):
+            ...     print(value)
+            ...     break
+            ...
+            My Value A
+
+        :param predicate: Predicate called with the path, key and value, only matching elements are yielded.
+        :type predicate: object
+        :return: Path, key, value.
+        :rtype: tuple
+        """
+
+        LOGGER.debug("> Streaming elements from: '{0}'.".format(self.path))
+
+        unserializers = self.__unserializers
+        frames = []
+        arrays = 0
+        with open(self.path, "rb") as file:
+            for event, element in ElementTree.iterparse(file, events=("start", "end")):
+                if event == "start":
+                    if element.tag == "array":
+                        arrays += 1
+                    name = frames[-1][2] if frames and frames[-1][0].tag == "dict" else None
+                    frames.append([element, name, None])
+                    continue
+
+                frames.pop()
+                tag = element.tag
+                if tag == "array":
+                    arrays -= 1
+
+                unmarshal = unserializers.get(tag)
+                if unmarshal is None:
+                    if tag != "plist":
+                        raise foundations.exceptions.FileStructureParsingError(
+                            "{0} | '{1}' structure is invalid, unknown element: {2}".format(self.__class__.__name__,
+                                                                                           self.path, tag))
+                    continue
+
+                if arrays or not frames:
+                    data = unmarshal(element)
+                    element.clear()
+                    element.text = data
+                    continue
+
+                parent = frames[-1][0]
+                if tag == "key":
+                    frames[-1][2] = unmarshal(element)
+                    parent.remove(element)
+                elif tag == "dict" and parent.tag == "dict":
+                    parent.remove(element)
+                elif tag != "dict":
+                    value = unmarshal(element)
+                    if parent.tag == "dict":
+                        path, key = tuple(frame[1] for frame in frames[2:]), frames[-1][2]
+                        parent.remove(element)
+                    else:
+                        path, key = (), None
+                    if predicate is None or predicate(path, key, value):
+                        yield path, key, value
+
     def element_exists(self, element):
         """
         Checks if given element exists.
@@ -1305,11 +2156,9 @@ class PlistFileParser(foundations.io.File):
         if not self.__elements:
             return False
 
-        for item in foundations.walkers.dictionaries_walker(self.__elements):
-            path, key, value = item
-            if key == element:
-                LOGGER.debug("> '{0}' attribute exists.".format(element))
-                return True
+        if self.__get_leaves(lambda index: (element,)):
+            LOGGER.debug("> '{0}' attribute exists.".format(element))
+            return True
 
         LOGGER.debug("> '{0}' element doesn't exists.".format(element))
         return False
@@ -1342,10 +2191,9 @@ class PlistFileParser(foundations.io.File):
         if not self.__elements:
             return values
 
-        for item in foundations.walkers.dictionaries_walker(self.__elements):
-            path, element, value = item
-            if re.search(pattern, element, flags):
-                values.append(value)
+        search = re.compile(pattern, flags).search
+        for path, element, value in self.__get_leaves(lambda index: [element for element in index if search(element)]):
+            values.append(value)
         return values
 
     def get_value(self, element):
@@ -1370,9 +2218,764 @@ class PlistFileParser(foundations.io.File):
         if not self.__elements:
             return
 
+        if not PATTERN_CHARACTERS.search(element):
+            leaves = self.__get_leaves(lambda index: (element,))
+            return leaves[0][2] if leaves else None
+
         values = self.filter_values(r"^{0}$".format(element))
         return foundations.common.get_first_item(values)
 
+    def get_paths(self, element):
+        """
+        Returns the given element paths, the keys of the dictionaries containing the element.
+
+        Usage::
+
+            >>> plist_file_parser = PlistFileParser("standard.plist")
+            >>> plist_file_parser.parse()
+            True
+            >>> plist_file_parser.get_paths("String B")
+            [(u'Dictionary A',)]
+
+        :param element: Element to get the paths.
+        :type element: unicode
+        :return: Element paths.
+        :rtype: list
+        """
+
+        if not self.__elements:
+            return []
+
+        return [path for path, element, value in self.__get_leaves(lambda index: (element,))]
+
+    def __index_elements(self):
+        """
+        Indexes the elements leaves, walked with :func:`foundations.walkers.dictionaries_walker` definition,
+            by element name so that lookups don't walk the elements again.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        LOGGER.debug("> Indexing '{0}' file elements.".format(self.path))
+
+        self.__leaves = list(foundations.walkers.dictionaries_walker(self.__elements or {}))
+        self.__leaves_index = OrderedDict()
+        for i, (path, element, value) in enumerate(self.__leaves):
+            self.__leaves_index.setdefault(element, []).append(i)
+        return True
+
+    def __get_leaves_index(self):
+        """
+        Returns the elements leaves index, indexing the elements if needed.
+
+        :return: Leaves index.
+        :rtype: OrderedDict
+        """
+
+        if self.__leaves_index is None:
+            self.__index_elements()
+        return self.__leaves_index
+
+    def __get_leaves(self, elements):
+        """
+        | Returns the leaves of the elements selected by given definition, in elements walk order.
+        | The leaves values are read from the elements so that values replaced in place are current, the elements are
+            indexed again if a leaf has been removed in place.
+
+        :param elements: Definition returning the selected elements from the leaves index.
+        :type elements: object
+        :return: Leaves as path, element, value tuples.
+        :rtype: list
+        """
+
+        for attempt in range(2):
+            leaves_index = self.__get_leaves_index()
+            indexes = sorted(index for element in elements(leaves_index) for index in leaves_index.get(element, ()))
+            leaves = []
+            for index in indexes:
+                path, element = self.__leaves[index][:2]
+                try:
+                    container = self.__elements
+                    for key in path:
+                        container = container[key]
+                    value = container[element]
+                except (KeyError, TypeError):
+                    break
+
+                if isinstance(value, dict):
+                    break
+                leaves.append((path, element, value))
+            else:
+                return leaves
+
+            LOGGER.debug("> '{0}' file elements have been modified in place, indexing them again.".format(self.path))
+            self.__leaves_index = None
+        return leaves
+
+
+class BinaryPlistFileParser(foundations.io.File):
+    """
+    | Defines methods to parse and write binary plist files.
+    | The file is memory mapped and objects are only decoded when accessed: the trailer and offset table are
+        read by :meth:`BinaryPlistFileParser.parse` method, :meth:`BinaryPlistFileParser.get_value`,
+        :meth:`BinaryPlistFileParser.element_exists` and :meth:`BinaryPlistFileParser.filter_values` methods
+        only decode the dictionaries keys and the requested values.
+    """
+
+    header = b"bplist00"
+    """
+    :param header: Binary plist files header.
+    :type header: bytes
+    """
+
+    epoch = datetime.datetime(2001, 1, 1)
+    """
+    :param epoch: Binary plist dates epoch.
+    :type epoch: datetime.datetime
+    """
+
+    def __init__(self, file=None):
+        """
+        Initializes the class.
+
+        Usage::
+
+            >>> binary_plist_file_parser = BinaryPlistFileParser("standard.bplist")
+            >>> binary_plist_file_parser.parse()
+            True
+            >>> binary_plist_file_parser.get_value("String A")
+            u'My Value A'
+
+        :param file: Current file path.
+        :type file: unicode
+        """
+
+        LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+        foundations.io.File.__init__(self, file)
+
+        # --- Setting class attributes. ---
+        self.__elements = None
+        self.__parsing_errors = None
+
+        self.__buffer = None
+        self.__offset_size = None
+        self.__reference_size = None
+        self.__objects_count = None
+        self.__top_object = None
+        self.__offset_table_offset = None
+
+    @property
+    def elements(self):
+        """
+        Property for **self.__elements** attribute, the whole file objects are decoded on first access.
+
+        :return: self.__elements.
+        :rtype: dict
+        """
+
+        if self.__elements is None and self.__buffer is not None:
+            self.__elements = self.__decode(self.__top_object)
+        return self.__elements
+
+    @elements.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def elements(self, value):
+        """
+        Setter for **self.__elements** attribute.
+
+        :param value: Attribute value.
+        :type value: dict
+        """
+
+        if value is not None:
+            assert type(value) is dict, "'{0}' attribute: '{1}' type is not 'dict'!".format("elements", value)
+        self.__elements = value
+        self.close()
+
+    @elements.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def elements(self):
+        """
+        Deleter for **self.__elements** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "elements"))
+
+    @property
+    def parsing_errors(self):
+        """
+        Property for **self.__parsing_errors** attribute.
+
+        :return: self.__parsing_errors.
+        :rtype: list
+        """
+
+        return self.__parsing_errors
+
+    @parsing_errors.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def parsing_errors(self, value):
+        """
+        Setter for **self.__parsing_errors** attribute.
+
+        :param value: Attribute value.
+        :type value: list
+        """
+
+        if value is not None:
+            assert type(value) is list, "'{0}' attribute: '{1}' type is not 'list'!".format("parsing_errors", value)
+            for element in value:
+                assert issubclass(element.__class__, foundations.exceptions.AbstractParsingError), \
+                    "'{0}' attribute: '{1}' is not a '{2}' subclass!".format(
+                        "parsing_errors", element, foundations.exceptions.AbstractParsingError.__class__.__name__)
+        self.__parsing_errors = value
+
+    @parsing_errors.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def parsing_errors(self):
+        """
+        Deleter for **self.__parsing_errors** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "parsing_errors"))
+
+    def __enter__(self):
+        """
+        Reimplements the :meth:`object.__enter__` method.
+
+        :return: Object.
+        :rtype: BinaryPlistFileParser
+        """
+
+        return self
+
+    def __exit__(self, *args):
+        """
+        Reimplements the :meth:`object.__exit__` method, closing the memory mapped file.
+
+        :param \*args: Arguments.
+        :type \*args: \*
+        """
+
+        self.close()
+
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.FileStructureParsingError)
+    def parse(self, raise_parsing_errors=True):
+        """
+        Memory maps the file and reads its trailer and offset table, objects are decoded on access.
+
+        Usage::
+
+            >>> binary_plist_file_parser = BinaryPlistFileParser("standard.bplist")
+            >>> binary_plist_file_parser.parse()
+            True
+
+        :param raise_parsing_errors: Raise parsing errors.
+        :type raise_parsing_errors: bool
+        :return: Method success.
+        :rtype: bool
+        """
+
+        LOGGER.debug("> Mapping elements from: '{0}'.".format(self.path))
+
+        self.close()
+        self.__elements = None
+        self.__parsing_errors = []
+
+        with open(self.path, "rb") as file:
+            try:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                buffer = b""
+
+        if len(buffer) < len(self.header) + 32 or buffer[:len(self.header)] != self.header:
+            self.__parsing_errors.append(foundations.exceptions.FileStructureParsingError(
+                "Invalid binary plist header or trailer!"))
+        else:
+            self.__offset_size, self.__reference_size, self.__objects_count, self.__top_object, \
+            self.__offset_table_offset = struct.unpack(">6xBBQQQ", buffer[-32:])
+            if not 1 <= self.__offset_size <= 8 or not 1 <= self.__reference_size <= 8 or \
+                    self.__offset_table_offset < len(self.header) or \
+                    self.__offset_table_offset + self.__objects_count * self.__offset_size > len(buffer) - 32 or \
+                    self.__top_object >= self.__objects_count:
+                self.__parsing_errors.append(foundations.exceptions.FileStructureParsingError(
+                    "Invalid binary plist offset table!"))
+
+        if self.__parsing_errors:
+            if isinstance(buffer, mmap.mmap):
+                buffer.close()
+            if raise_parsing_errors:
+                raise foundations.exceptions.FileStructureParsingError(
+                    "{0} | '{1}' structure is invalid, parsing exceptions occured!".format(self.__class__.__name__,
+                                                                                           self.path))
+        else:
+            self.__buffer = buffer
+            return True
+
+    def write(self):
+        """
+        Writes the :obj:`BinaryPlistFileParser.elements` class property content to defined file
+            as a binary plist.
+
+        Usage::
+
+            >>> binary_plist_file_parser = BinaryPlistFileParser("standard.bplist")
+            >>> binary_plist_file_parser.elements = {"String A": "My Value A"}
+            >>> binary_plist_file_parser.write()
+            True
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        data = plistlib.dumps(self.elements or {}, fmt=plistlib.FMT_BINARY, sort_keys=False)
+
+        LOGGER.debug("> Writing '{0}' file elements.".format(self.path))
+
+        temporary_path = foundations.io.get_temporary_path(self.path)
+        try:
+            with open(temporary_path, "wb") as file:
+                file.write(data)
+            foundations.io.atomic_replace(temporary_path, self.path)
+        except Exception:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+        return True
+
+    def element_exists(self, element):
+        """
+        Checks if given element exists.
+
+        Usage::
+
+            >>> binary_plist_file_parser = BinaryPlistFileParser("standard.bplist")
+            >>> binary_plist_file_parser.parse()
+            True
+            >>> binary_plist_file_parser.element_exists("String A")
+            True
+
+        :param element: Element to check existence.
+        :type element: unicode
+        :return: Element existence.
+        :rtype: bool
+        """
+
+        for path, key, value in self.__walk():
+            if key == element:
+                LOGGER.debug("> '{0}' attribute exists.".format(element))
+                return True
+
+        LOGGER.debug("> '{0}' element doesn't exists.".format(element))
+        return False
+
+    def filter_values(self, pattern, flags=0):
+        """
+        Filters the elements using given pattern, only the matching elements values are decoded.
+
+        Usage::
+
+            >>> binary_plist_file_parser = BinaryPlistFileParser("standard.bplist")
+            >>> binary_plist_file_parser.parse()
+            True
+            >>> binary_plist_file_parser.filter_values(r"String A")
+            [u'My Value A']
+
+        :param pattern: Regex filtering pattern.
+        :type pattern: unicode
+        :param flags: Regex flags.
+        :type flags: int
+        :return: Values.
+        :rtype: list
+        """
+
+        search = re.compile(pattern, flags).search
+        return [value() for path, key, value in self.__walk() if search(key)]
+
+    def get_value(self, element):
+        """
+        | Returns the given element value.
+        | If multiple elements with the same name exists, only the first encountered will be returned.
+
+        Usage::
+
+            >>> binary_plist_file_parser = BinaryPlistFileParser("standard.bplist")
+            >>> binary_plist_file_parser.parse()
+            True
+            >>> binary_plist_file_parser.get_value("String A")
+            u'My Value A'
+
+        :param element: Element to get the value.
+        :type element: unicode
+        :return: Element value.
+        :rtype: object
+        """
+
+        if not PATTERN_CHARACTERS.search(element):
+            for path, key, value in self.__walk():
+                if key == element:
+                    return value()
+            return
+
+        return foundations.common.get_first_item(self.filter_values(r"^{0}$".format(element)))
+
+    def close(self):
+        """
+        Closes the memory mapped file, the elements decoded so far are kept.
+
+        Usage::
+
+            >>> with BinaryPlistFileParser("standard.bplist") as binary_plist_file_parser:
+            ...     binary_plist_file_parser.parse()
+            ...     binary_plist_file_parser.get_value("String A")
+            ...
+            True
+            u'My Value A'
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        if isinstance(self.__buffer, mmap.mmap):
+            self.__buffer.close()
+        self.__buffer = None
+        return True
+
+    def __walk(self):
+        """
+        Defines a generator used to walk the elements leaves in :func:`foundations.walkers.dictionaries_walker`
+            definition order, values are given as callables decoding them.
+
+        :return: Path, key, value.
+        :rtype: tuple
+        """
+
+        if self.__buffer is None:
+            for path, key, value in foundations.walkers.dictionaries_walker(self.__elements or {}):
+                yield path, key, lambda value=value: value
+            return
+
+        if self.__get_marker(self.__top_object) >> 4 != 0xD:
+            return
+
+        stack = [((), (self.__top_object,), self.__iterate_dictionary_references(self.__top_object))]
+        while stack:
+            path, ancestors, references = stack[-1]
+            for key_reference, value_reference in references:
+                key = self.__decode(key_reference)
+                if self.__get_marker(value_reference) >> 4 == 0xD:
+                    self.__check_cycle(value_reference, ancestors)
+                    stack.append((path + (key,),
+                                  ancestors + (value_reference,),
+                                  self.__iterate_dictionary_references(value_reference)))
+                    break
+                yield path, key, lambda reference=value_reference: self.__decode(reference)
+            else:
+                stack.pop()
+
+    def __raise_structure_error(self, message):
+        """
+        Raises a :class:`foundations.exceptions.FileStructureParsingError` exception for given structure error.
+
+        :param message: Error message.
+        :type message: unicode
+        """
+
+        raise foundations.exceptions.FileStructureParsingError(
+            "{0} | '{1}' structure is invalid: {2}!".format(self.__class__.__name__, self.path, message))
+
+    def __read(self, offset, size):
+        """
+        Reads given size bytes at given offset from the objects area, between the header and the offset table.
+
+        :param offset: Offset.
+        :type offset: int
+        :param size: Bytes count.
+        :type size: int
+        :return: Data.
+        :rtype: bytes
+        """
+
+        if offset < len(self.header) or size < 0 or offset + size > self.__offset_table_offset:
+            self.__raise_structure_error("'{0}' bytes at '{1}' offset are out of the objects area".format(size,
+                                                                                                         offset))
+        return self.__buffer[offset:offset + size]
+
+    def __check_cycle(self, reference, ancestors):
+        """
+        Checks that given container object reference is not one of its ancestors.
+
+        :param reference: Container object reference.
+        :type reference: int
+        :param ancestors: Ancestors containers objects references.
+        :type ancestors: tuple
+        """
+
+        if reference in ancestors:
+            self.__raise_structure_error("'{0}' object references itself".format(reference))
+
+    def __get_offset(self, reference):
+        """
+        Returns given object reference offset from the offset table.
+
+        :param reference: Object reference.
+        :type reference: int
+        :return: Object offset.
+        :rtype: int
+        """
+
+        if not 0 <= reference < self.__objects_count:
+            self.__raise_structure_error("'{0}' object reference is out of the offset table".format(reference))
+
+        start = self.__offset_table_offset + reference * self.__offset_size
+        offset = int.from_bytes(self.__buffer[start:start + self.__offset_size], "big")
+        if not len(self.header) <= offset < self.__offset_table_offset:
+            self.__raise_structure_error("'{0}' object offset is out of the objects area".format(reference))
+        return offset
+
+    def __get_marker(self, reference):
+        """
+        Returns given object reference marker byte.
+
+        :param reference: Object reference.
+        :type reference: int
+        :return: Object marker.
+        :rtype: int
+        """
+
+        return self.__buffer[self.__get_offset(reference)]
+
+    def __get_length(self, offset, information):
+        """
+        Returns the object length and data offset for given object offset and marker low nibble.
+
+        :param offset: Object offset.
+        :type offset: int
+        :param information: Object marker low nibble.
+        :type information: int
+        :return: Length, data offset.
+        :rtype: tuple
+        """
+
+        if information != 0xF:
+            return information, offset + 1
+
+        size = 1 << (self.__read(offset + 1, 1)[0] & 0xF)
+        return int.from_bytes(self.__read(offset + 2, size), "big"), offset + 2 + size
+
+    def __get_references(self, offset, count):
+        """
+        Returns given count of objects references starting at given offset.
+
+        :param offset: References offset.
+        :type offset: int
+        :param count: References count.
+        :type count: int
+        :return: References.
+        :rtype: list
+        """
+
+        size = self.__reference_size
+        data = self.__read(offset, count * size)
+        return [int.from_bytes(data[i:i + size], "big") for i in range(0, count * size, size)]
+
+    def __get_dictionary_references(self, reference):
+        """
+        Returns given dictionary object reference keys and values references.
+
+        :param reference: Dictionary object reference.
+        :type reference: int
+        :return: Keys references, values references.
+        :rtype: tuple
+        """
+
+        offset = self.__get_offset(reference)
+        count, offset = self.__get_length(offset, self.__buffer[offset] & 0xF)
+        return (self.__get_references(offset, count),
+                self.__get_references(offset + count * self.__reference_size, count))
+
+    def __iterate_dictionary_references(self, reference):
+        """
+        Defines a generator used to lazily read given dictionary object reference keys and values references.
+
+        :param reference: Dictionary object reference.
+        :type reference: int
+        :return: Key reference, value reference.
+        :rtype: tuple
+        """
+
+        offset = self.__get_offset(reference)
+        count, offset = self.__get_length(offset, self.__buffer[offset] & 0xF)
+        size = self.__reference_size
+        self.__read(offset, count * size * 2)
+        for i in range(count):
+            key_offset, value_offset = offset + i * size, offset + (count + i) * size
+            yield (int.from_bytes(self.__buffer[key_offset:key_offset + size], "big"),
+                   int.from_bytes(self.__buffer[value_offset:value_offset + size], "big"))
+
+    def __decode(self, reference, ancestors=()):
+        """
+        | Decodes given object reference.
+        | Data objects are returned as bytes like :func:`plistlib.load` definition does.
+
+        :param reference: Object reference.
+        :type reference: int
+        :param ancestors: Ancestors containers objects references.
+        :type ancestors: tuple
+        :return: Object.
+        :rtype: object
+        """
+
+        offset = self.__get_offset(reference)
+        marker = self.__buffer[offset]
+        type, information = marker >> 4, marker & 0xF
+
+        try:
+            if marker == 0x00:
+                return None
+            elif marker == 0x08:
+                return False
+            elif marker == 0x09:
+                return True
+            elif type == 0x1:
+                size = 1 << information
+                return int.from_bytes(self.__read(offset + 1, size), "big", signed=size >= 8)
+            elif marker == 0x22:
+                return struct.unpack(">f", self.__read(offset + 1, 4))[0]
+            elif marker == 0x23:
+                return struct.unpack(">d", self.__read(offset + 1, 8))[0]
+            elif marker == 0x33:
+                return self.epoch + datetime.timedelta(seconds=struct.unpack(">d", self.__read(offset + 1, 8))[0])
+            elif type == 0x4:
+                length, offset = self.__get_length(offset, information)
+                return bytes(self.__read(offset, length))
+            elif type == 0x5:
+                length, offset = self.__get_length(offset, information)
+                return self.__read(offset, length).decode("ascii")
+            elif type == 0x6:
+                length, offset = self.__get_length(offset, information)
+                return self.__read(offset, length * 2).decode("utf-16be")
+            elif type == 0x8:
+                return plistlib.UID(int.from_bytes(self.__read(offset + 1, information + 1), "big"))
+            elif type in (0xA, 0xC):
+                self.__check_cycle(reference, ancestors)
+                ancestors += (reference,)
+                length, offset = self.__get_length(offset, information)
+                return [self.__decode(item, ancestors) for item in self.__get_references(offset, length)]
+            elif type == 0xD:
+                self.__check_cycle(reference, ancestors)
+                ancestors += (reference,)
+                keys, values = self.__get_dictionary_references(reference)
+                return dict((self.__decode(key, ancestors), self.__decode(value, ancestors))
+                            for key, value in zip(keys, values))
+        except (OverflowError, TypeError, ValueError) as error:
+            self.__raise_structure_error("'{0}' object cannot be decoded: '{1}'".format(reference, error))
+
+        self.__raise_structure_error("'{0}' object marker is unknown".format(hex(marker)))
+
+
+@foundations.decorators.memoize(cache=None)
+def get_sections_file_tokenizer(comment_limiters=(";", "#"), splitters=("=", ":")):
+    """
+    | Returns the compiled tokenizer used by :meth:`SectionsFileParser.parse` method to classify lines.
+    | The tokenizer is a single alternation regex compiled once per comment limiters and splitters combination,
+        the matched line kind is given by the match **lastgroup** attribute:
+
+        - **comment**: Comment line, content is stored in the *comment* group.
+        - **section**: Section line, name is stored in the *section* group.
+        - **empty**: Empty line.
+        - **value**: Attribute line with a value, stored in the *attribute* and *value* groups.
+        - **attribute**: Attribute line without a value, stored in the *attribute* group.
+
+    Usage::
+
+        >>> tokenizer = get_sections_file_tokenizer()
+        >>> tokenizer.match("[Section A]\\n").lastgroup
+        u'section'
+        >>> tokenizer.match("Attribute 1 = \\"Value A\\"\\n").group("attribute", "value")
+        (u'Attribute 1 ', u' "Value A"')
+
+    :param comment_limiters: Comment limiters characters.
+    :type comment_limiters: tuple
+    :param splitters: Splitter characters.
+    :type splitters: tuple
+    :return: Tokenizer.
+    :rtype: object
+    """
+
+    return re.compile(r"^(?:\s*[{0}](?P<comment>.+)|"
+                      r"\s*\[(?P<section>.+)\]\s*|"
+                      r"(?P<empty>\s*)|"
+                      r"(?P<attribute>.+?)[{1}](?:(?P<value>.+)|\s*))$".format("".join(comment_limiters),
+                                                                              "".join(splitters)))
+
+
+def _remove_root_namespace(attribute, namespace_splitter=foundations.namespace.NAMESPACE_SPLITTER):
+    """
+    Returns given attribute with its root namespace stripped, a logging free equivalent of
+    :func:`foundations.namespace.remove_namespace` definition with **root_only** argument.
+
+    :param attribute: Attribute.
+    :type attribute: unicode
+    :param namespace_splitter: Namespace splitter character.
+    :type namespace_splitter: unicode
+    :return: Attribute without root namespace.
+    :rtype: unicode
+    """
+
+    root, splitter, leaf = attribute.partition(namespace_splitter)
+    return leaf if splitter else attribute
+
+
+@foundations.decorators.memoize(cache=None)
+def get_binding_pattern(binding_identifier="@"):
+    """
+    Returns the compiled pattern matching given binding identifier in attributes compounds links.
+
+    Usage::
+
+        >>> get_binding_pattern().search("@Name")
+        <_sre.SRE_Match object at 0x10fc3a8b8>
+
+    :param binding_identifier: Binding identifier.
+    :type binding_identifier: unicode
+    :return: Pattern.
+    :rtype: object
+    """
+
+    return re.compile(r"{0}\w*".format(binding_identifier))
+
+
+@functools.lru_cache(maxsize=ATTRIBUTE_COMPOUNDS_CACHE_SIZE)
+def _decode_attribute_compound(value, splitter, binding_identifier):
+    """
+    Decodes given attribute compound value.
+
+    :param value: Attribute value.
+    :type value: unicode
+    :param splitter: Splitter.
+    :type splitter: unicode
+    :param binding_identifier: Binding identifier.
+    :type binding_identifier: unicode
+    :return: Value, link, type, alias or None if given value is not an attribute compound.
+    :rtype: tuple
+    """
+
+    search = get_binding_pattern(binding_identifier).search
+    if splitter in value:
+        value_tokens = value.split(splitter)
+        if len(value_tokens) >= 3 and search(value_tokens[0]):
+            return (value_tokens[1].strip(),
+                    value_tokens[0].strip(),
+                    value_tokens[2].strip(),
+                    len(value_tokens) == 4 and value_tokens[3].strip() or None)
+    elif search(value):
+        return None, value, None, None
+
 
 def get_attribute_compound(attribute, value=None, splitter="|", binding_identifier="@"):
     """
@@ -1407,17 +3010,163 @@ def get_attribute_compound(attribute, value=None, splitter="|", binding_identifi
 
     LOGGER.debug("> Attribute: '{0}', value: '{1}'.".format(attribute, value))
 
-    if type(value) is str:
-        if splitter in value:
-            value_tokens = value.split(splitter)
-            if len(value_tokens) >= 3 and re.search(r"{0}\w*".format(binding_identifier), value_tokens[0]):
-                return AttributeCompound(name=attribute,
-                                         value=value_tokens[1].strip(),
-                                         link=value_tokens[0].strip(),
-                                         type=value_tokens[2].strip(),
-                                         alias=len(value_tokens) == 4 and value_tokens[3].strip() or None)
+    fields = _decode_attribute_compound(value, splitter, binding_identifier) if type(value) is str else None
+    if fields is None:
+        return AttributeCompound(name=attribute, value=value, link=None, type=None, alias=None)
+
+    value, link, type_, alias = fields
+    return AttributeCompound(name=attribute, value=value, link=link, type=type_, alias=alias)
+
+
+def get_attribute_compounds(attributes, splitter="|", binding_identifier="@"):
+    """
+    | Returns the attributes compounds of given attributes, typically a section attributes.
+    | Compounds are returned as :class:`CompactAttributeCompound` class instances, identical values are decoded
+        once thanks to a :data:`ATTRIBUTE_COMPOUNDS_CACHE_SIZE` sized least recently used cache.
+
+    Usage::
+
+        >>> attributes = {"Name": "@Name | Standard | String | Template Name", "Background|BGfile": "@BGfile"}
+        >>> compounds = get_attribute_compounds(attributes)
+        >>> compounds["Name"].value
+        u'Standard'
+        >>> compounds["Background|BGfile"].link
+        u'@BGfile'
+
+    :param attributes: Attributes.
+    :type attributes: dict
+    :param splitter: Splitter.
+    :type splitter: unicode
+    :param binding_identifier: Binding identifier.
+    :type binding_identifier: unicode
+    :return: Attributes compounds.
+    :rtype: OrderedDict
+    """
+
+    compounds = OrderedDict()
+    for attribute, value in attributes.items():
+        fields = _decode_attribute_compound(value, splitter, binding_identifier) if type(value) is str else None
+        if fields is None:
+            compounds[attribute] = CompactAttributeCompound(attribute, value)
         else:
-            if re.search(r"{0}\w*".format(binding_identifier), value):
-                return AttributeCompound(name=attribute, value=None, link=value, type=None, alias=None)
+            compounds[attribute] = CompactAttributeCompound(attribute, *fields)
+    return compounds
+
+
+def _parse_file(parser, path, portable, parse_arguments):
+    """
+    Parses given file with given parser, this definition is the :func:`parse_many` definition worker.
+
+    :param parser: Parser class or factory called with the file path.
+    :type parser: object
+    :param path: File path.
+    :type path: unicode
+    :param portable: Parser state is returned instead of the parser so that it can be pickled.
+    :type portable: bool
+    :param parse_arguments: Parser **parse** method arguments.
+    :type parse_arguments: dict
+    :return: Parser or parser state, None if the parser cannot be built, errors.
+    :rtype: tuple
+    """
+
+    file_parser = None
+    errors = []
+    try:
+        file_parser = parser(path)
+        if not os.path.isfile(path):
+            raise foundations.exceptions.FileExistsError("{0} | '{1}' file doesn't exists!".format(__name__, path))
 
-    return AttributeCompound(name=attribute, value=value, link=None, type=None, alias=None)
+        file_parser.parse(raise_parsing_errors=False, **parse_arguments)
+    except Exception as error:
+        errors.append(error)
+
+    if file_parser is None:
+        return None, errors
+
+    errors = list(file_parser.parsing_errors or []) + errors
+
+    if portable:
+        return dict((attribute, getattr(file_parser, attribute)) for attribute in PARSERS_STATE_ATTRIBUTES
+                    if hasattr(file_parser, attribute)), errors
+    else:
+        return file_parser, errors
+
+
+def parse_many(paths,
+               parser=SectionsFileParser,
+               workers=None,
+               executor="thread",
+               filters_in=None,
+               filters_out=None,
+               **kwargs):
+    """
+    | Parses given files concurrently and returns the parsers in input order.
+    | Directories are walked with :func:`foundations.walkers.files_walker` definition using given filters.
+    | Parsing errors and exceptions are collected per file instead of stopping at the first failing file.
+
+    Usage::
+
+        >>> parsers, errors = parse_many(["standard.rc", "standard.ibl"], workers=2)
+        >>> parsers[0].get_value("Attribute 1", "Section A")
+        u'Value A'
+        >>> errors
+        OrderedDict()
+        >>> parsers, errors = parse_many(["./resources"], executor="process", filters_in=("\\.ibl$",))
+
+    :param paths: Files or directories paths.
+    :type paths: tuple or list
+    :param parser: Parser class or picklable factory called with each file path.
+    :type parser: object
+    :param workers: Maximum workers count, defaults to the CPU count.
+    :type workers: int
+    :param executor: Executor type, **thread** or **process**. With the **process** executor, parsers are rebuilt
+        from their picklable state, i.e. :data:`PARSERS_STATE_ATTRIBUTES` attributes.
+    :type executor: unicode
+    :param filters_in: Directories files regex filters in list.
+    :type filters_in: tuple or list
+    :param filters_out: Directories files regex filters out list.
+    :type filters_out: tuple or list
+    :param \*\*kwargs: Parser **parse** method arguments.
+    :type \*\*kwargs: dict
+    :return: Parsers, None for files whose parser cannot be built, parsing errors and exceptions per file path.
+    :rtype: tuple
+    """
+
+    if executor not in ("thread", "process"):
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' executor is not supported!".format(__name__, executor))
+
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(foundations.walkers.files_walker(path, filters_in, filters_out))
+        else:
+            files.append(path)
+
+    LOGGER.debug("> Parsing '{0}' files with '{1}' executor.".format(len(files), executor))
+
+    parsers, errors = [], OrderedDict()
+    if not files:
+        return parsers, errors
+
+    portable = executor == "process"
+    workers = min(workers or os.cpu_count() or 1, len(files))
+    pool = concurrent.futures.ProcessPoolExecutor if portable else concurrent.futures.ThreadPoolExecutor
+    with pool(max_workers=workers) as pool:
+        results = pool.map(_parse_file,
+                           itertools.repeat(parser),
+                           files,
+                           itertools.repeat(portable),
+                           itertools.repeat(kwargs),
+                           chunksize=max(1, len(files) // (workers * 4)) if portable else 1)
+        for file, (file_parser, file_errors) in zip(files, results):
+            if portable and file_parser is not None:
+                state, file_parser = file_parser, parser(file)
+                for attribute, value in state.items():
+                    setattr(file_parser, attribute, value)
+
+            if file_errors:
+                LOGGER.debug("> '{0}' file parsing raised '{1}' errors.".format(file, len(file_errors)))
+                errors[file] = file_errors
+            parsers.append(file_parser)
+    return parsers, errors
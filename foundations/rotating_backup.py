@@ -195,7 +195,9 @@ class RotatingBackup(object):
 
     def backup(self):
         """
-        Does the rotating backup.
+        | Does the rotating backup.
+        | Backups are rotated using atomic renames and the source is atomically copied, thus an interrupted
+            backup never leaves a partially written file.
 
         :return: Method success.
         :rtype: bool
@@ -209,9 +211,9 @@ class RotatingBackup(object):
             sfn = "{0}.{1}".format(destination, i)
             dfn = "{0}.{1}".format(destination, i + 1)
             if foundations.common.path_exists(sfn):
-                if foundations.common.path_exists(dfn):
+                if os.path.isdir(dfn):
                     foundations.io.remove(dfn)
-                os.renames(sfn, dfn)
-        foundations.common.path_exists(destination) and os.rename(destination, destination + ".1")
-        foundations.io.copy(self.__source, destination)
+                os.replace(sfn, dfn)
+        foundations.common.path_exists(destination) and os.replace(destination, destination + ".1")
+        foundations.io.copy(self.__source, destination, atomic=True)
         return True
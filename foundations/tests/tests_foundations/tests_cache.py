@@ -16,14 +16,19 @@
 
 
 
+import os
+import shutil
 import sys
+import tempfile
 
 if sys.version_info[:2] <= (2, 6):
     import unittest2 as unittest
 else:
     import unittest
 
+import foundations.cache
 from foundations.cache import Cache
+from foundations.cache import PersistentCache
 
 __author__ = "Thomas Mansencal"
 __copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
@@ -33,7 +38,41 @@ __email__ = "thomas.mansencal@gmail.com"
 __status__ = "Production"
 
 __all__ = ["RESOURCES_DIRECTORY",
-           "TestCache"]
+           "TestPackEntry",
+           "TestUnpackEntry",
+           "TestCache",
+           "TestPersistentCache"]
+
+
+class TestPackEntry(unittest.TestCase):
+    """
+    Defines :func:`foundations.cache.pack_entry` definition units tests methods.
+    """
+
+    def test_pack_entry(self):
+        """
+        Tests :func:`foundations.cache.pack_entry` definition.
+        """
+
+        data = foundations.cache.pack_entry(b"MAGIC", {"Key": "Value"})
+        self.assertIsInstance(data, bytes)
+        self.assertTrue(data.startswith(b"MAGIC"))
+
+
+class TestUnpackEntry(unittest.TestCase):
+    """
+    Defines :func:`foundations.cache.unpack_entry` definition units tests methods.
+    """
+
+    def test_unpack_entry(self):
+        """
+        Tests :func:`foundations.cache.unpack_entry` definition.
+        """
+
+        data = foundations.cache.pack_entry(b"MAGIC", {"Key": "Value"})
+        self.assertDictEqual(foundations.cache.unpack_entry(b"MAGIC", data), {"Key": "Value"})
+        self.assertRaises(ValueError, foundations.cache.unpack_entry, b"OTHER", data)
+        self.assertRaises(ValueError, foundations.cache.unpack_entry, b"MAGIC", data[:-1] + b"\x00")
 
 
 class TestCache(unittest.TestCase):
@@ -95,6 +134,134 @@ class TestCache(unittest.TestCase):
         self.assertDictEqual(cache, {})
 
 
+class TestPersistentCache(unittest.TestCase):
+    """
+    Defines :class:`foundations.cache.PersistentCache` class units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initializes the tests directories.
+        """
+
+        self.__directory = tempfile.mkdtemp()
+        self.__cache_directory = os.path.join(self.__directory, "cache")
+        self.__file = os.path.join(self.__directory, "file.rc")
+        with open(self.__file, "w") as file:
+            file.write("[Section A]\nAttribute A = Value A\n")
+
+    def tearDown(self):
+        """
+        Removes the tests directories.
+        """
+
+        shutil.rmtree(self.__directory)
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ("directory",
+                               "maximum_size")
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(PersistentCache))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ("get_signature",
+                            "get_entry_path",
+                            "get_content",
+                            "set_content",
+                            "remove_content",
+                            "get_entries",
+                            "evict_content",
+                            "flush_content")
+
+        for method in required_methods:
+            self.assertIn(method, dir(PersistentCache))
+
+    def test_set_content(self):
+        """
+        Tests :meth:`foundations.cache.PersistentCache.set_content` method.
+        """
+
+        cache = PersistentCache(self.__cache_directory)
+        content = {"Section A": {"Attribute A": "Value A"}}
+        self.assertTrue(cache.set_content(self.__file, content, ("=",)))
+        self.assertTrue(os.path.exists(cache.get_entry_path(self.__file, ("=",))))
+        self.assertDictEqual(cache.get_content(self.__file, ("=",)), content)
+        self.assertIsNone(cache.get_content(self.__file, (":",)))
+
+        signature = cache.get_signature(self.__file)
+        with open(self.__file, "a") as file:
+            file.write("Attribute B = Value B\n")
+        self.assertTrue(cache.set_content(self.__file, "Stale content", signature=signature))
+        self.assertIsNone(cache.get_content(self.__file))
+
+    def test_get_content(self):
+        """
+        Tests :meth:`foundations.cache.PersistentCache.get_content` method.
+        """
+
+        cache = PersistentCache(self.__cache_directory)
+        self.assertIsNone(cache.get_content(self.__file))
+
+        cache.set_content(self.__file, "Content")
+        self.assertEqual(cache.get_content(self.__file), "Content")
+
+        with open(self.__file, "a") as file:
+            file.write("Attribute B = Value B\n")
+        self.assertIsNone(cache.get_content(self.__file))
+        self.assertFalse(os.path.exists(cache.get_entry_path(self.__file)))
+
+        cache.set_content(self.__file, "Content")
+        with open(cache.get_entry_path(self.__file), "r+b") as file:
+            file.seek(-1, os.SEEK_END)
+            file.write(b"\x00")
+        self.assertIsNone(cache.get_content(self.__file))
+        self.assertFalse(os.path.exists(cache.get_entry_path(self.__file)))
+
+    def test_remove_content(self):
+        """
+        Tests :meth:`foundations.cache.PersistentCache.remove_content` method.
+        """
+
+        cache = PersistentCache(self.__cache_directory)
+        cache.set_content(self.__file, "Content")
+        self.assertTrue(cache.remove_content(self.__file))
+        self.assertIsNone(cache.get_content(self.__file))
+        self.assertFalse(cache.remove_content(self.__file))
+
+    def test_evict_content(self):
+        """
+        Tests :meth:`foundations.cache.PersistentCache.evict_content` method.
+        """
+
+        cache = PersistentCache(self.__cache_directory, 1024)
+        for i in range(8):
+            cache.set_content(self.__file, "x" * 256, (i,))
+            os.utime(cache.get_entry_path(self.__file, (i,)), (i, i))
+        cache.evict_content()
+        self.assertLessEqual(sum(entry[1] for entry in cache.get_entries()), 1024)
+        self.assertIsNone(cache.get_content(self.__file, (0,)))
+        self.assertEqual(cache.get_content(self.__file, (7,)), "x" * 256)
+
+    def test_flush_content(self):
+        """
+        Tests :meth:`foundations.cache.PersistentCache.flush_content` method.
+        """
+
+        cache = PersistentCache(self.__cache_directory)
+        cache.set_content(self.__file, "Content")
+        self.assertTrue(cache.flush_content())
+        self.assertListEqual(cache.get_entries(), [])
+
+
 if __name__ == "__main__":
     import foundations.tests.utilities
 
@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**tests_indexes.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines units tests for :mod:`foundations.indexes` module.
+
+**Others:**
+
+"""
+
+
+
+import os
+import shutil
+import sys
+import tempfile
+
+if sys.version_info[:2] <= (2, 6):
+    import unittest2 as unittest
+else:
+    import unittest
+
+import foundations.strings
+import foundations.walkers
+from foundations.indexes import ADDED
+from foundations.indexes import FilesIndex
+from foundations.indexes import MODIFIED
+from foundations.indexes import REMOVED
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["TREE_HIERARCHY",
+           "TestFilesIndex"]
+
+TREE_HIERARCHY = ("standard.ibl", "standard.rc",
+                  "level_0/standard.ibl", "level_0/lorem_ipsum.txt",
+                  "level_0/level_1/standard.ibl", "level_0/level_1/standard.sIBLT")
+
+
+class TestFilesIndex(unittest.TestCase):
+    """
+    Defines :class:`foundations.indexes.FilesIndex` class units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initializes the tests directories.
+        """
+
+        self.__directory = tempfile.mkdtemp()
+        self.__root_directory = foundations.strings.to_forward_slashes(os.path.join(self.__directory, "root"))
+        self.__index_file = os.path.join(self.__directory, "indexes", "root.index")
+        self.__modification_time = 1000000000
+        for path in TREE_HIERARCHY:
+            self.__write_file(path, path)
+        self.__age_directories()
+
+    def tearDown(self):
+        """
+        Removes the tests directories.
+        """
+
+        shutil.rmtree(self.__directory)
+
+    def __write_file(self, path, content):
+        """
+        Writes given content into given tree file.
+
+        :param path: File path relative to the tree root directory.
+        :type path: unicode
+        :param content: Content.
+        :type content: unicode
+        :return: File path.
+        :rtype: unicode
+        """
+
+        path = "/".join((self.__root_directory, path))
+        os.path.isdir(os.path.dirname(path)) or os.makedirs(os.path.dirname(path))
+        with open(path, "w") as file:
+            file.write(content)
+        return path
+
+    def __age_directories(self):
+        """
+        Sets the tree directories modification times to a distinct past time so that they are not listed again
+        when unchanged.
+        """
+
+        self.__modification_time += 60
+        for parent, directories, files in os.walk(self.__root_directory):
+            os.utime(parent, (self.__modification_time, self.__modification_time))
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ("directory",
+                               "path",
+                               "filters_in",
+                               "filters_out",
+                               "flags",
+                               "files")
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(FilesIndex))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ("load",
+                            "save",
+                            "update")
+
+        for method in required_methods:
+            self.assertIn(method, dir(FilesIndex))
+
+    def test_update(self):
+        """
+        Tests :meth:`foundations.indexes.FilesIndex.update` method.
+        """
+
+        files_index = FilesIndex(self.__root_directory)
+        events = list(files_index.update())
+        self.assertListEqual(sorted(events),
+                             sorted((ADDED, path) for path in foundations.walkers.files_walker(self.__root_directory)))
+        self.assertListEqual(sorted(files_index.files), sorted(path for event, path in events))
+        self.assertListEqual(list(files_index.update()), [])
+
+        added_path = self.__write_file("level_0/level_1/level_2/standard.ibl", "")
+        removed_path = "/".join((self.__root_directory, "level_0/lorem_ipsum.txt"))
+        os.remove(removed_path)
+        modified_path = self.__write_file("level_0/standard.ibl", "Modified content.")
+        self.__age_directories()
+        self.assertListEqual(sorted(files_index.update()),
+                             sorted(((ADDED, added_path), (MODIFIED, modified_path), (REMOVED, removed_path))))
+        self.assertListEqual(list(files_index.update()), [])
+
+        shutil.rmtree("/".join((self.__root_directory, "level_0/level_1")))
+        self.__age_directories()
+        self.assertListEqual(sorted(path for event, path in files_index.update() if event == REMOVED),
+                             sorted("/".join((self.__root_directory, path)) for path in
+                                    ("level_0/level_1/standard.ibl", "level_0/level_1/standard.sIBLT",
+                                     "level_0/level_1/level_2/standard.ibl")))
+
+    def test_update_check_files(self):
+        """
+        Tests :meth:`foundations.indexes.FilesIndex.update` method files checks.
+        """
+
+        files_index = FilesIndex(self.__root_directory)
+        list(files_index.update())
+
+        modified_path = self.__write_file("level_0/level_1/standard.sIBLT", "Modified content.")
+        self.assertListEqual(list(files_index.update()), [])
+        self.assertListEqual(list(files_index.update(check_files=True)), [(MODIFIED, modified_path)])
+        self.assertListEqual(list(files_index.update(check_files=True)), [])
+
+    def test_update_filters(self):
+        """
+        Tests :meth:`foundations.indexes.FilesIndex.update` method filters.
+        """
+
+        files_index = FilesIndex(self.__root_directory, filters_in=("\.ibl$",), filters_out=("level_1",))
+        self.assertListEqual(sorted(path for event, path in files_index.update()),
+                             sorted("/".join((self.__root_directory, path)) for path in
+                                    ("standard.ibl", "level_0/standard.ibl")))
+
+        self.__write_file("level_0/level_1/new.ibl", "")
+        added_path = self.__write_file("level_0/new.ibl", "")
+        self.__age_directories()
+        self.assertListEqual(list(files_index.update()), [(ADDED, added_path)])
+
+    def test_save(self):
+        """
+        Tests :meth:`foundations.indexes.FilesIndex.save` and :meth:`foundations.indexes.FilesIndex.load` methods.
+        """
+
+        files_index = FilesIndex(self.__root_directory, self.__index_file)
+        list(files_index.update())
+        self.assertTrue(os.path.exists(self.__index_file))
+
+        added_path = self.__write_file("level_0/new.ibl", "")
+        self.__age_directories()
+        self.assertListEqual(list(FilesIndex(self.__root_directory, self.__index_file).update()),
+                             [(ADDED, added_path)])
+        self.assertListEqual(list(FilesIndex(self.__root_directory, self.__index_file).update()), [])
+
+        self.assertEqual(len(list(FilesIndex(self.__root_directory,
+                                             self.__index_file,
+                                             filters_in=("\.ibl$",)).update())), 4)
+
+        with open(self.__index_file, "wb") as file:
+            file.write(b"Corrupted snapshot.")
+        self.assertIsNone(FilesIndex(self.__root_directory, self.__index_file).load())
+        self.assertEqual(len(list(FilesIndex(self.__root_directory, self.__index_file).update())),
+                         len(TREE_HIERARCHY) + 1)
+
+
+if __name__ == "__main__":
+    import foundations.tests.utilities
+
+    unittest.main()
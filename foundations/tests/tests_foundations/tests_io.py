@@ -15,12 +15,18 @@
 
 
 
+import asyncio
+import concurrent.futures
+import hashlib
+import http.server
 import os
 import platform
 import shutil
 import stat
 import sys
 import tempfile
+import threading
+import time
 
 if sys.version_info[:2] <= (2, 6):
     import unittest2 as unittest
@@ -42,13 +48,18 @@ __all__ = ["RESOURCES_DIRECTORY",
            "LIBRARY",
            "TEXT_FILE",
            "FILE_CONTENT",
+           "HttpRequestHandler",
            "TestFile",
+           "TestHttpConnectionPool",
+           "TestGetAsyncExecutor",
            "TestSetDirectory",
            "TestCopy",
+           "TestAtomicReplace",
            "TestRemove",
            "TestIsReadable",
            "TestIsWritable",
-           "TestIsBinaryFile"]
+           "TestIsBinaryFile",
+           "TestClassifyBinaryFiles"]
 
 RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), "resources")
 LIBRARIES_DIRECTORY = os.path.join(RESOURCES_DIRECTORY, "libraries")
@@ -66,6 +77,60 @@ FILE_CONTENT = [
     "Excepteur sint occaecat cupidatat non proident, sunt in culpa qui officia deserunt mollit anim id est laborum.\n"]
 
 
+class HttpRequestHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Defines a keep alive HTTP request handler serving its server **files** attribute with **ETag** validators.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        """
+        Serves a **GET** request.
+        """
+
+        self.server.requests.append((self.path, self.client_address, self.headers.get("If-None-Match")))
+        if self.path == "/redirect":
+            self.send_response(302)
+            self.send_header("Location", "/file.txt")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        if self.path == "/slow":
+            time.sleep(0.01)
+
+        content = self.server.files.get(self.path.replace("/slow", "/file.txt"))
+        if content is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        etag = "\"{0}\"".format(hashlib.sha1(content).hexdigest())
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        """
+        Silences the requests logging.
+
+        :param \*args: Arguments.
+        :type \*args: \*
+        """
+
+        pass
+
+
 class TestFile(unittest.TestCase):
     """
     Defines :class:`foundations.io.File` class units tests methods.
@@ -77,7 +142,9 @@ class TestFile(unittest.TestCase):
         """
 
         required_attributes = ("path",
-                               "content")
+                               "content",
+                               "mmap",
+                               "buffer")
 
         for attribute in required_attributes:
             self.assertIn(attribute, dir(File))
@@ -90,9 +157,14 @@ class TestFile(unittest.TestCase):
         required_methods = ("cache",
                             "uncache",
                             "read",
+                            "iter_chunks",
+                            "iter_lines",
                             "write",
                             "append",
-                            "clear")
+                            "clear",
+                            "acache",
+                            "aread",
+                            "awrite")
 
         for method in required_methods:
             self.assertIn(method, dir(File))
@@ -109,6 +181,12 @@ class TestFile(unittest.TestCase):
         self.assertIsInstance(io_file.content, list)
         self.assertListEqual(io_file.content, FILE_CONTENT)
 
+        io_file = File(TEXT_FILE, mmap=True)
+        cache_success = io_file.cache()
+        self.assertTrue(cache_success)
+        self.assertListEqual(io_file.content, [])
+        self.assertEqual(io_file.buffer[:], "".join(FILE_CONTENT).encode("utf-8"))
+
     def test_uncache(self):
         """
         Tests :meth:`foundations.io.File.uncache` method.
@@ -120,6 +198,13 @@ class TestFile(unittest.TestCase):
         io_file.uncache()
         self.assertListEqual(io_file.content, [])
 
+        io_file = File(TEXT_FILE, mmap=True)
+        io_file.cache()
+        buffer = io_file.buffer
+        io_file.uncache()
+        self.assertIsNone(io_file.buffer)
+        self.assertTrue(buffer.closed)
+
     def test_read(self):
         """
         Tests :meth:`foundations.io.File.read` method.
@@ -131,6 +216,57 @@ class TestFile(unittest.TestCase):
         self.assertIsInstance(io_file.content, list)
         self.assertEqual(content, "".join(FILE_CONTENT))
 
+        io_file = File(TEXT_FILE, mmap=True)
+        self.assertEqual(io_file.read(), "".join(FILE_CONTENT))
+        self.assertListEqual(io_file.content, [])
+
+    def test_iter_lines(self):
+        """
+        Tests :meth:`foundations.io.File.iter_lines` method.
+        """
+
+        io_file = File(TEXT_FILE)
+        self.assertListEqual(list(io_file.iter_lines()), FILE_CONTENT)
+        self.assertListEqual(io_file.content, [])
+        for chunk_size in (1, 3, 7):
+            self.assertListEqual(list(File(TEXT_FILE).iter_lines(chunk_size=chunk_size)), FILE_CONTENT)
+        self.assertListEqual(list(File(TEXT_FILE, mmap=True).iter_lines()), FILE_CONTENT)
+
+        file_descriptor, path = tempfile.mkstemp()
+        os.close(file_descriptor)
+        self.assertListEqual(list(File(path, mmap=True).iter_lines()), [])
+        with open(path, "wb") as file:
+            file.write("Ünicode\nNo line feed".encode("utf-8"))
+        self.assertListEqual(list(File(path, mmap=True).iter_lines()), ["Ünicode\n", "No line feed"])
+        with open(path, "wb") as file:
+            file.write("Windows\r\nLine\rFeeds\r\n".encode("utf-8"))
+        io_file = File(path)
+        io_file.cache()
+        for chunk_size in (1, 8, 9):
+            self.assertListEqual(list(File(path).iter_lines(chunk_size=chunk_size)), io_file.content)
+        os.remove(path)
+
+    def test_iter_chunks(self):
+        """
+        Tests :meth:`foundations.io.File.iter_chunks` method.
+        """
+
+        for mmap in (False, True):
+            for chunk_size in (1, 2, 16, 65536):
+                chunks = list(File(TEXT_FILE, mmap=mmap).iter_chunks(chunk_size))
+                self.assertTrue(all(chunks))
+                self.assertEqual("".join(chunks), "".join(FILE_CONTENT))
+
+        file_descriptor, path = tempfile.mkstemp()
+        os.close(file_descriptor)
+        with open(path, "wb") as file:
+            file.write("Ünicode €".encode("utf-8"))
+        self.assertListEqual(list(File(path).iter_chunks(1)), ["Ü", "n", "i", "c", "o", "d", "e", " ", "€"])
+        os.remove(path)
+
+        self.assertListEqual(list(File(TEXT_FILE, content=["Cached\n"]).iter_chunks()), ["Cached\n"])
+        self.assertListEqual(list(File("/nonexistent/file.txt").iter_chunks()), [])
+
     def test_write(self):
         """
         Tests :meth:`foundations.io.File.write` method.
@@ -146,6 +282,57 @@ class TestFile(unittest.TestCase):
         self.assertListEqual(io_file.content, FILE_CONTENT)
         os.close(file_descriptor)
 
+        temp_directory = tempfile.mkdtemp()
+        io_file = File(os.path.join(temp_directory, "file.txt"))
+        io_file.content = FILE_CONTENT
+        self.assertTrue(io_file.write(atomic=True))
+        os.chmod(io_file.path, 0o640)
+        self.assertTrue(io_file.write(atomic=True))
+        self.assertEqual(os.stat(io_file.path).st_mode & 0o777, 0o640)
+        self.assertListEqual(os.listdir(temp_directory), ["file.txt"])
+        io_file.cache()
+        self.assertListEqual(io_file.content, FILE_CONTENT)
+        self.assertTrue(io_file.write(atomic=True, durable=True))
+        self.assertTrue(File(io_file.path, FILE_CONTENT).write(durable=True))
+        self.assertListEqual(os.listdir(temp_directory), ["file.txt"])
+
+        self.assertRaises(foundations.exceptions.ProgrammingError, File(io_file.path, ["Appended\n"]).write,
+                          mode="a", atomic=True)
+        self.assertTrue(File(io_file.path, ["Appended\n"]).write(mode="a"))
+        self.assertListEqual(File(io_file.path).read().splitlines(True), FILE_CONTENT + ["Appended\n"])
+
+        if hasattr(os, "symlink") and sys.platform != "win32":
+            link_path = os.path.join(temp_directory, "link.txt")
+            os.symlink(io_file.path, link_path)
+            self.assertTrue(File(link_path, ["Linked\n"]).write(atomic=True))
+            self.assertTrue(os.path.islink(link_path))
+            self.assertEqual(File(io_file.path).read(), "Linked\n")
+            self.assertListEqual(sorted(os.listdir(temp_directory)), ["file.txt", "link.txt"])
+            os.remove(link_path)
+
+        if hasattr(os, "geteuid") and os.geteuid() != 0:
+            os.chmod(temp_directory, 0o555)
+            try:
+                self.assertTrue(File(io_file.path, FILE_CONTENT).write(atomic=True))
+            finally:
+                os.chmod(temp_directory, 0o755)
+            self.assertListEqual(File(io_file.path).read().splitlines(True), FILE_CONTENT)
+
+        def writer(index):
+            for i in range(16):
+                File(io_file.path, ["Writer {0}\n".format(index)] * 1024).write(atomic=True)
+
+        writers = [threading.Thread(target=writer, args=(i,)) for i in range(4)]
+        for thread in writers:
+            thread.start()
+        for thread in writers:
+            thread.join()
+        io_file.cache()
+        self.assertEqual(len(io_file.content), 1024)
+        self.assertEqual(len(set(io_file.content)), 1)
+        self.assertListEqual(os.listdir(temp_directory), ["file.txt"])
+        shutil.rmtree(temp_directory)
+
     def test_append(self):
         """
         Tests :meth:`foundations.io.File.append` method.
@@ -177,6 +364,197 @@ class TestFile(unittest.TestCase):
         self.assertListEqual(io_file.content, [])
         os.close(file_descriptor)
 
+    def test_acache(self):
+        """
+        Tests :meth:`foundations.io.File.acache` method.
+        """
+
+        io_file = File(TEXT_FILE)
+        self.assertTrue(asyncio.run(io_file.acache()))
+        self.assertListEqual(io_file.content, FILE_CONTENT)
+
+        async def cache_files(executor):
+            files = [File(TEXT_FILE) for i in range(64)]
+            return files, await asyncio.gather(*(file.acache(executor=executor) for file in files))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            files, results = asyncio.run(cache_files(executor))
+        self.assertTrue(all(results))
+        for file in files:
+            self.assertListEqual(file.content, FILE_CONTENT)
+
+    def test_aread(self):
+        """
+        Tests :meth:`foundations.io.File.aread` method.
+        """
+
+        self.assertEqual(asyncio.run(File(TEXT_FILE).aread()), "".join(FILE_CONTENT))
+        self.assertEqual(asyncio.run(File(TEXT_FILE, mmap=True).aread()), "".join(FILE_CONTENT))
+
+    def test_awrite(self):
+        """
+        Tests :meth:`foundations.io.File.awrite` method.
+        """
+
+        temp_directory = tempfile.mkdtemp()
+        io_file = File(os.path.join(temp_directory, "file.txt"), FILE_CONTENT)
+        self.assertTrue(asyncio.run(io_file.awrite()))
+        self.assertTrue(asyncio.run(io_file.awrite(atomic=True, durable=True)))
+        self.assertListEqual(list(File(io_file.path).iter_lines()), FILE_CONTENT)
+        self.assertListEqual(os.listdir(temp_directory), ["file.txt"])
+        shutil.rmtree(temp_directory)
+
+
+class TestHttpConnectionPool(unittest.TestCase):
+    """
+    Defines :class:`foundations.io.HttpConnectionPool` class units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Starts the local HTTP server.
+        """
+
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), HttpRequestHandler)
+        self.server.daemon_threads = True
+        self.server.files = {"/file.txt": "".join(FILE_CONTENT).encode("utf-8")}
+        self.server.requests = []
+        self.url = "http://127.0.0.1:{0}".format(self.server.server_address[1])
+        self.thread = threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.01})
+        self.thread.start()
+        self.directory = tempfile.mkdtemp()
+        self.pools = []
+
+    def tearDown(self):
+        """
+        Closes the connections pools and stops the local HTTP server.
+        """
+
+        for pool in self.pools + [foundations.io.get_http_connection_pool()]:
+            pool.close()
+
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        shutil.rmtree(self.directory)
+
+    def get_pool(self, **kwargs):
+        """
+        Returns a connections pool closed by :meth:`TestHttpConnectionPool.tearDown` method.
+
+        :param \*\*kwargs: Pool arguments.
+        :type \*\*kwargs: dict
+        :return: Pool.
+        :rtype: HttpConnectionPool
+        """
+
+        pool = foundations.io.HttpConnectionPool(**kwargs)
+        self.pools.append(pool)
+        return pool
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ("timeout",
+                               "maximum_connections",
+                               "cache_directory")
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(foundations.io.HttpConnectionPool))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ("iter_content",
+                            "get_content",
+                            "close")
+
+        for method in required_methods:
+            self.assertIn(method, dir(foundations.io.HttpConnectionPool))
+
+    def test_get_content(self):
+        """
+        Tests :meth:`foundations.io.HttpConnectionPool.get_content` method.
+        """
+
+        pool = self.get_pool(timeout=5)
+        content = "".join(FILE_CONTENT).encode("utf-8")
+        self.assertEqual(pool.get_content("{0}/file.txt".format(self.url)), content)
+        self.assertEqual(pool.get_content("{0}/file.txt".format(self.url)), content)
+        self.assertEqual(pool.get_content("{0}/redirect".format(self.url)), content)
+        self.assertEqual(len(set(client_address for path, client_address, etag in self.server.requests)), 1)
+        self.assertRaises(foundations.exceptions.UrlReadError, pool.get_content, "{0}/missing.txt".format(self.url))
+        self.assertEqual(pool.get_content("{0}/file.txt".format(self.url)), content)
+        self.assertTrue(pool.close())
+
+    def test_iter_content(self):
+        """
+        Tests :meth:`foundations.io.HttpConnectionPool.iter_content` method.
+        """
+
+        pool = self.get_pool(cache_directory=self.directory)
+        content = "".join(FILE_CONTENT).encode("utf-8")
+        url = "{0}/file.txt".format(self.url)
+        chunks = list(pool.iter_content(url, chunk_size=4))
+        self.assertEqual(len(chunks[0]), 4)
+        self.assertEqual(b"".join(chunks), content)
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+        self.assertIsNone(self.server.requests[-1][2])
+
+        self.assertEqual(b"".join(pool.iter_content(url, chunk_size=4)), content)
+        self.assertIsNotNone(self.server.requests[-1][2])
+
+        self.server.files["/file.txt"] = b"Modified content\n"
+        self.assertEqual(pool.get_content(url), b"Modified content\n")
+        self.assertEqual(pool.get_content(url), b"Modified content\n")
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+
+        iterator = pool.iter_content("{0}/slow".format(self.url), chunk_size=4)
+        next(iterator)
+        iterator.close()
+        self.assertEqual(pool.get_content(url), b"Modified content\n")
+
+    def test_maximum_connections(self):
+        """
+        Tests :class:`foundations.io.HttpConnectionPool` class concurrent connections bound.
+        """
+
+        pool = self.get_pool(maximum_connections=2)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            contents = list(executor.map(pool.get_content, ["{0}/slow".format(self.url)] * 32))
+        self.assertEqual(len(set(contents)), 1)
+        self.assertLessEqual(len(set(client_address for path, client_address, etag in self.server.requests)), 2)
+
+    def test_file_cache(self):
+        """
+        Tests :meth:`foundations.io.File.cache` method with an online file.
+        """
+
+        io_file = File("{0}/file.txt".format(self.url))
+        self.assertTrue(io_file.cache())
+        self.assertListEqual(io_file.content, FILE_CONTENT)
+        self.assertListEqual(list(File("{0}/file.txt".format(self.url)).iter_lines()), FILE_CONTENT)
+
+
+class TestGetAsyncExecutor(unittest.TestCase):
+    """
+    Defines :func:`foundations.io.get_async_executor` definition units tests methods.
+    """
+
+    def test_get_async_executor(self):
+        """
+        Tests :func:`foundations.io.get_async_executor` definition.
+        """
+
+        executor = foundations.io.get_async_executor()
+        self.assertIsInstance(executor, concurrent.futures.ThreadPoolExecutor)
+        self.assertIs(executor, foundations.io.get_async_executor())
+        self.assertEqual(executor._max_workers, foundations.io.ASYNC_WORKERS)
+
 
 class TestSetDirectory(unittest.TestCase):
     """
@@ -210,6 +588,42 @@ class TestCopy(unittest.TestCase):
         destination = os.path.join(temp_directory, os.path.basename(TEXT_FILE))
         foundations.io.copy(TEXT_FILE, destination)
         self.assertTrue(os.path.exists(destination))
+
+        os.chmod(destination, 0o640)
+        self.assertTrue(foundations.io.copy(TEXT_FILE, destination, atomic=True, durable=True))
+        self.assertEqual(os.stat(destination).st_mode & 0o777, 0o640)
+        self.assertListEqual(list(File(destination).iter_lines()), FILE_CONTENT)
+
+        directory = os.path.join(temp_directory, "directory")
+        self.assertTrue(foundations.io.copy(RESOURCES_DIRECTORY, directory, atomic=True))
+        self.assertListEqual(sorted(os.listdir(directory)), sorted(os.listdir(RESOURCES_DIRECTORY)))
+        self.assertListEqual(sorted(os.listdir(temp_directory)), ["directory", os.path.basename(TEXT_FILE)])
+        shutil.rmtree(temp_directory)
+
+
+class TestAtomicReplace(unittest.TestCase):
+    """
+    Defines :func:`foundations.io.atomic_replace` definition units tests methods.
+    """
+
+    def test_atomic_replace(self):
+        """
+        Tests :func:`foundations.io.atomic_replace` definition.
+        """
+
+        temp_directory = tempfile.mkdtemp()
+        destination = os.path.join(temp_directory, "file.txt")
+        File(destination, ["Previous content\n"]).write()
+        os.chmod(destination, 0o600)
+
+        path = foundations.io.get_temporary_path(destination)
+        self.assertEqual(os.path.dirname(path), temp_directory)
+        self.assertNotEqual(path, foundations.io.get_temporary_path(destination))
+        File(path, FILE_CONTENT).write()
+        self.assertTrue(foundations.io.atomic_replace(path, destination, durable=True))
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(os.stat(destination).st_mode & 0o777, 0o600)
+        self.assertListEqual(list(File(destination).iter_lines()), FILE_CONTENT)
         shutil.rmtree(temp_directory)
 
 
@@ -279,6 +693,60 @@ class TestIsBinaryFile(unittest.TestCase):
         self.assertTrue(foundations.io.is_binary_file(LIBRARY))
         self.assertFalse(foundations.io.is_binary_file(TEXT_FILE))
 
+        file_descriptor, path = tempfile.mkstemp()
+        os.close(file_descriptor)
+        self.assertFalse(foundations.io.is_binary_file(path))
+        with open(path, "wb") as file:
+            file.write(b"Binary\x00content")
+        self.assertTrue(foundations.io.is_binary_file(path))
+        os.remove(path)
+
+    def test_is_binary_file_sampling(self):
+        """
+        Tests :func:`foundations.io.is_binary_file` definition head and tail sampling and threshold.
+        """
+
+        file_descriptor, path = tempfile.mkstemp()
+        os.close(file_descriptor)
+        with open(path, "wb") as file:
+            file.write(b"a" * 1024 + b"\x00" + b"a" * 1024)
+        self.assertTrue(foundations.io.is_binary_file(path))
+        self.assertFalse(foundations.io.is_binary_file(path, sample_size=512))
+
+        with open(path, "wb") as file:
+            file.write(b"a" * 1024 + b"\x00")
+        self.assertTrue(foundations.io.is_binary_file(path, sample_size=512))
+
+        with open(path, "wb") as file:
+            file.write(b"Text\n" + bytes(bytearray(range(1, 7))) * 4)
+        self.assertFalse(foundations.io.is_binary_file(path))
+        self.assertTrue(foundations.io.is_binary_file(path, threshold=0.3))
+        self.assertFalse(foundations.io.is_binary_file(TEXT_FILE, threshold=0.3))
+        os.remove(path)
+
+
+class TestClassifyBinaryFiles(unittest.TestCase):
+    """
+    Defines :func:`foundations.io.classify_binary_files` definition units tests methods.
+    """
+
+    def test_classify_binary_files(self):
+        """
+        Tests :func:`foundations.io.classify_binary_files` definition.
+        """
+
+        file_descriptor, path = tempfile.mkstemp()
+        os.close(file_descriptor)
+        with open(path, "wb") as file:
+            file.write(b"Binary\x00content")
+
+        paths = [TEXT_FILE, path, "/nonexistent/file.txt"] * 8
+        classification = foundations.io.classify_binary_files(paths, workers=4)
+        self.assertListEqual(list(classification.keys()), [TEXT_FILE, path, "/nonexistent/file.txt"])
+        self.assertListEqual(list(classification.values()), [False, True, None])
+        self.assertDictEqual(foundations.io.classify_binary_files([]), {})
+        os.remove(path)
+
 
 if __name__ == "__main__":
     import foundations.tests.utilities
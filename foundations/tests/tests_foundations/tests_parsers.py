@@ -18,6 +18,9 @@
 
 import datetime
 import os
+import plistlib
+import shutil
+import struct
 import tempfile
 import sys
 
@@ -28,9 +31,12 @@ else:
     import unittest
     from collections import OrderedDict
 
+import foundations.exceptions
 import foundations.namespace
 import foundations.parsers
+from foundations.cache import PersistentCache
 import foundations.walkers
+from foundations.parsers import BinaryPlistFileParser
 from foundations.parsers import PlistFileParser
 from foundations.parsers import SectionsFileParser
 
@@ -48,6 +54,8 @@ __all__ = ["RESOURCES_DIRECTORY",
            "DEFAULTS_FILE",
            "STRIPPING_FILE",
            "PARSING_ERRORS_FILE",
+           "PLIST_FILE",
+           "BINARY_PLIST_FILE",
            "STANDARD_FILES",
            "STANDARD_FILES_RAW_SECTIONS",
            "STANDARD_FILES_SECTIONS_AND_ATTRIBUTES",
@@ -57,12 +65,18 @@ __all__ = ["RESOURCES_DIRECTORY",
            "PARSING_ERRORS_LINES_AND_VALUES",
            "RANDOM_ATTRIBUTES",
            "RANDOM_COMMENTS",
+           "PLIST_FILE_CONTENT",
+           "BINARY_PLIST_FILE_CONTENT",
            "SCRIPT_RAW_SECTION",
            "CHINESE_IBL_SET_FILE",
            "CHINESE_IBL_SET_FILE_RANDOM_ATTRIBUTES",
            "TestSectionsFileParser",
            "TestPlistFileParser",
-           "TestGetAttributeCompound"]
+           "TestBinaryPlistFileParser",
+           "TestGetSectionsFileTokenizer",
+           "TestGetAttributeCompound",
+           "TestGetAttributeCompounds",
+           "TestParseMany"]
 
 RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), "resources")
 COMPONENT_FILE = os.path.join(RESOURCES_DIRECTORY, "standard.rc")
@@ -72,6 +86,7 @@ DEFAULTS_FILE = os.path.join(RESOURCES_DIRECTORY, "defaults.rc")
 STRIPPING_FILE = os.path.join(RESOURCES_DIRECTORY, "stripping.rc")
 PARSING_ERRORS_FILE = os.path.join(RESOURCES_DIRECTORY, "parsing_errors.rc")
 PLIST_FILE = os.path.join(RESOURCES_DIRECTORY, "standard.plist")
+BINARY_PLIST_FILE = os.path.join(RESOURCES_DIRECTORY, "standard.bplist")
 STANDARD_FILES = {"component": COMPONENT_FILE,
                   "ibl_set": IBL_SET_FILE,
                   "template": TEMPLATE_FILE}
@@ -377,6 +392,8 @@ PLIST_FILE_CONTENT = {"Dictionary A": {"String C": "My Value C", "String B": "My
                       "Boolean A": True,
                       "Data A": "My Value B"}
 
+BINARY_PLIST_FILE_CONTENT = dict(PLIST_FILE_CONTENT, **{"Data A": b"My Value B"})
+
 
 class TestSectionsFileParser(unittest.TestCase):
     """
@@ -411,6 +428,7 @@ class TestSectionsFileParser(unittest.TestCase):
         """
 
         required_methods = ("parse",
+                            "reparse",
                             "section_exists",
                             "attribute_exists",
                             "get_attributes",
@@ -492,6 +510,100 @@ class TestSectionsFileParser(unittest.TestCase):
             self.assertIsInstance(sections_file_parser.sections, dict)
             self.assertIsInstance(sections_file_parser.comments, dict)
 
+    def test_parse_stream(self):
+        """
+        Tests :meth:`foundations.parsers.SectionsFileParser.parse` method in streaming mode.
+        """
+
+        for type, file in STANDARD_FILES.items():
+            sections_file_parser = SectionsFileParser(file)
+            sections_file_parser.parse(raw_sections=STANDARD_FILES_RAW_SECTIONS[type], strip_comments=False)
+
+            stream_sections_file_parser = SectionsFileParser(file)
+            stream_sections_file_parser.parse(raw_sections=STANDARD_FILES_RAW_SECTIONS[type],
+                                              strip_comments=False,
+                                              stream=True)
+            self.assertListEqual(stream_sections_file_parser.content, [])
+            self.assertDictEqual(stream_sections_file_parser.sections, sections_file_parser.sections)
+            self.assertDictEqual(stream_sections_file_parser.comments, sections_file_parser.comments)
+
+            iterable_sections_file_parser = SectionsFileParser()
+            iterable_sections_file_parser.parse(raw_sections=STANDARD_FILES_RAW_SECTIONS[type],
+                                                strip_comments=False,
+                                                stream=iter(sections_file_parser.content))
+            self.assertDictEqual(iterable_sections_file_parser.sections, sections_file_parser.sections)
+            self.assertDictEqual(iterable_sections_file_parser.comments, sections_file_parser.comments)
+
+    def test_parse_mmap(self):
+        """
+        Tests :meth:`foundations.parsers.SectionsFileParser.parse` method in memory mapped mode.
+        """
+
+        for type, file in STANDARD_FILES.items():
+            sections_file_parser = SectionsFileParser(file)
+            sections_file_parser.parse(raw_sections=STANDARD_FILES_RAW_SECTIONS[type], strip_comments=False)
+
+            mmap_sections_file_parser = SectionsFileParser(file, mmap=True)
+            mmap_sections_file_parser.parse(raw_sections=STANDARD_FILES_RAW_SECTIONS[type], strip_comments=False)
+            self.assertListEqual(mmap_sections_file_parser.content, [])
+            self.assertIsNone(mmap_sections_file_parser.buffer)
+            self.assertDictEqual(mmap_sections_file_parser.sections, sections_file_parser.sections)
+            self.assertDictEqual(mmap_sections_file_parser.comments, sections_file_parser.comments)
+
+            mmap_sections_file_parser.reparse(raw_sections=STANDARD_FILES_RAW_SECTIONS[type], strip_comments=False)
+            self.assertListEqual(mmap_sections_file_parser.content, sections_file_parser.content)
+            self.assertDictEqual(mmap_sections_file_parser.sections, sections_file_parser.sections)
+
+    def test_parse_lazy(self):
+        """
+        Tests :meth:`foundations.parsers.SectionsFileParser.parse` method in lazy mode.
+        """
+
+        for type, file in STANDARD_FILES.items():
+            sections_file_parser = SectionsFileParser(file)
+            sections_file_parser.parse(raw_sections=STANDARD_FILES_RAW_SECTIONS[type], strip_comments=False)
+
+            lazy_sections_file_parser = SectionsFileParser(file)
+            lazy_sections_file_parser.parse(raw_sections=STANDARD_FILES_RAW_SECTIONS[type],
+                                            strip_comments=False,
+                                            lazy=True)
+            lazy_sections = lazy_sections_file_parser._SectionsFileParser__lazy_sections
+            self.assertEqual(len(lazy_sections_file_parser), len(sections_file_parser))
+            for section in STANDARD_FILES_SECTIONS_AND_ATTRIBUTES[type]:
+                self.assertIn(section, lazy_sections_file_parser)
+                self.assertIn(section, lazy_sections)
+            self.assertDictEqual(lazy_sections_file_parser.comments, sections_file_parser.comments)
+
+            for attribute, value in RANDOM_ATTRIBUTES[type].items():
+                section = foundations.namespace.get_namespace(attribute, root_only=True)
+                self.assertEqual(lazy_sections_file_parser.get_value(attribute, section), value)
+                self.assertNotIn(section, lazy_sections)
+
+            self.assertListEqual([section for section, attributes in lazy_sections_file_parser],
+                                 list(sections_file_parser.sections.keys()))
+            self.assertDictEqual(lazy_sections_file_parser.sections, sections_file_parser.sections)
+            self.assertFalse(lazy_sections)
+
+        sections_file_parser = SectionsFileParser(PARSING_ERRORS_FILE)
+        sections_file_parser.parse(raise_parsing_errors=False, lazy=True)
+        sections_file_parser.get_all_attributes()
+        for exception in sections_file_parser.parsing_errors:
+            self.assertIn(exception.line, PARSING_ERRORS_LINES_AND_VALUES)
+            self.assertEqual(exception.value, PARSING_ERRORS_LINES_AND_VALUES[exception.line])
+
+        file_descriptor, path = tempfile.mkstemp()
+        with open(path, "w") as file:
+            file.write("[A]\nAttribute = Value A\n\n[B]\nAttribute = Value B\n")
+        sections_file_parser = SectionsFileParser(path)
+        sections_file_parser.parse(lazy=True)
+        with open(path, "w") as file:
+            file.write("[B]\nAttribute = Value B\n\n[A]\nAttribute = Value C\nOther = Value D\n")
+        self.assertRaises(foundations.exceptions.FileStructureParsingError, sections_file_parser.__getitem__, "A")
+        sections_file_parser.parse(lazy=True)
+        self.assertEqual(sections_file_parser["A"], {"A|Attribute": "Value C", "A|Other": "Value D"})
+        os.close(file_descriptor)
+        os.remove(path)
+
     def test_parse_international(self):
         """
         Tests :meth:`foundations.parsers.SectionsFileParser.parse` in international specific context.
@@ -687,11 +799,65 @@ class TestSectionsFileParser(unittest.TestCase):
         sections_file_parser.set_value("Attribute B", "Section B", "Value B")
         self.assertEqual(sections_file_parser["Section B"]["Attribute B"], "Value B")
 
+        self.assertTrue(sections_file_parser.attribute_exists("Attribute B", "Section B"))
+        self.assertFalse(sections_file_parser.attribute_exists("Attribute C", "Section B"))
+        sections_file_parser.set_value("Section B|Attribute C", "Section B", "Value C")
+        self.assertTrue(sections_file_parser.attribute_exists("Attribute C", "Section B"))
+        self.assertEqual(sections_file_parser.get_value("Attribute C", "Section B"), "Value C")
+        sections_file_parser["Section B"]["Section B|Attribute D"] = "Value D"
+        self.assertEqual(sections_file_parser.get_value("Attribute D", "Section B"), "Value D")
+
+        del sections_file_parser["Section B"]["Section B|Attribute D"]
+        sections_file_parser["Section B"]["Section B|Attribute E"] = "Value E"
+        self.assertTrue(sections_file_parser.attribute_exists("Attribute E", "Section B"))
+        self.assertFalse(sections_file_parser.attribute_exists("Attribute D", "Section B"))
+        self.assertEqual(sections_file_parser.get_value("Attribute E", "Section B"), "Value E")
+        self.assertEqual(sections_file_parser.get_value("Attribute D", "Section B", default="Default"), "Default")
+
+        remove_root_namespace = foundations.parsers._remove_root_namespace
+        calls = []
+
+        def recording_remove_root_namespace(attribute, *args):
+            calls.append(attribute)
+            return remove_root_namespace(attribute, *args)
+
+        self.assertTrue(sections_file_parser.attribute_exists("Attribute E", "Section B"))
+        try:
+            foundations.parsers._remove_root_namespace = recording_remove_root_namespace
+            self.assertFalse(sections_file_parser.attribute_exists("Attribute Nemo", "Section B"))
+            self.assertEqual(sections_file_parser.get_value("Attribute Nemo", "Section B", default="Default"), "Default")
+        finally:
+            foundations.parsers._remove_root_namespace = remove_root_namespace
+        self.assertListEqual(calls, ["Attribute Nemo", "Attribute Nemo"])
+
+        sections_file_parser["Section B"] = {"Section B|Attribute F": "Value F"}
+        self.assertFalse(sections_file_parser.attribute_exists("Attribute E", "Section B"))
+        self.assertEqual(sections_file_parser.get_value("Attribute F", "Section B"), "Value F")
+
     def test_write(self):
         """
         Tests :meth:`foundations.parsers.SectionsFileParser.write` method.
         """
 
+        # Symbolic link sections file.
+        if hasattr(os, "symlink") and sys.platform != "win32":
+            directory = tempfile.mkdtemp()
+            try:
+                path = os.path.join(directory, "standard.ibl")
+                shutil.copy(IBL_SET_FILE, path)
+                link_path = os.path.join(directory, "link.ibl")
+                os.symlink(path, link_path)
+                sections_file_parser = SectionsFileParser(link_path)
+                sections_file_parser.parse()
+                sections_file_parser.set_value("Name", "Header", "Linked")
+                self.assertTrue(sections_file_parser.write())
+                self.assertTrue(os.path.islink(link_path))
+                sections_file_parser = SectionsFileParser(path)
+                sections_file_parser.parse()
+                self.assertEqual(sections_file_parser.get_value("Name", "Header"), "Linked")
+            finally:
+                shutil.rmtree(directory)
+
         # Standard sections files.
         for type, file in STANDARD_FILES.items():
             read_sections_file_parser = SectionsFileParser(file)
@@ -742,6 +908,90 @@ class TestSectionsFileParser(unittest.TestCase):
         checking_sections_file_parser.parse()
         os.close(file_descriptor)
 
+        # Sections names being substrings of other sections names.
+        file_descriptor, path = tempfile.mkstemp()
+        write_sections_file_parser = SectionsFileParser(str(path))
+        write_sections_file_parser.content = ["[A]\n", "; Comment A.\n", "Attribute = Value A\n", "\n",
+                                              "[AB]\n", "; Comment AB.\n", "Attribute = Value AB\n"]
+        write_sections_file_parser.parse(strip_comments=False)
+        write_sections_file_parser.write()
+        with open(path) as file:
+            self.assertEqual(file.read(), "[A]\n; Comment A.\nAttribute = Value A\n\n"
+                                          "[AB]\n; Comment AB.\nAttribute = Value AB\n")
+        os.close(file_descriptor)
+
+    def test_reparse(self):
+        """
+        Tests :meth:`foundations.parsers.SectionsFileParser.reparse` method.
+        """
+
+        for type, file in STANDARD_FILES.items():
+            sections_file_parser = SectionsFileParser(file)
+            sections_file_parser.parse(strip_comments=False, raw_sections=STANDARD_FILES_RAW_SECTIONS[type])
+            reparsing_sections_file_parser = SectionsFileParser(file)
+            reparsing_sections_file_parser.reparse(strip_comments=False, raw_sections=STANDARD_FILES_RAW_SECTIONS[type])
+            self.assertEqual(reparsing_sections_file_parser.sections, sections_file_parser.sections)
+            self.assertEqual(reparsing_sections_file_parser.comments, sections_file_parser.comments)
+
+        content = ["; Comment.\n",
+                   "[Section A]\n",
+                   "; Comment A.\n",
+                   "Attribute A = Value A\n",
+                   "[Section B]\n",
+                   "; Comment B.\n",
+                   "Attribute B = Value B\n"]
+        sections_file_parser = SectionsFileParser()
+        sections_file_parser.reparse(content, strip_comments=False)
+        section_a, section_b = sections_file_parser.sections["Section A"], sections_file_parser.sections["Section B"]
+
+        content[1:1] = ["Attribute = Value\n", "Invalid attribute\n"]
+        content[-1] = "Attribute B = Value C\n"
+        sections_file_parser.reparse(content, strip_comments=False, raise_parsing_errors=False)
+        self.assertIs(sections_file_parser.sections["Section A"], section_a)
+        self.assertIsNot(sections_file_parser.sections["Section B"], section_b)
+        self.assertEqual(sections_file_parser.get_value("Attribute B", "Section B"), "Value C")
+        self.assertEqual(sections_file_parser.get_value("Attribute", "_defaults"), "Value")
+        self.assertListEqual([error.line for error in sections_file_parser.parsing_errors], [3])
+
+        checking_sections_file_parser = SectionsFileParser()
+        checking_sections_file_parser.content = content
+        checking_sections_file_parser.parse(strip_comments=False, raise_parsing_errors=False)
+        self.assertEqual(sections_file_parser.sections, checking_sections_file_parser.sections)
+        self.assertEqual(sections_file_parser.comments, checking_sections_file_parser.comments)
+
+    def test_persistent_cache(self):
+        """
+        Tests :class:`foundations.parsers.SectionsFileParser` class persistent cache.
+        """
+
+        directory = tempfile.mkdtemp()
+        try:
+            cache = PersistentCache(directory)
+            for type, file in STANDARD_FILES.items():
+                sections_file_parser = SectionsFileParser(file, persistent_cache=cache)
+                sections_file_parser.parse(strip_comments=False, raw_sections=STANDARD_FILES_RAW_SECTIONS[type])
+                self.assertTrue(sections_file_parser.content)
+
+                cached_sections_file_parser = SectionsFileParser(file, persistent_cache=cache)
+                cached_sections_file_parser.parse(strip_comments=False,
+                                                  raw_sections=STANDARD_FILES_RAW_SECTIONS[type])
+                self.assertFalse(cached_sections_file_parser.content)
+                self.assertEqual(cached_sections_file_parser.sections, sections_file_parser.sections)
+                self.assertEqual(cached_sections_file_parser.comments, sections_file_parser.comments)
+
+                cached_sections_file_parser = SectionsFileParser(file, persistent_cache=cache)
+                cached_sections_file_parser.parse(raw_sections=STANDARD_FILES_RAW_SECTIONS[type])
+                self.assertTrue(cached_sections_file_parser.content)
+                self.assertEqual(cached_sections_file_parser.comments, OrderedDict())
+
+            sections_file_parser = SectionsFileParser(PARSING_ERRORS_FILE, persistent_cache=cache)
+            sections_file_parser.parse(raise_parsing_errors=False)
+            self.assertIsNone(cache.get_content(PARSING_ERRORS_FILE,
+                                                sections_file_parser._SectionsFileParser__get_cache_options(
+                                                    None, True, True, True, True)))
+        finally:
+            shutil.rmtree(directory)
+
 
 class TestPlistFileParser(unittest.TestCase):
     """
@@ -770,7 +1020,9 @@ class TestPlistFileParser(unittest.TestCase):
         required_methods = ("parse",
                             "element_exists",
                             "filter_values",
-                            "get_value")
+                            "get_value",
+                            "get_paths",
+                            "iter_elements")
 
         for method in required_methods:
             self.assertIn(method, dir(PlistFileParser))
@@ -784,6 +1036,41 @@ class TestPlistFileParser(unittest.TestCase):
         self.assertTrue(plist_file_parser.parse())
         self.assertDictEqual(plist_file_parser.elements, PLIST_FILE_CONTENT)
 
+    def test_persistent_cache(self):
+        """
+        Tests :class:`foundations.parsers.PlistFileParser` class persistent cache.
+        """
+
+        directory = tempfile.mkdtemp()
+        try:
+            cache = PersistentCache(directory)
+            plist_file_parser = PlistFileParser(PLIST_FILE, persistent_cache=cache)
+            self.assertTrue(plist_file_parser.parse())
+            self.assertEqual(len(cache.get_entries()), 1)
+
+            plist_file_parser = PlistFileParser(PLIST_FILE, persistent_cache=cache)
+            self.assertTrue(plist_file_parser.parse())
+            self.assertDictEqual(plist_file_parser.elements, PLIST_FILE_CONTENT)
+        finally:
+            shutil.rmtree(directory)
+
+    def test_iter_elements(self):
+        """
+        Tests :meth:`foundations.parsers.PlistFileParser.iter_elements` method.
+        """
+
+        plist_file_parser = PlistFileParser(PLIST_FILE)
+        plist_file_parser.parse()
+        self.assertListEqual(list(plist_file_parser.iter_elements()),
+                             list(foundations.walkers.dictionaries_walker(plist_file_parser.elements)))
+        self.assertListEqual(list(plist_file_parser.iter_elements(lambda path, key, value: path)),
+                             [(("Dictionary A",), "String B", PLIST_FILE_CONTENT["Dictionary A"]["String B"]),
+                              (("Dictionary A",), "String C", PLIST_FILE_CONTENT["Dictionary A"]["String C"])])
+
+        elements = plist_file_parser.iter_elements(lambda path, key, value: key == "String A")
+        self.assertEqual(next(elements), ((), "String A", PLIST_FILE_CONTENT["String A"]))
+        elements.close()
+
     def test_element_exists(self):
         """
         Tests :meth:`foundations.parsers.PlistFileParser.element_exists` method.
@@ -821,6 +1108,230 @@ class TestPlistFileParser(unittest.TestCase):
         for item in foundations.walkers.dictionaries_walker(PLIST_FILE_CONTENT):
             path, element, value = item
             self.assertEqual(value, plist_file_parser.get_value(element))
+        self.assertEqual(plist_file_parser.get_value("String [AB]"), PLIST_FILE_CONTENT["String A"])
+        self.assertIsNone(plist_file_parser.get_value("String Nemo"))
+
+        plist_file_parser.elements = {"Dictionary A": {"String A": "My Value"}}
+        self.assertEqual(plist_file_parser.get_value("String A"), "My Value")
+
+        plist_file_parser.elements["Dictionary A"]["String A"] = "My Other Value"
+        self.assertEqual(plist_file_parser.get_value("String A"), "My Other Value")
+        self.assertListEqual(plist_file_parser.filter_values("String A"), ["My Other Value"])
+        plist_file_parser.elements["String A"] = "My Root Value"
+        del plist_file_parser.elements["Dictionary A"]["String A"]
+        self.assertEqual(plist_file_parser.get_value("String A"), "My Root Value")
+        self.assertListEqual(plist_file_parser.get_paths("String A"), [()])
+        del plist_file_parser.elements["String A"]
+        self.assertFalse(plist_file_parser.element_exists("String A"))
+        self.assertIsNone(plist_file_parser.get_value("String A"))
+
+    def test_get_paths(self):
+        """
+        Tests :meth:`foundations.parsers.PlistFileParser.get_paths` method.
+        """
+
+        plist_file_parser = PlistFileParser(PLIST_FILE)
+        plist_file_parser.parse()
+        for item in foundations.walkers.dictionaries_walker(PLIST_FILE_CONTENT):
+            path, element, value = item
+            self.assertIn(path, plist_file_parser.get_paths(element))
+        self.assertListEqual(plist_file_parser.get_paths("String Nemo"), [])
+
+
+class TestBinaryPlistFileParser(unittest.TestCase):
+    """
+    Defines :class:`foundations.parsers.BinaryPlistFileParser` class units tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ("path",
+                               "content",
+                               "elements",
+                               "parsing_errors")
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(BinaryPlistFileParser))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ("parse",
+                            "write",
+                            "element_exists",
+                            "filter_values",
+                            "get_value",
+                            "close")
+
+        for method in required_methods:
+            self.assertIn(method, dir(BinaryPlistFileParser))
+
+    def test_parse(self):
+        """
+        Tests :meth:`foundations.parsers.BinaryPlistFileParser.parse` method.
+        """
+
+        binary_plist_file_parser = BinaryPlistFileParser(BINARY_PLIST_FILE)
+        self.assertTrue(binary_plist_file_parser.parse())
+        self.assertDictEqual(binary_plist_file_parser.elements, BINARY_PLIST_FILE_CONTENT)
+
+        binary_plist_file_parser = BinaryPlistFileParser(PLIST_FILE)
+        binary_plist_file_parser.parse(raise_parsing_errors=False)
+        self.assertTrue(binary_plist_file_parser.parsing_errors)
+
+    def test_write(self):
+        """
+        Tests :meth:`foundations.parsers.BinaryPlistFileParser.write` method.
+        """
+
+        file_descriptor, path = tempfile.mkstemp()
+        binary_plist_file_parser = BinaryPlistFileParser(path)
+        binary_plist_file_parser.elements = BINARY_PLIST_FILE_CONTENT
+        self.assertTrue(binary_plist_file_parser.write())
+
+        binary_plist_file_parser = BinaryPlistFileParser(path)
+        binary_plist_file_parser.parse()
+        self.assertDictEqual(binary_plist_file_parser.elements, BINARY_PLIST_FILE_CONTENT)
+        os.close(file_descriptor)
+        os.remove(path)
+
+    def test_element_exists(self):
+        """
+        Tests :meth:`foundations.parsers.BinaryPlistFileParser.element_exists` method.
+        """
+
+        binary_plist_file_parser = BinaryPlistFileParser(BINARY_PLIST_FILE)
+        binary_plist_file_parser.parse()
+        self.assertTrue(binary_plist_file_parser.element_exists("String A"))
+        self.assertTrue(binary_plist_file_parser.element_exists("String B"))
+        self.assertFalse(binary_plist_file_parser.element_exists("String Nemo"))
+
+    def test_filter_values(self):
+        """
+        Tests :meth:`foundations.parsers.BinaryPlistFileParser.filter_values` method.
+        """
+
+        binary_plist_file_parser = BinaryPlistFileParser(BINARY_PLIST_FILE)
+        binary_plist_file_parser.parse()
+        self.assertEqual(binary_plist_file_parser.filter_values(r"String A"), [PLIST_FILE_CONTENT["String A"]])
+        self.assertEqual(sorted(binary_plist_file_parser.filter_values(r"String.*")),
+                         sorted([PLIST_FILE_CONTENT["String A"],
+                                 PLIST_FILE_CONTENT["Dictionary A"]["String B"],
+                                 PLIST_FILE_CONTENT["Dictionary A"]["String C"]]))
+
+    def test_get_value(self):
+        """
+        Tests :meth:`foundations.parsers.BinaryPlistFileParser.get_value` method.
+        """
+
+        binary_plist_file_parser = BinaryPlistFileParser(BINARY_PLIST_FILE)
+        binary_plist_file_parser.parse()
+        for item in foundations.walkers.dictionaries_walker(BINARY_PLIST_FILE_CONTENT):
+            path, element, value = item
+            self.assertEqual(value, binary_plist_file_parser.get_value(element))
+        self.assertIsNone(binary_plist_file_parser.get_value("String Nemo"))
+
+    def test_data(self):
+        """
+        Tests :class:`foundations.parsers.BinaryPlistFileParser` class data objects decoding.
+        """
+
+        file_descriptor, path = tempfile.mkstemp()
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                file.write(plistlib.dumps({"Data A": b"\xff\x00\x80A"}, fmt=plistlib.FMT_BINARY))
+            with BinaryPlistFileParser(path) as binary_plist_file_parser:
+                binary_plist_file_parser.parse()
+                self.assertEqual(binary_plist_file_parser.get_value("Data A"), b"\xff\x00\x80A")
+        finally:
+            os.remove(path)
+
+    def test_close(self):
+        """
+        Tests :meth:`foundations.parsers.BinaryPlistFileParser.close` method.
+        """
+
+        with BinaryPlistFileParser(BINARY_PLIST_FILE) as binary_plist_file_parser:
+            binary_plist_file_parser.parse()
+            self.assertEqual(binary_plist_file_parser.get_value("String A"), PLIST_FILE_CONTENT["String A"])
+        self.assertIsNone(binary_plist_file_parser.get_value("String A"))
+
+        binary_plist_file_parser = BinaryPlistFileParser(BINARY_PLIST_FILE)
+        binary_plist_file_parser.parse()
+        binary_plist_file_parser.elements
+        self.assertTrue(binary_plist_file_parser.close())
+        self.assertDictEqual(binary_plist_file_parser.elements, BINARY_PLIST_FILE_CONTENT)
+
+    def test_corrupted_file(self):
+        """
+        Tests :class:`foundations.parsers.BinaryPlistFileParser` class corrupted files decoding.
+        """
+
+        with open(BINARY_PLIST_FILE, "rb") as file:
+            data = file.read()
+        offset_size, reference_size, objects_count, top_object, offset_table_offset = struct.unpack(
+            ">6xBBQQQ", data[-32:])
+
+        corruptions = []
+        top_object_start = offset_table_offset + top_object * offset_size
+        corruptions.append(data[:top_object_start] + b"\xff" * offset_size + data[top_object_start + offset_size:])
+        top_object_offset = int.from_bytes(data[top_object_start:top_object_start + offset_size], "big")
+        corruptions.append(data[:top_object_offset + 1] + b"\xff" * reference_size +
+                           data[top_object_offset + 1 + reference_size:])
+        corruptions.append(data[:top_object_offset] + b"\xaf\x13\x7f" + data[top_object_offset + 3:])
+
+        for i, corruption in enumerate(corruptions):
+            file_descriptor, path = tempfile.mkstemp()
+            with os.fdopen(file_descriptor, "wb") as file:
+                file.write(corruption)
+            try:
+                with BinaryPlistFileParser(path) as binary_plist_file_parser:
+                    binary_plist_file_parser.parse()
+                    self.assertRaises(foundations.exceptions.FileStructureParsingError,
+                                      lambda: binary_plist_file_parser.elements)
+                    if i < 2:
+                        self.assertRaises(foundations.exceptions.FileStructureParsingError,
+                                          binary_plist_file_parser.get_value,
+                                          "String A")
+            finally:
+                os.remove(path)
+
+
+class TestGetSectionsFileTokenizer(unittest.TestCase):
+    """
+    Defines :func:`foundations.parsers.get_sections_file_tokenizer` definition units tests methods.
+    """
+
+    def test_get_sections_file_tokenizer(self):
+        """
+        Tests :func:`foundations.parsers.get_sections_file_tokenizer` definition.
+        """
+
+        tokenizer = foundations.parsers.get_sections_file_tokenizer()
+        self.assertIs(tokenizer, foundations.parsers.get_sections_file_tokenizer())
+
+        self.assertEqual(tokenizer.match("; Comment.\n").lastgroup, "comment")
+        self.assertEqual(tokenizer.match("; Comment.\n").group("comment"), " Comment.")
+        self.assertEqual(tokenizer.match(" [Section A] \n").lastgroup, "section")
+        self.assertEqual(tokenizer.match(" [Section A] \n").group("section"), "Section A")
+        self.assertEqual(tokenizer.match(" \n").lastgroup, "empty")
+        self.assertEqual(tokenizer.match("Attribute 1 = Value A\n").lastgroup, "value")
+        self.assertEqual(tokenizer.match("Attribute 1 = Value A\n").group("attribute", "value"),
+                         ("Attribute 1 ", " Value A"))
+        self.assertEqual(tokenizer.match("Attribute 1 =\n").lastgroup, "attribute")
+        self.assertEqual(tokenizer.match("Attribute 1: Value = A\n").group("value"), " Value = A")
+        self.assertIsNone(tokenizer.match("Invalid attribute\n"))
+        self.assertIsNone(tokenizer.match(";\n"))
+
+        tokenizer = foundations.parsers.get_sections_file_tokenizer(("%",), ("@",))
+        self.assertEqual(tokenizer.match("% Comment.\n").lastgroup, "comment")
+        self.assertEqual(tokenizer.match("Attribute 1 @ Value A\n").lastgroup, "value")
+        self.assertIsNone(tokenizer.match("Attribute 1 = Value A\n"))
 
 
 class TestGetAttributeCompound(unittest.TestCase):
@@ -854,6 +1365,85 @@ class TestGetAttributeCompound(unittest.TestCase):
         self.assertEqual(compound.link, foundations.parsers.get_attribute_compound("Attribute", data).link)
 
 
+class TestGetAttributeCompounds(unittest.TestCase):
+    """
+    Defines :func:`foundations.parsers.get_attribute_compounds` definition units tests methods.
+    """
+
+    def test_get_attribute_compounds(self):
+        """
+        Tests :func:`foundations.parsers.get_attribute_compounds` definition.
+        """
+
+        attributes = {"Attribute A": "@Link | Value | Boolean | Link Parameter",
+                      "Attribute B": "@Link",
+                      "Attribute C": "Value",
+                      "Attribute D": None,
+                      "Attribute E": ["Value"]}
+        compounds = foundations.parsers.get_attribute_compounds(attributes)
+        self.assertListEqual(list(compounds), list(attributes))
+        for attribute, value in attributes.items():
+            compound = compounds[attribute]
+            self.assertIsInstance(compound, foundations.parsers.CompactAttributeCompound)
+            self.assertEqual(compound, foundations.parsers.get_attribute_compound(attribute, value))
+            self.assertEqual(compound.as_attribute_compound(),
+                             foundations.parsers.get_attribute_compound(attribute, value))
+
+        self.assertEqual(compounds["Attribute A"].type, "Boolean")
+        self.assertEqual(compounds["Attribute A"]["alias"], "Link Parameter")
+        self.assertEqual(compounds["Attribute B"].link, "@Link")
+        self.assertRaises(AttributeError, setattr, compounds["Attribute C"], "Nemo", None)
+
+        compounds = foundations.parsers.get_attribute_compounds({"Attribute": "$Link | Value | Boolean"},
+                                                                binding_identifier="\\$")
+        self.assertEqual(compounds["Attribute"].link, "$Link")
+
+
+class TestParseMany(unittest.TestCase):
+    """
+    Defines :func:`foundations.parsers.parse_many` definition units tests methods.
+    """
+
+    def test_parse_many(self):
+        """
+        Tests :func:`foundations.parsers.parse_many` definition.
+        """
+
+        paths = [COMPONENT_FILE, PARSING_ERRORS_FILE, IBL_SET_FILE, os.path.join(RESOURCES_DIRECTORY, "nemo.rc")]
+        for executor in ("thread", "process"):
+            parsers, errors = foundations.parsers.parse_many(paths, workers=2, executor=executor)
+            self.assertListEqual([parser.path for parser in parsers], paths)
+            for path, parser in zip(paths[:3], parsers):
+                sections_file_parser = SectionsFileParser(path)
+                sections_file_parser.parse(raise_parsing_errors=False)
+                self.assertEqual(parser.sections, sections_file_parser.sections)
+            self.assertListEqual(list(errors), paths[1:2] + paths[3:])
+            self.assertListEqual([error.line for error in errors[PARSING_ERRORS_FILE]],
+                                 list(PARSING_ERRORS_LINES_AND_VALUES))
+
+        parsers, errors = foundations.parsers.parse_many([RESOURCES_DIRECTORY],
+                                                         filters_in=("\\.ibl$",),
+                                                         strip_comments=False)
+        self.assertListEqual([parser.path for parser in parsers],
+                             list(foundations.walkers.files_walker(RESOURCES_DIRECTORY, ("\\.ibl$",))))
+        self.assertTrue(all(parser.comments for parser in parsers))
+
+        parsers, errors = foundations.parsers.parse_many([PLIST_FILE], parser=PlistFileParser, executor="process")
+        self.assertDictEqual(parsers[0].elements, PLIST_FILE_CONTENT)
+        self.assertFalse(errors)
+
+        def parser(path):
+            if path == IBL_SET_FILE:
+                raise ValueError(path)
+            return SectionsFileParser(path)
+
+        parsers, errors = foundations.parsers.parse_many([COMPONENT_FILE, IBL_SET_FILE], parser=parser)
+        self.assertEqual(parsers[0].path, COMPONENT_FILE)
+        self.assertIsNone(parsers[1])
+        self.assertListEqual(list(errors), [IBL_SET_FILE])
+        self.assertIsInstance(errors[IBL_SET_FILE][0], ValueError)
+
+
 if __name__ == "__main__":
     import foundations.tests.utilities
 
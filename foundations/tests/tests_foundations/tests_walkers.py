@@ -17,7 +17,10 @@
 
 import os
 import re
+import shutil
 import sys
+import tempfile
+import threading
 
 if sys.version_info[:2] <= (2, 6):
     import unittest2 as unittest
@@ -42,6 +45,11 @@ __all__ = ["RESOURCES_DIRECTORY",
            "CHINESE_ROOT_DIRECTORY",
            "CHINESE_FILES_TREE_HIERARCHY",
            "CHINESE_TREE_HIERARCHY",
+           "SCANDIR_TIMEOUT",
+           "TestCompileFilters",
+           "TestFilterPath",
+           "TestScanDirectory",
+           "TestGetAncestors",
            "TestFilesWalker",
            "TestDepthWalker",
            "TestDictionariesWalker",
@@ -66,6 +74,86 @@ CHINESE_TREE_HIERARCHY = ((["0级"], ["内容.txt"]),
                           (["1级"], ["无效.txt"]),
                           (["2级"], ["空虚.txt"]),
                           ([], ["内容.txt", "物.txt"]))
+SCANDIR_TIMEOUT = 5
+
+
+class TestCompileFilters(unittest.TestCase):
+    """
+    Defines :func:`foundations.walkers.compile_filters` definition units tests methods.
+    """
+
+    def test_compile_filters(self):
+        """
+        Tests :func:`foundations.walkers.compile_filters` definition.
+        """
+
+        self.assertListEqual(foundations.walkers.compile_filters(None), [])
+        patterns = foundations.walkers.compile_filters(("\\.ibl$", "\\.rc$"))
+        self.assertEqual(len(patterns), 1)
+        self.assertTrue(patterns[0].search("standard.rc"))
+        self.assertFalse(patterns[0].search("standard.sIBLT"))
+        self.assertEqual(len(foundations.walkers.compile_filters(("(\\.ibl)$", "\\.rc$"))), 2)
+        patterns = foundations.walkers.compile_filters(("\\.IBL$",), re.IGNORECASE)
+        self.assertTrue(patterns[0].search("standard.ibl"))
+
+
+class TestFilterPath(unittest.TestCase):
+    """
+    Defines :func:`foundations.walkers.filter_path` definition units tests methods.
+    """
+
+    def test_filter_path(self):
+        """
+        Tests :func:`foundations.walkers.filter_path` definition.
+        """
+
+        filters_in = foundations.walkers.compile_filters(("\\.ibl$", "\\.rc$"))
+        filters_out = foundations.walkers.compile_filters(("level_0",))
+        self.assertTrue(foundations.walkers.filter_path("standard.ibl"))
+        self.assertTrue(foundations.walkers.filter_path("standard.ibl", filters_in))
+        self.assertFalse(foundations.walkers.filter_path("standard.sIBLT", filters_in))
+        self.assertFalse(foundations.walkers.filter_path("level_0/standard.ibl", filters_in, filters_out))
+
+
+class TestScanDirectory(unittest.TestCase):
+    """
+    Defines :func:`foundations.walkers.scan_directory` definition units tests methods.
+    """
+
+    def test_scan_directory(self):
+        """
+        Tests :func:`foundations.walkers.scan_directory` definition.
+        """
+
+        root_directory = os.path.join(RESOURCES_DIRECTORY, ROOT_DIRECTORY)
+        files, directories = foundations.walkers.scan_directory(root_directory)
+        self.assertListEqual(sorted(os.path.basename(path) for path in files), list(TREE_HIERARCHY[0][1]))
+        self.assertListEqual([os.path.basename(path) for path in directories], TREE_HIERARCHY[0][0])
+
+        files, directories = foundations.walkers.scan_directory(
+            root_directory, foundations.walkers.compile_filters(("level_0",)))
+        self.assertListEqual(directories, [])
+
+        self.assertTupleEqual(foundations.walkers.scan_directory(os.path.join(root_directory, "nemo")), ([], []))
+
+
+class TestGetAncestors(unittest.TestCase):
+    """
+    Defines :func:`foundations.walkers.get_ancestors` definition units tests methods.
+    """
+
+    def test_get_ancestors(self):
+        """
+        Tests :func:`foundations.walkers.get_ancestors` definition.
+        """
+
+        root_directory = os.path.join(RESOURCES_DIRECTORY, ROOT_DIRECTORY)
+        ancestors = foundations.walkers.get_ancestors(root_directory, frozenset())
+        self.assertEqual(len(ancestors), 1)
+        ancestors = foundations.walkers.get_ancestors(os.path.join(root_directory, "level_0"), ancestors)
+        self.assertEqual(len(ancestors), 2)
+        self.assertIsNone(foundations.walkers.get_ancestors(root_directory, ancestors))
+        self.assertEqual(foundations.walkers.get_ancestors(root_directory, ancestors, followlinks=False), ancestors)
 
 
 class TestFilesWalker(unittest.TestCase):
@@ -131,6 +219,150 @@ class TestFilesWalker(unittest.TestCase):
              foundations.walkers.files_walker(root_directory, filters_out=("\.ibl", "\.rc$", "\.sIBLT$", "\.txt$"))]
         self.assertTrue(not walker_files)
 
+    def test_files_walker_order(self):
+        """
+        Tests :func:`foundations.walkers.files_walker` definition files order.
+        """
+
+        root_directory = os.path.join(RESOURCES_DIRECTORY, ROOT_DIRECTORY)
+        reference_paths = [foundations.strings.to_forward_slashes(os.path.join(parent, file))
+                           for parent, directories, files in os.walk(root_directory, topdown=False, followlinks=True)
+                           for file in files]
+        self.assertListEqual(list(foundations.walkers.files_walker(root_directory)), reference_paths)
+
+    def test_files_walker_filters(self):
+        """
+        Tests :func:`foundations.walkers.files_walker` definition filters.
+        """
+
+        root_directory = os.path.join(RESOURCES_DIRECTORY, ROOT_DIRECTORY)
+        walker_files = [os.path.basename(path)
+                        for path in foundations.walkers.files_walker(root_directory, filters_in=("\.rc$", "\.ibl$"))]
+        self.assertListEqual(sorted(walker_files), ["standard.ibl", "standard.ibl", "standard.rc", "standard.rc"])
+
+        walker_files = [os.path.basename(path)
+                        for path in foundations.walkers.files_walker(root_directory,
+                                                                     filters_in=("standard\.(rc|ibl)$",),
+                                                                     filters_out=("level_0", r"(\w+)_ipsum"))]
+        self.assertListEqual(sorted(walker_files), ["standard.ibl", "standard.rc"])
+
+        walker_files = [os.path.basename(path)
+                        for path in foundations.walkers.files_walker(root_directory,
+                                                                     filters_in=("STANDARD\.SIBLT$",),
+                                                                     flags=re.IGNORECASE)]
+        self.assertListEqual(walker_files, ["standard.sIBLT", "standard.sIBLT"])
+
+    def test_files_walker_directories_filters_out(self):
+        """
+        Tests :func:`foundations.walkers.files_walker` definition directories pruning.
+        """
+
+        root_directory = os.path.join(RESOURCES_DIRECTORY, ROOT_DIRECTORY)
+        walker_files = [foundations.strings.replace(path, {root_directory.replace("\\", "/") + "/": ""})
+                        for path in foundations.walkers.files_walker(root_directory,
+                                                                     directories_filters_out=("level_1$",))]
+        self.assertListEqual(sorted(walker_files),
+                             ["level_0/standard.ibl",
+                              "lorem_ipsum.txt",
+                              "standard.ibl",
+                              "standard.rc",
+                              "standard.sIBLT"])
+
+    def test_files_walker_workers(self):
+        """
+        Tests :func:`foundations.walkers.files_walker` definition concurrent walk.
+        """
+
+        root_directory = os.path.join(RESOURCES_DIRECTORY, ROOT_DIRECTORY)
+        reference_paths = list(foundations.walkers.files_walker(root_directory, filters_out=("\.rc$",)))
+        self.assertListEqual(list(foundations.walkers.files_walker(root_directory, filters_out=("\.rc$",), workers=4)),
+                             reference_paths)
+        self.assertListEqual(sorted(foundations.walkers.files_walker(root_directory,
+                                                                     filters_out=("\.rc$",),
+                                                                     workers=4,
+                                                                     ordered=False)),
+                             sorted(reference_paths))
+
+        walker = foundations.walkers.files_walker(root_directory, workers=4, ordered=False)
+        self.assertTrue(os.path.exists(next(walker)))
+        walker.close()
+
+    def test_files_walker_workers_concurrency(self):
+        """
+        Tests :func:`foundations.walkers.files_walker` definition concurrent directories listing.
+        """
+
+        directory = tempfile.mkdtemp()
+        scandir = os.scandir
+        barrier = threading.Barrier(4, timeout=SCANDIR_TIMEOUT)
+
+        def synchronized_scandir(path):
+            # Sibling directories listings only proceed once all of them are in flight.
+            if os.path.basename(os.path.dirname(path)) == os.path.basename(directory):
+                barrier.wait()
+            return scandir(path)
+
+        try:
+            for i in range(4):
+                os.makedirs(os.path.join(directory, "directory_{0}".format(i)))
+                open(os.path.join(directory, "directory_{0}".format(i), "file.txt"), "w").close()
+            reference_paths = list(foundations.walkers.files_walker(directory))
+
+            os.scandir = synchronized_scandir
+            walker_files = list(foundations.walkers.files_walker(directory, workers=4))
+            barrier.reset()
+            unordered_walker_files = list(foundations.walkers.files_walker(directory, workers=4, ordered=False))
+        finally:
+            os.scandir = scandir
+            shutil.rmtree(directory)
+
+        self.assertEqual(len(reference_paths), 4)
+        self.assertListEqual(walker_files, reference_paths)
+        self.assertListEqual(sorted(unordered_walker_files), sorted(reference_paths))
+
+    def test_files_walker_workers_errors(self):
+        """
+        Tests :func:`foundations.walkers.files_walker` definition concurrent walk errors propagation.
+        """
+
+        root_directory = os.path.join(RESOURCES_DIRECTORY, ROOT_DIRECTORY)
+        scan_directory = foundations.walkers.scan_directory
+
+        def failing_scan_directory(directory, *args):
+            if os.path.basename(directory) == "level_1":
+                raise ValueError(directory)
+            return scan_directory(directory, *args)
+
+        try:
+            foundations.walkers.scan_directory = failing_scan_directory
+            for ordered in (True, False):
+                walker = foundations.walkers.files_walker(root_directory, workers=4, ordered=ordered)
+                self.assertRaises(ValueError, list, walker)
+        finally:
+            foundations.walkers.scan_directory = scan_directory
+
+    @unittest.skipIf(not hasattr(os, "symlink") or sys.platform == "win32", "Symbolic links are not available!")
+    def test_files_walker_cycles(self):
+        """
+        Tests :func:`foundations.walkers.files_walker` definition symbolic links cycles protection.
+        """
+
+        directory = tempfile.mkdtemp()
+        try:
+            os.makedirs(os.path.join(directory, "level_0"))
+            open(os.path.join(directory, "level_0", "file.txt"), "w").close()
+            os.symlink(directory, os.path.join(directory, "level_0", "cycle"))
+            for workers in (None, 4):
+                walker_files = list(foundations.walkers.files_walker(directory, workers=workers))
+                self.assertListEqual(walker_files,
+                                     [foundations.strings.to_forward_slashes(
+                                         os.path.join(directory, "level_0", "file.txt"))])
+
+                walker_files = list(foundations.walkers.files_walker(directory, followlinks=False, workers=workers))
+                self.assertEqual(len(walker_files), 1)
+        finally:
+            shutil.rmtree(directory)
+
 
 class TestDepthWalker(unittest.TestCase):
     """
@@ -160,6 +392,72 @@ class TestDepthWalker(unittest.TestCase):
             self.assertEqual(
                 (directories, sorted(files)), (CHINESE_TREE_HIERARCHY[i][0], sorted(CHINESE_TREE_HIERARCHY[i][1])))
 
+    def test_depth_walker_pruning(self):
+        """
+        Tests :func:`foundations.walkers.depth_walker` definition directories pruning.
+        """
+
+        root_directory = os.path.join(RESOURCES_DIRECTORY, ROOT_DIRECTORY)
+        scandir = os.scandir
+        listed_directories = []
+
+        def recording_scandir(path):
+            listed_directories.append(path)
+            return scandir(path)
+
+        for maximum_depth in range(4):
+            del listed_directories[:]
+            try:
+                os.scandir = recording_scandir
+                items = list(foundations.walkers.depth_walker(root_directory, maximum_depth))
+            finally:
+                os.scandir = scandir
+
+            self.assertEqual(len(items), maximum_depth + 1)
+            self.assertListEqual(listed_directories, [item[0] for item in items])
+            self.assertListEqual(items[-1][1], TREE_HIERARCHY[maximum_depth][0])
+
+        for entries in (False, True):
+            del listed_directories[:]
+            try:
+                os.scandir = recording_scandir
+                for parent_directory, directories, files in foundations.walkers.depth_walker(root_directory,
+                                                                                             3,
+                                                                                             entries=entries):
+                    del directories[:]
+            finally:
+                os.scandir = scandir
+
+            self.assertListEqual(listed_directories, [root_directory])
+
+    def test_depth_walker_breadth_first(self):
+        """
+        Tests :func:`foundations.walkers.depth_walker` definition breadth first order.
+        """
+
+        directory = tempfile.mkdtemp()
+        try:
+            for path in ("a/a_a", "a/a_b", "b/b_a"):
+                os.makedirs(os.path.join(directory, path))
+
+            depths = [os.path.relpath(parent_directory, directory).count(os.sep) + 1
+                      for parent_directory, directories, files in foundations.walkers.depth_walker(directory, 2)][1:]
+            self.assertListEqual(depths, [1, 1, 2, 2, 2])
+        finally:
+            shutil.rmtree(directory)
+
+    def test_depth_walker_entries(self):
+        """
+        Tests :func:`foundations.walkers.depth_walker` definition :class:`os.DirEntry` output.
+        """
+
+        root_directory = os.path.join(RESOURCES_DIRECTORY, ROOT_DIRECTORY)
+        parent_directory, directories, files = next(foundations.walkers.depth_walker(root_directory, entries=True))
+        self.assertListEqual([entry.name for entry in directories], TREE_HIERARCHY[0][0])
+        self.assertListEqual(sorted(entry.name for entry in files), sorted(TREE_HIERARCHY[0][1]))
+        for entry in files:
+            self.assertEqual(entry.stat().st_size, os.path.getsize(entry.path))
+
 
 class TestDictionariesWalker(unittest.TestCase):
     """
@@ -182,6 +480,77 @@ class TestDictionariesWalker(unittest.TestCase):
             self.assertIsInstance(key, str)
             self.assertIsInstance(value, str)
 
+        self.assertListEqual(list(foundations.walkers.dictionaries_walker(nested_dictionary, ("Root",))),
+                             [(("Root", "Level 1A", "Level 2A"), "Level 3A", "Higher Level"),
+                              (("Root",), "Level 1B", "Lower level")])
+
+    def test_dictionaries_walker_depth(self):
+        """
+        Tests :func:`foundations.walkers.dictionaries_walker` definition with nesting deeper than the recursion limit.
+        """
+
+        depth = sys.getrecursionlimit() * 2
+        nested_dictionary = dictionary = {}
+        for i in range(depth):
+            dictionary["Level {0}".format(i)] = dictionary = {}
+        dictionary["Leaf"] = "Value"
+
+        path, key, value = next(foundations.walkers.dictionaries_walker(nested_dictionary))
+        self.assertEqual(len(path), depth)
+        self.assertEqual((path[-1], key, value), ("Level {0}".format(depth - 1), "Leaf", "Value"))
+
+    def test_dictionaries_walker_predicates(self):
+        """
+        Tests :func:`foundations.walkers.dictionaries_walker` definition include and exclude predicates.
+        """
+
+        nested_dictionary = {"Level 1A": {"Level 2A": {"Level 3A": "Higher Level"}, "Level 2B": "Value"},
+                             "Level 1B": "Lower level"}
+        visited_keys = []
+
+        def include(path, key):
+            visited_keys.append(key)
+            return key != "Level 2A"
+
+        self.assertListEqual(list(foundations.walkers.dictionaries_walker(nested_dictionary, include=include)),
+                             [(("Level 1A",), "Level 2B", "Value"), ((), "Level 1B", "Lower level")])
+        self.assertNotIn("Level 3A", visited_keys)
+
+        self.assertListEqual(list(foundations.walkers.dictionaries_walker(nested_dictionary,
+                                                                          exclude=lambda path, key: not path)),
+                             [])
+        self.assertListEqual(list(foundations.walkers.dictionaries_walker(nested_dictionary,
+                                                                          exclude=lambda path, key: key == "Level 1A")),
+                             [((), "Level 1B", "Lower level")])
+
+    def test_dictionaries_walker_yield_dictionaries(self):
+        """
+        Tests :func:`foundations.walkers.dictionaries_walker` definition dictionaries yielding.
+        """
+
+        nested_dictionary = {"Level 1A": {"Level 2A": {"Level 3A": "Higher Level"}}, "Level 1C": {}}
+        self.assertListEqual(list(foundations.walkers.dictionaries_walker(nested_dictionary, yield_dictionaries=True)),
+                             [((), "Level 1A", {"Level 2A": {"Level 3A": "Higher Level"}}),
+                              (("Level 1A",), "Level 2A", {"Level 3A": "Higher Level"}),
+                              (("Level 1A", "Level 2A"), "Level 3A", "Higher Level"),
+                              ((), "Level 1C", {})])
+
+    def test_dictionaries_walker_shared_path(self):
+        """
+        Tests :func:`foundations.walkers.dictionaries_walker` definition shared path.
+        """
+
+        nested_dictionary = {"Level 1A": {"Level 2A": {"Level 3A": "Higher Level"}, "Level 2B": "Value"},
+                             "Level 1B": "Lower level"}
+        paths = set()
+        values = []
+        for path, key, value in foundations.walkers.dictionaries_walker(nested_dictionary, shared_path=True):
+            self.assertIsInstance(path, list)
+            paths.add(id(path))
+            values.append((tuple(path), key, value))
+        self.assertEqual(len(paths), 1)
+        self.assertListEqual(values, list(foundations.walkers.dictionaries_walker(nested_dictionary)))
+
 
 class TestNodesWalker(unittest.TestCase):
     """
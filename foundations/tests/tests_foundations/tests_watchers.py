@@ -0,0 +1,265 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**tests_watchers.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines units tests for :mod:`foundations.watchers` module.
+
+**Others:**
+
+"""
+
+
+
+import os
+import platform
+import shutil
+import sys
+import tempfile
+
+if sys.version_info[:2] <= (2, 6):
+    import unittest2 as unittest
+else:
+    import unittest
+
+import foundations.exceptions
+import foundations.strings
+import foundations.watchers
+from foundations.indexes import ADDED
+from foundations.indexes import MODIFIED
+from foundations.indexes import REMOVED
+from foundations.watchers import FilesWatcher
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["EVENTS_TIMEOUT",
+           "TestGetInotifyLibrary",
+           "TestCoalesceEvents",
+           "TestFilesWatcher"]
+
+EVENTS_TIMEOUT = 5
+
+
+class TestGetInotifyLibrary(unittest.TestCase):
+    """
+    Defines :func:`foundations.watchers.get_inotify_library` definition units tests methods.
+    """
+
+    def test_get_inotify_library(self):
+        """
+        Tests :func:`foundations.watchers.get_inotify_library` definition.
+        """
+
+        library = foundations.watchers.get_inotify_library()
+        if platform.system() != "Linux":
+            self.assertIsNone(library)
+            return
+
+        self.assertIs(library, foundations.watchers.get_inotify_library())
+        for function in foundations.watchers.INOTIFY_FUNCTIONS:
+            self.assertTrue(hasattr(library, function.name))
+
+
+class TestCoalesceEvents(unittest.TestCase):
+    """
+    Defines :func:`foundations.watchers.coalesce_events` definition units tests methods.
+    """
+
+    def test_coalesce_events(self):
+        """
+        Tests :func:`foundations.watchers.coalesce_events` definition.
+        """
+
+        self.assertListEqual(foundations.watchers.coalesce_events([]), [])
+        self.assertListEqual(foundations.watchers.coalesce_events([(ADDED, "a"),
+                                                                   (MODIFIED, "b"),
+                                                                   (MODIFIED, "a"),
+                                                                   (MODIFIED, "b"),
+                                                                   (REMOVED, "c"),
+                                                                   (ADDED, "c"),
+                                                                   (ADDED, "d"),
+                                                                   (REMOVED, "d"),
+                                                                   (MODIFIED, "e"),
+                                                                   (REMOVED, "e")]),
+                             [(ADDED, "a"), (MODIFIED, "b"), (MODIFIED, "c"), (REMOVED, "e")])
+
+
+class TestFilesWatcher(unittest.TestCase):
+    """
+    Defines :class:`foundations.watchers.FilesWatcher` class units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initializes the tests directories.
+        """
+
+        self.__directory = foundations.strings.to_forward_slashes(tempfile.mkdtemp())
+        os.makedirs(os.path.join(self.__directory, "level_0"))
+        self.__write_file("level_0/standard.ibl", "")
+
+    def tearDown(self):
+        """
+        Removes the tests directories.
+        """
+
+        shutil.rmtree(self.__directory)
+
+    def __write_file(self, path, content, mode="w"):
+        """
+        Writes given content into given tree file.
+
+        :param path: File path relative to the tree root directory.
+        :type path: unicode
+        :param content: Content.
+        :type content: unicode
+        :param mode: File write mode.
+        :type mode: unicode
+        :return: File path.
+        :rtype: unicode
+        """
+
+        path = "/".join((self.__directory, path))
+        with open(path, mode) as file:
+            file.write(content)
+        return path
+
+    def __test_backend(self, backend):
+        """
+        Tests given :class:`foundations.watchers.FilesWatcher` class backend.
+
+        :param backend: Backend.
+        :type backend: unicode
+        """
+
+        files_watcher = FilesWatcher(self.__directory, ("\.ibl$",), backend=backend, polling_interval=0.05)
+        self.assertTrue(files_watcher.start())
+        self.assertTrue(files_watcher.is_running())
+        try:
+            self.assertListEqual(files_watcher.get_events(timeout=0.1), [])
+
+            added_path = self.__write_file("level_0/added.ibl", "Content")
+            self.__write_file("level_0/added.ibl", "Content", "a")
+            self.__write_file("level_0/filtered.txt", "Content")
+            self.assertListEqual(files_watcher.get_events(timeout=EVENTS_TIMEOUT), [(ADDED, added_path)])
+
+            modified_path = self.__write_file("level_0/standard.ibl", "Modified content.")
+            self.assertListEqual(files_watcher.get_events(timeout=EVENTS_TIMEOUT), [(MODIFIED, modified_path)])
+
+            os.makedirs(os.path.join(self.__directory, "level_0", "level_1", "level_2"))
+            nested_path = self.__write_file("level_0/level_1/level_2/nested.ibl", "Content")
+            self.assertListEqual(files_watcher.get_events(timeout=EVENTS_TIMEOUT), [(ADDED, nested_path)])
+
+            os.remove(added_path)
+            self.assertListEqual(files_watcher.get_events(timeout=EVENTS_TIMEOUT), [(REMOVED, added_path)])
+        finally:
+            self.assertTrue(files_watcher.stop())
+
+        self.assertFalse(files_watcher.is_running())
+        self.assertFalse(files_watcher.stop())
+        self.assertListEqual(list(files_watcher.watch()), [])
+        self.assertListEqual(files_watcher.get_events(), [])
+
+    @unittest.skipIf(foundations.watchers.get_inotify_library() is None, "Inotify is not available!")
+    def test_inotify_backend(self):
+        """
+        Tests :class:`foundations.watchers.FilesWatcher` class inotify backend.
+        """
+
+        self.__test_backend("inotify")
+
+    def test_polling_backend(self):
+        """
+        Tests :class:`foundations.watchers.FilesWatcher` class polling backend.
+        """
+
+        self.__test_backend("polling")
+
+    def __test_backend_directory_removal(self, backend):
+        """
+        Tests given :class:`foundations.watchers.FilesWatcher` class backend watched directory removal.
+
+        :param backend: Backend.
+        :type backend: unicode
+        """
+
+        directory = "/".join((self.__directory, "level_0"))
+        files_watcher = FilesWatcher(directory, backend=backend, polling_interval=0.05)
+        self.assertTrue(files_watcher.start())
+        try:
+            shutil.rmtree(directory)
+            events = files_watcher.get_events(timeout=EVENTS_TIMEOUT)
+            self.assertListEqual(events, [(REMOVED, "/".join((directory, "standard.ibl")))])
+            self.assertRaises(foundations.exceptions.DirectoryExistsError,
+                              files_watcher.get_events,
+                              timeout=EVENTS_TIMEOUT)
+            self.assertFalse(files_watcher.is_running())
+            self.assertListEqual(files_watcher.get_events(), [])
+        finally:
+            files_watcher.stop()
+
+        self.assertRaises(foundations.exceptions.DirectoryExistsError, files_watcher.start)
+        self.assertFalse(files_watcher.is_running())
+
+    @unittest.skipIf(foundations.watchers.get_inotify_library() is None, "Inotify is not available!")
+    def test_inotify_backend_directory_removal(self):
+        """
+        Tests :class:`foundations.watchers.FilesWatcher` class inotify backend watched directory removal.
+        """
+
+        self.__test_backend_directory_removal("inotify")
+
+    def test_polling_backend_directory_removal(self):
+        """
+        Tests :class:`foundations.watchers.FilesWatcher` class polling backend watched directory removal.
+        """
+
+        self.__test_backend_directory_removal("polling")
+
+    @unittest.skipIf(foundations.watchers.get_inotify_library() is None, "Inotify is not available!")
+    def test_inotify_backend_initialization_failure(self):
+        """
+        Tests :class:`foundations.watchers.FilesWatcher` class inotify backend initialization failure.
+        """
+
+        class FailingLibrary(object):
+            def inotify_init1(self, flags):
+                return -1
+
+        library = foundations.watchers.get_inotify_library()
+        try:
+            foundations.watchers._INOTIFY_LIBRARY = FailingLibrary()
+            files_watcher = FilesWatcher(self.__directory, backend="inotify")
+            self.assertRaises(foundations.exceptions.LibraryExecutionError, files_watcher.start)
+            self.assertFalse(files_watcher.is_running())
+        finally:
+            foundations.watchers._INOTIFY_LIBRARY = library
+
+    def test_watch(self):
+        """
+        Tests :meth:`foundations.watchers.FilesWatcher.watch` method.
+        """
+
+        files_watcher = FilesWatcher(self.__directory, polling_interval=0.05)
+        files_watcher.start()
+        try:
+            added_path = self.__write_file("level_0/added.rc", "Content")
+            self.assertListEqual(next(files_watcher.watch()), [(ADDED, added_path)])
+        finally:
+            files_watcher.stop()
+
+
+if __name__ == "__main__":
+    import foundations.tests.utilities
+
+    unittest.main()
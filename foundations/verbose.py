@@ -105,7 +105,7 @@ def _LogRecord__getattribute__(self, attribute):
         thread_ident = threading.currentThread().ident
         if not thread_ident in THREADS_IDENTIFIERS:
             THREADS_IDENTIFIERS[thread_ident] = (threading.currentThread().name,
-                                                 hashlib.md5(threading.currentThread().name).hexdigest()[:8])
+                                                 hashlib.md5(threading.currentThread().name.encode("utf-8")).hexdigest()[:8])
         object.__getattribute__(self, attribute)["threadName"] = THREADS_IDENTIFIERS[thread_ident][1]
         return object.__getattribute__(self, attribute)
     else:
@@ -16,7 +16,12 @@
 
 
 
+import collections
+import concurrent.futures
 import os
+import queue
+import re
+import threading
 
 import foundations.strings
 import foundations.verbose
@@ -28,14 +33,261 @@ __maintainer__ = "Thomas Mansencal"
 __email__ = "thomas.mansencal@gmail.com"
 __status__ = "Production"
 
-__all__ = ["LOGGER", "files_walker", "depth_walker", "dictionaries_walker", "nodes_walker"]
+__all__ = ["LOGGER",
+           "WORKERS",
+           "compile_filters",
+           "filter_path",
+           "scan_directory",
+           "get_ancestors",
+           "files_walker",
+           "depth_walker",
+           "dictionaries_walker",
+           "nodes_walker"]
 
 LOGGER = foundations.verbose.install_logger()
 
+WORKERS = 16
 
-def files_walker(directory, filters_in=None, filters_out=None, flags=0):
+
+def compile_filters(filters, flags=0):
+    """
+    Compiles given regex filters, filters without groups are combined into a single alternation pattern.
+
+    :param filters: Regex filters.
+    :type filters: tuple or list
+    :param flags: Regex flags.
+    :type flags: int
+    :return: Compiled patterns.
+    :rtype: list
+    """
+
+    if not filters:
+        return []
+
+    patterns = [re.compile(filter, flags) for filter in filters]
+    if len(patterns) > 1 and not any(pattern.groups for pattern in patterns):
+        try:
+            return [re.compile("|".join("(?:{0})".format(filter) for filter in filters), flags)]
+        except re.error:
+            pass
+    return patterns
+
+
+def filter_path(path, filters_in=None, filters_out=None):
+    """
+    Returns if given path matches given compiled filters.
+
+    :param path: Path.
+    :type path: unicode
+    :param filters_in: Compiled patterns the path must match.
+    :type filters_in: list
+    :param filters_out: Compiled patterns the path must not match.
+    :type filters_out: list
+    :return: Path matches.
+    :rtype: bool
+    """
+
+    if filters_in and not any(pattern.search(path) for pattern in filters_in):
+        return False
+
+    return not (filters_out and any(pattern.search(path) for pattern in filters_out))
+
+
+def scan_directory(directory, directories_filters_out=None, followlinks=True):
+    """
+    Scans given directory and returns its files paths and its sub directories paths.
+
+    :param directory: Directory to scan.
+    :type directory: unicode
+    :param directories_filters_out: Compiled patterns matched against directories paths to skip.
+    :type directories_filters_out: list
+    :param followlinks: Symbolic links to directories are followed.
+    :type followlinks: bool
+    :return: Files, directories.
+    :rtype: tuple
     """
-    Defines a generator used to walk files using given filters.
+
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return [], []
+
+    files, directories = [], []
+    for entry in entries:
+        try:
+            is_directory = entry.is_dir(follow_symlinks=followlinks)
+        except OSError:
+            is_directory = False
+
+        if is_directory:
+            if not directories_filters_out or \
+                    not any(pattern.search(entry.path.replace("\\", "/")) for pattern in directories_filters_out):
+                directories.append(entry.path)
+            continue
+
+        try:
+            if entry.is_file():
+                files.append(entry.path.replace("\\", "/"))
+        except OSError:
+            continue
+    return files, directories
+
+
+def get_ancestors(directory, ancestors, followlinks=True, stat=None):
+    """
+    Returns given directory ancestors identities including its own or None if the directory is one of its ancestors,
+    i.e. a symbolic link cycle.
+
+    :param directory: Directory.
+    :type directory: unicode
+    :param ancestors: Parent directory ancestors identities.
+    :type ancestors: frozenset
+    :param followlinks: Symbolic links to directories are followed.
+    :type followlinks: bool
+    :param stat: Directory stat, taken if not given.
+    :type stat: os.stat_result
+    :return: Ancestors identities.
+    :rtype: frozenset
+    """
+
+    if not followlinks:
+        return ancestors
+
+    if stat is None:
+        try:
+            stat = os.stat(directory)
+        except OSError:
+            return ancestors
+
+    identity = (stat.st_dev, stat.st_ino)
+    if identity in ancestors:
+        LOGGER.debug("> Skipping '{0}' directory symbolic link cycle.".format(directory))
+        return
+    return ancestors | frozenset((identity,))
+
+
+def _scandir_walker(directory, directories_filters_out=None, followlinks=True):
+    """
+    Defines a generator used to recursively walk given directory files, bottom-up, in :func:`os.walk`
+        definition order.
+
+    :param directory: Directory to recursively walk.
+    :type directory: unicode
+    :param directories_filters_out: Compiled patterns matched against directories paths to skip.
+    :type directories_filters_out: list
+    :param followlinks: Symbolic links to directories are followed.
+    :type followlinks: bool
+    :return: File.
+    :rtype: unicode
+    """
+
+    stack = [(directory, frozenset(), None)]
+    while stack:
+        path, ancestors, files = stack.pop()
+        if files is not None:
+            for file in files:
+                yield file
+            continue
+
+        ancestors = get_ancestors(path, ancestors, followlinks)
+        if ancestors is None:
+            continue
+
+        files, directories = scan_directory(path, directories_filters_out, followlinks)
+        stack.append((path, ancestors, files))
+        stack.extend((directory, ancestors, None) for directory in reversed(directories))
+
+
+def _parallel_scandir_walker(directory, directories_filters_out=None, followlinks=True, workers=WORKERS,
+                             ordered=True):
+    """
+    | Defines a generator used to recursively walk given directory files, sub directories are scanned
+        concurrently by a bounded threads pool.
+    | Ordered files are yielded in :func:`os.walk` bottom-up definition order, unordered files are yielded
+        as soon as their directory has been scanned.
+
+    :param directory: Directory to recursively walk.
+    :type directory: unicode
+    :param directories_filters_out: Compiled patterns matched against directories paths to skip.
+    :type directories_filters_out: list
+    :param followlinks: Symbolic links to directories are followed.
+    :type followlinks: bool
+    :param workers: Threads pool workers count.
+    :type workers: int
+    :param ordered: Files are yielded in :func:`os.walk` bottom-up definition order.
+    :type ordered: bool
+    :return: File.
+    :rtype: unicode
+    """
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+    results = queue.Queue()
+    cancelled = threading.Event()
+
+    def scan(path, ancestors):
+        files, directories, children, error = [], [], [], None
+        try:
+            ancestors = get_ancestors(path, ancestors, followlinks)
+            if ancestors is not None and not cancelled.is_set():
+                files, directories = scan_directory(path, directories_filters_out, followlinks)
+        except BaseException as exception:
+            error = exception
+            raise
+        finally:
+            # Results are queued before sub directories are submitted so that they precede their children ones,
+            # a failed scan queues its exception so that the consumer never waits for it.
+            if not ordered:
+                results.put((files, len(directories), error))
+
+        try:
+            children = [executor.submit(scan, directory, ancestors) for directory in directories]
+        except RuntimeError:
+            pass
+        return files, children
+
+    try:
+        future = executor.submit(scan, directory, frozenset())
+        if ordered:
+            stack = [(future, None)]
+            while stack:
+                future, files = stack.pop()
+                if files is not None:
+                    for file in files:
+                        yield file
+                    continue
+
+                files, children = future.result()
+                stack.append((None, files))
+                stack.extend((child, None) for child in reversed(children))
+        else:
+            pending = 1
+            while pending:
+                files, children, error = results.get()
+                if error is not None:
+                    raise error
+
+                pending += children - 1
+                for file in files:
+                    yield file
+    finally:
+        cancelled.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def files_walker(directory,
+                 filters_in=None,
+                 filters_out=None,
+                 flags=0,
+                 directories_filters_out=None,
+                 followlinks=True,
+                 workers=None,
+                 ordered=True):
+    """
+    | Defines a generator used to walk files using given filters.
+    | The filters are compiled once and matched against the forward slashes files paths, directories
+        matching given directories filters out are pruned and not walked.
+    | Given workers count higher than 1, sub directories are scanned concurrently by a bounded threads pool,
+        which hides the listing latency of network mounted storages. Symbolic links cycles are never walked.
 
     Usage::
 
@@ -50,15 +302,32 @@ def files_walker(directory, filters_in=None, filters_out=None, flags=0):
         ...     print(file)
         ...
         ./foundations/tests/tests_foundations/resources/standard/level_0/level_1/level_2/standard.sIBLT
+        >>> for file in files_walker("./foundations/tests/tests_foundations/resources/standard",
+        ...                          directories_filters_out=("level_1$",)):
+        ...     print(file)
+        ...
+        ./foundations/tests/tests_foundations/resources/standard/level_0/standard.ibl
+        ./foundations/tests/tests_foundations/resources/standard/standard.rc
+        ./foundations/tests/tests_foundations/resources/standard/lorem_ipsum.txt
+        ./foundations/tests/tests_foundations/resources/standard/standard.ibl
+        ./foundations/tests/tests_foundations/resources/standard/standard.sIBLT
 
     :param directory: Directory to recursively walk.
     :type directory: unicode
     :param filters_in: Regex filters in list.
     :type filters_in: tuple or list
-    :param filters_in: Regex filters out list.
-    :type filters_in: tuple or list
+    :param filters_out: Regex filters out list.
+    :type filters_out: tuple or list
     :param flags: Regex flags.
     :type flags: int
+    :param directories_filters_out: Regex filters out list matched against directories paths.
+    :type directories_filters_out: tuple or list
+    :param followlinks: Symbolic links to directories are followed.
+    :type followlinks: bool
+    :param workers: Threads pool workers count, sub directories are scanned concurrently if higher than 1.
+    :type workers: int
+    :param ordered: Concurrently scanned files are yielded in serial walk order rather than as they arrive.
+    :type ordered: bool
     :return: File.
     :rtype: unicode
     """
@@ -69,22 +338,32 @@ def files_walker(directory, filters_in=None, filters_out=None, flags=0):
     if filters_out:
         LOGGER.debug("> Current filters out: '{0}'.".format(filters_out))
 
-    for parent_directory, directories, files in os.walk(directory, topdown=False, followlinks=True):
-        for file in files:
-            LOGGER.debug("> Current file: '{0}' in '{1}'.".format(file, directory))
-            path = foundations.strings.to_forward_slashes(os.path.join(parent_directory, file))
-            if os.path.isfile(path):
-                if not foundations.strings.filter_words((path,), filters_in, filters_out, flags):
-                    continue
+    if directories_filters_out:
+        LOGGER.debug("> Current directories filters out: '{0}'.".format(directories_filters_out))
+
+    filters_in = compile_filters(filters_in, flags)
+    filters_out = compile_filters(filters_out, flags)
+    directories_filters_out = compile_filters(directories_filters_out, flags)
 
-                LOGGER.debug("> '{0}' file filtered in!".format(path))
+    if workers and workers > 1:
+        walker = _parallel_scandir_walker(directory, directories_filters_out, followlinks, workers, ordered)
+    else:
+        walker = _scandir_walker(directory, directories_filters_out, followlinks)
 
-                yield path
+    for path in walker:
+        if filter_path(path, filters_in, filters_out):
+            yield path
 
 
-def depth_walker(directory, maximum_depth=1):
+def depth_walker(directory, maximum_depth=1, followlinks=False, entries=False):
     """
-    Defines a generator used to walk into directories using given maximum depth.
+    | Defines a generator used to walk into directories using given maximum depth.
+    | The directories are walked breadth first, their depth is tracked numerically from given directory
+        at depth 0 and directories deeper than the maximum depth are never listed.
+    | Given entries, the directories and files are yielded as :class:`os.DirEntry` instances whose cached
+        type and stat data avoid further system calls.
+    | Like with :func:`os.walk` definition, the yielded directories list can be modified in place to prune the
+        directories walked next.
 
     Usage::
 
@@ -104,22 +383,67 @@ def depth_walker(directory, maximum_depth=1):
     :type directory: unicode
     :param maximum_depth: Maximum depth.
     :type maximum_depth: int
+    :param followlinks: Symbolic links to directories are walked.
+    :type followlinks: bool
+    :param entries: Directories and files are yielded as :class:`os.DirEntry` instances rather than names.
+    :type entries: bool
     :return: Parent directory, directories, files.
     :rtype: tuple
     """
 
-    separator = os.path.sep
-    base_depth = directory.count(separator)
+    directories_queue = collections.deque(((directory, 0),))
+    while directories_queue:
+        parent_directory, depth = directories_queue.popleft()
+        try:
+            iterator = os.scandir(parent_directory)
+        except OSError:
+            continue
 
-    for parent_directory, directories, files in os.walk(directory):
-        yield parent_directory, directories, files
-        if base_depth + maximum_depth <= parent_directory.count(separator):
-            del directories[:]
+        directories, files = [], []
+        with iterator:
+            for entry in iterator:
+                try:
+                    is_directory = entry.is_dir()
+                except OSError:
+                    is_directory = False
+                (directories if is_directory else files).append(entry)
+
+        if entries:
+            yielded_directories = directories
+            yield parent_directory, yielded_directories, files
+        else:
+            yielded_directories = [entry.name for entry in directories]
+            yield parent_directory, yielded_directories, [entry.name for entry in files]
 
+        if depth >= maximum_depth:
+            continue
 
-def dictionaries_walker(dictionary, path=()):
+        directories_entries = dict((entry.name, entry) for entry in directories)
+        for item in yielded_directories:
+            entry = item if entries else directories_entries.get(item)
+            try:
+                if entry is None:
+                    path = os.path.join(parent_directory, item)
+                    is_symlink = os.path.islink(path)
+                else:
+                    path, is_symlink = entry.path, entry.is_symlink()
+            except OSError:
+                continue
+
+            if followlinks or not is_symlink:
+                directories_queue.append((path, depth + 1))
+
+
+def dictionaries_walker(dictionary,
+                        path=(),
+                        include=None,
+                        exclude=None,
+                        yield_dictionaries=False,
+                        shared_path=False):
     """
-    Defines a generator used to walk into nested dictionaries.
+    | Defines a generator used to walk into nested dictionaries.
+    | The dictionaries are walked depth first with an explicit stack, nesting depth is thus not bound by
+        the interpreter recursion limit. Each nested dictionary path is built once and shared by its values.
 
     Usage::
 
@@ -130,24 +454,63 @@ def dictionaries_walker(dictionary, path=()):
         ...	print value
         (('Level 1A', 'Level 2A'), 'Level 3A', 'Higher Level')
         ((), 'Level 1B', 'Lower level')
+        >>> for value in dictionaries_walker(nested_dictionary, exclude=lambda path, key: key == "Level 1A"):
+        ...	print value
+        ((), 'Level 1B', 'Lower level')
+        >>> for value in dictionaries_walker(nested_dictionary, yield_dictionaries=True):
+        ...	print value
+        ((), 'Level 1A', {'Level 2A': {'Level 3A': 'Higher Level'}})
+        (('Level 1A',), 'Level 2A', {'Level 3A': 'Higher Level'})
+        (('Level 1A', 'Level 2A'), 'Level 3A', 'Higher Level')
+        ((), 'Level 1B', 'Lower level')
 
     :param dictionary: Dictionary to walk.
     :type dictionary: dict
     :param path: Walked paths.
     :type path: tuple
+    :param include: Predicate called with the path and key of each item, items it rejects are skipped
+        and nested dictionaries are not walked.
+    :type include: object
+    :param exclude: Predicate called with the path and key of each item, items it accepts are skipped
+        and nested dictionaries are not walked.
+    :type exclude: object
+    :param yield_dictionaries: Nested dictionaries are yielded before their items.
+    :type yield_dictionaries: bool
+    :param shared_path: A single path list is updated in place and yielded instead of creating a tuple per
+        nested dictionary, it must be copied to be retained past the current iteration.
+    :type shared_path: bool
     :return: Path, key, value.
     :rtype: tuple
-
-    :note: This generator won't / can't yield any dictionaries, if you want to be able to retrieve dictionaries anyway,
-        you will have to either encapsulate them in another object, or mutate their base class.
     """
 
-    for key in dictionary:
-        if not isinstance(dictionary[key], dict):
-            yield path, key, dictionary[key]
+    path = list(path) if shared_path else tuple(path)
+    stack = [(path, iter(dictionary.items()))]
+    while stack:
+        path, items = stack[-1]
+        for key, value in items:
+            if include is not None and not include(path, key):
+                continue
+
+            if exclude is not None and exclude(path, key):
+                continue
+
+            if not isinstance(value, dict):
+                yield path, key, value
+                continue
+
+            if yield_dictionaries:
+                yield path, key, value
+
+            if shared_path:
+                path.append(key)
+                stack.append((path, iter(value.items())))
+            else:
+                stack.append((path + (key,), iter(value.items())))
+            break
         else:
-            for value in dictionaries_walker(dictionary[key], path + (key,)):
-                yield value
+            stack.pop()
+            if shared_path and stack:
+                path.pop()
 
 
 def nodes_walker(node, ascendants=False):
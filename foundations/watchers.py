@@ -0,0 +1,822 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**watchers.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Defines files watching related objects.
+
+**Others:**
+
+"""
+
+
+
+import ctypes
+import os
+import platform
+import queue
+import re
+import select
+import struct
+import sys
+import threading
+import time
+
+if sys.version_info[:2] <= (2, 6):
+    from ordereddict import OrderedDict
+else:
+    from collections import OrderedDict
+
+import foundations.exceptions
+import foundations.indexes
+import foundations.verbose
+import foundations.walkers
+from foundations.indexes import ADDED
+from foundations.indexes import MODIFIED
+from foundations.indexes import REMOVED
+from foundations.library import Library
+from foundations.library import LibraryHook
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER",
+           "DEBOUNCE_DELAY",
+           "MAXIMUM_DEBOUNCE_DELAY",
+           "POLLING_INTERVAL",
+           "INOTIFY_FUNCTIONS",
+           "INOTIFY_MASKS",
+           "get_libc_path",
+           "get_inotify_library",
+           "coalesce_events",
+           "FilesWatcher"]
+
+LOGGER = foundations.verbose.install_logger()
+
+DEBOUNCE_DELAY = 0.05
+MAXIMUM_DEBOUNCE_DELAY = 1.0
+POLLING_INTERVAL = 1.0
+
+INOTIFY_FUNCTIONS = (LibraryHook(name="inotify_init1",
+                                 arguments_types=(ctypes.c_int,),
+                                 return_value=ctypes.c_int),
+                     LibraryHook(name="inotify_add_watch",
+                                 arguments_types=(ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32),
+                                 return_value=ctypes.c_int),
+                     LibraryHook(name="inotify_rm_watch",
+                                 arguments_types=(ctypes.c_int, ctypes.c_int),
+                                 return_value=ctypes.c_int))
+
+INOTIFY_MASKS = {"IN_MODIFY": 0x00000002,
+                 "IN_ATTRIB": 0x00000004,
+                 "IN_CLOSE_WRITE": 0x00000008,
+                 "IN_MOVED_FROM": 0x00000040,
+                 "IN_MOVED_TO": 0x00000080,
+                 "IN_CREATE": 0x00000100,
+                 "IN_DELETE": 0x00000200,
+                 "IN_DELETE_SELF": 0x00000400,
+                 "IN_MOVE_SELF": 0x00000800,
+                 "IN_Q_OVERFLOW": 0x00004000,
+                 "IN_IGNORED": 0x00008000,
+                 "IN_ONLYDIR": 0x01000000,
+                 "IN_ISDIR": 0x40000000,
+                 "IN_CLOEXEC": 0o2000000}
+
+_INOTIFY_LIBRARY = None
+_INOTIFY_EVENT_STRUCTURE = struct.Struct("iIII")
+
+
+def get_libc_path():
+    """
+    Returns the path of the C library mapped into the current process.
+
+    :return: C library path or None if not found.
+    :rtype: unicode
+    """
+
+    try:
+        with open("/proc/self/maps") as file:
+            for line in file:
+                path = line.split(None, 5)[-1].strip()
+                name = os.path.basename(path)
+                if name.startswith("libc.so") or re.match(r"libc-[\d.]+\.so", name):
+                    return path
+    except (IOError, OSError):
+        pass
+
+
+def get_inotify_library():
+    """
+    Returns the C library bound to the inotify functions.
+
+    :return: Inotify library or None if inotify is not available.
+    :rtype: Library
+    """
+
+    global _INOTIFY_LIBRARY
+
+    if _INOTIFY_LIBRARY is None:
+        _INOTIFY_LIBRARY = False
+        path = platform.system() == "Linux" and get_libc_path()
+        if path and os.path.exists(path):
+            try:
+                _INOTIFY_LIBRARY = Library(path, INOTIFY_FUNCTIONS)
+            except (AttributeError, OSError) as error:
+                LOGGER.debug("> Inotify is not available: '{0}'.".format(error))
+    return _INOTIFY_LIBRARY or None
+
+
+def coalesce_events(events):
+    """
+    | Coalesces given ( event, path ) files events into one event per path, in first occurrence order.
+    | A file added then modified is reported as added, added then removed is not reported, removed then added
+        is reported as modified.
+
+    Usage::
+
+        >>> coalesce_events([("added", "a.ibl"), ("modified", "a.ibl"), ("modified", "b.ibl"), ("removed", "b.ibl")])
+        [('added', 'a.ibl'), ('removed', 'b.ibl')]
+
+    :param events: Events.
+    :type events: list
+    :return: Coalesced events.
+    :rtype: list
+    """
+
+    coalesced_events = OrderedDict()
+    for event, path in events:
+        previous_event = coalesced_events.get(path)
+        if previous_event is None:
+            coalesced_events[path] = event
+        elif previous_event == ADDED:
+            if event == REMOVED:
+                del coalesced_events[path]
+        elif previous_event == REMOVED:
+            coalesced_events[path] = MODIFIED if event == ADDED else event
+        else:
+            coalesced_events[path] = REMOVED if event == REMOVED else MODIFIED
+    return [(event, path) for path, event in coalesced_events.items()]
+
+
+class FilesWatcher(object):
+    """
+    | Defines a files watcher reporting the files changes of a directory tree as debounced and coalesced
+        ( event, path ) tuples, where event is one of :attr:`foundations.indexes.ADDED`,
+        :attr:`foundations.indexes.REMOVED` or :attr:`foundations.indexes.MODIFIED`.
+    | On Linux the changes are received from inotify, the watcher falls back to a
+        :class:`foundations.indexes.FilesIndex` polling backend when inotify is not available.
+    | The files paths are filtered with :func:`foundations.walkers.files_walker` definition filters semantics.
+    | The inotify backend does not track files: files of a directory moved out of the tree are not reported.
+    | The watcher stops when the watched directory is removed or moved, or when its backend fails, the failure
+        being raised by :meth:`FilesWatcher.get_events` method once the events received before have been reported.
+    """
+
+    def __init__(self,
+                 directory=None,
+                 filters_in=None,
+                 filters_out=None,
+                 flags=0,
+                 debounce_delay=DEBOUNCE_DELAY,
+                 polling_interval=POLLING_INTERVAL,
+                 backend=None):
+        """
+        Initializes the class.
+
+        Usage::
+
+            >>> files_watcher = FilesWatcher("./foundations/tests/tests_foundations/resources", ("\.ibl$",))
+            >>> files_watcher.start()
+            True
+            >>> files_watcher.get_events()
+            [('modified', './foundations/tests/tests_foundations/resources/standard/standard.ibl')]
+            >>> files_watcher.stop()
+            True
+
+        :param directory: Directory to watch.
+        :type directory: unicode
+        :param filters_in: Regex filters in list matched against the files paths.
+        :type filters_in: tuple or list
+        :param filters_out: Regex filters out list matched against the files paths.
+        :type filters_out: tuple or list
+        :param flags: Regex flags.
+        :type flags: int
+        :param debounce_delay: Quiet delay in seconds after which received events are reported.
+        :type debounce_delay: float
+        :param polling_interval: Polling backend interval in seconds.
+        :type polling_interval: float
+        :param backend: Backend, "inotify" or "polling", the best available one is used if not given.
+        :type backend: unicode
+        """
+
+        LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+        # --- Setting class attributes. ---
+        self.__directory = None
+        self.directory = directory
+        self.__filters_in = None
+        self.filters_in = filters_in
+        self.__filters_out = None
+        self.filters_out = filters_out
+        self.__flags = None
+        self.flags = flags
+        self.__debounce_delay = None
+        self.debounce_delay = debounce_delay
+        self.__polling_interval = None
+        self.polling_interval = polling_interval
+        self.__backend = None
+        self.backend = backend
+
+        self.__events = queue.Queue()
+        self.__thread = None
+        self.__stopped = threading.Event()
+        self.__ready = threading.Event()
+        self.__pipe = None
+        self.__patterns = None
+        self.__error = None
+
+    @property
+    def directory(self):
+        """
+        Property for **self.__directory** attribute.
+
+        :return: self.__directory.
+        :rtype: unicode
+        """
+
+        return self.__directory
+
+    @directory.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def directory(self, value):
+        """
+        Setter for **self.__directory** attribute.
+
+        :param value: Attribute value.
+        :type value: unicode
+        """
+
+        if value is not None:
+            assert type(value) is str, "'{0}' attribute: '{1}' type is not 'unicode'!".format("directory", value)
+        self.__directory = value
+
+    @directory.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def directory(self):
+        """
+        Deleter for **self.__directory** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "directory"))
+
+    @property
+    def filters_in(self):
+        """
+        Property for **self.__filters_in** attribute.
+
+        :return: self.__filters_in.
+        :rtype: tuple
+        """
+
+        return self.__filters_in
+
+    @filters_in.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def filters_in(self, value):
+        """
+        Setter for **self.__filters_in** attribute.
+
+        :param value: Attribute value.
+        :type value: tuple or list
+        """
+
+        if value is not None:
+            assert type(value) in (tuple, list), "'{0}' attribute: '{1}' type is not 'tuple' or 'list'!".format(
+                "filters_in", value)
+            value = tuple(value)
+        self.__filters_in = value
+
+    @filters_in.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def filters_in(self):
+        """
+        Deleter for **self.__filters_in** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "filters_in"))
+
+    @property
+    def filters_out(self):
+        """
+        Property for **self.__filters_out** attribute.
+
+        :return: self.__filters_out.
+        :rtype: tuple
+        """
+
+        return self.__filters_out
+
+    @filters_out.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def filters_out(self, value):
+        """
+        Setter for **self.__filters_out** attribute.
+
+        :param value: Attribute value.
+        :type value: tuple or list
+        """
+
+        if value is not None:
+            assert type(value) in (tuple, list), "'{0}' attribute: '{1}' type is not 'tuple' or 'list'!".format(
+                "filters_out", value)
+            value = tuple(value)
+        self.__filters_out = value
+
+    @filters_out.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def filters_out(self):
+        """
+        Deleter for **self.__filters_out** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "filters_out"))
+
+    @property
+    def flags(self):
+        """
+        Property for **self.__flags** attribute.
+
+        :return: self.__flags.
+        :rtype: int
+        """
+
+        return self.__flags
+
+    @flags.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def flags(self, value):
+        """
+        Setter for **self.__flags** attribute.
+
+        :param value: Attribute value.
+        :type value: int
+        """
+
+        if value is not None:
+            assert type(value) in (int, re.RegexFlag), "'{0}' attribute: '{1}' type is not 'int'!".format(
+                "flags", value)
+        self.__flags = value
+
+    @flags.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def flags(self):
+        """
+        Deleter for **self.__flags** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "flags"))
+
+    @property
+    def debounce_delay(self):
+        """
+        Property for **self.__debounce_delay** attribute.
+
+        :return: self.__debounce_delay.
+        :rtype: float
+        """
+
+        return self.__debounce_delay
+
+    @debounce_delay.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def debounce_delay(self, value):
+        """
+        Setter for **self.__debounce_delay** attribute.
+
+        :param value: Attribute value.
+        :type value: float
+        """
+
+        if value is not None:
+            assert type(value) in (int, float), "'{0}' attribute: '{1}' type is not 'int' or 'float'!".format(
+                "debounce_delay", value)
+            assert value >= 0, "'{0}' attribute: '{1}' need to be positive!".format("debounce_delay", value)
+        self.__debounce_delay = value
+
+    @debounce_delay.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def debounce_delay(self):
+        """
+        Deleter for **self.__debounce_delay** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "debounce_delay"))
+
+    @property
+    def polling_interval(self):
+        """
+        Property for **self.__polling_interval** attribute.
+
+        :return: self.__polling_interval.
+        :rtype: float
+        """
+
+        return self.__polling_interval
+
+    @polling_interval.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def polling_interval(self, value):
+        """
+        Setter for **self.__polling_interval** attribute.
+
+        :param value: Attribute value.
+        :type value: float
+        """
+
+        if value is not None:
+            assert type(value) in (int, float), "'{0}' attribute: '{1}' type is not 'int' or 'float'!".format(
+                "polling_interval", value)
+            assert value > 0, "'{0}' attribute: '{1}' need to be exactly positive!".format("polling_interval", value)
+        self.__polling_interval = value
+
+    @polling_interval.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def polling_interval(self):
+        """
+        Deleter for **self.__polling_interval** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "polling_interval"))
+
+    @property
+    def backend(self):
+        """
+        Property for **self.__backend** attribute.
+
+        :return: self.__backend.
+        :rtype: unicode
+        """
+
+        return self.__backend
+
+    @backend.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def backend(self, value):
+        """
+        Setter for **self.__backend** attribute.
+
+        :param value: Attribute value.
+        :type value: unicode
+        """
+
+        if value is None:
+            value = "inotify" if get_inotify_library() is not None else "polling"
+        assert value in ("inotify", "polling"), "'{0}' attribute: '{1}' is not 'inotify' or 'polling'!".format(
+            "backend", value)
+        self.__backend = value
+
+    @backend.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def backend(self):
+        """
+        Deleter for **self.__backend** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "backend"))
+
+    def is_running(self):
+        """
+        Returns if the watcher is running.
+
+        :return: Is running.
+        :rtype: bool
+        """
+
+        return self.__thread is not None and self.__thread.is_alive()
+
+    def start(self):
+        """
+        Starts the watcher, the method returns once the directory tree is watched.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        if self.is_running():
+            return False
+
+        LOGGER.debug("> Starting '{0}' directory '{1}' watcher.".format(self.__directory, self.__backend))
+
+        self.__patterns = (foundations.walkers.compile_filters(self.__filters_in, self.__flags or 0),
+                           foundations.walkers.compile_filters(self.__filters_out, self.__flags or 0))
+        self.__events = queue.Queue()
+        self.__error = None
+        self.__stopped.clear()
+        self.__ready.clear()
+        target = self.__inotify_loop if self.__backend == "inotify" else self.__polling_loop
+        self.__thread = threading.Thread(target=self.__run,
+                                         args=(target,),
+                                         name="{0}Thread".format(self.__class__.__name__))
+        self.__thread.daemon = True
+        self.__thread.start()
+        self.__ready.wait()
+
+        if self.__error is not None:
+            self.__thread.join()
+            self.__thread = None
+            self.__events = queue.Queue()
+            error, self.__error = self.__error, None
+            raise error
+        return True
+
+    def stop(self):
+        """
+        Stops the watcher.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        if not self.is_running():
+            return False
+
+        LOGGER.debug("> Stopping '{0}' directory watcher.".format(self.__directory))
+
+        self.__stopped.set()
+        try:
+            self.__pipe is not None and os.write(self.__pipe[1], b"\0")
+        except OSError:
+            pass
+        self.__thread.join()
+        self.__thread = None
+        return True
+
+    def get_events(self, timeout=None):
+        """
+        | Returns the coalesced files events once no event has been received for the debounce delay.
+        | Events received continuously are reported at most every :attr:`MAXIMUM_DEBOUNCE_DELAY` seconds.
+
+        | The watcher failure is raised once the events received before it have been returned.
+
+        | Nothing is returned without waiting once the watcher is stopped and its events have been consumed.
+
+        :param timeout: Time in seconds to wait for a first event, wait until the watcher is stopped if not given.
+        :type timeout: float
+        :return: Events.
+        :rtype: list
+        """
+
+        if not self.is_running() and self.__events.empty():
+            return []
+
+        try:
+            event = self.__events.get(timeout=timeout)
+        except queue.Empty:
+            return []
+
+        events = []
+        deadline = time.time() + MAXIMUM_DEBOUNCE_DELAY
+        while event is not None:
+            events.append(event)
+            delay = min(self.__debounce_delay, deadline - time.time())
+            if delay <= 0:
+                break
+
+            try:
+                event = self.__events.get(timeout=delay)
+            except queue.Empty:
+                break
+
+        if event is None and self.__error is not None:
+            if events:
+                self.__events.put(None)
+            else:
+                error, self.__error = self.__error, None
+                raise error
+        return coalesce_events(events)
+
+    def watch(self):
+        """
+        Defines a generator used to yield the coalesced files events until the watcher is stopped.
+
+        :return: Events.
+        :rtype: list
+        """
+
+        while self.is_running() or not self.__events.empty():
+            events = self.get_events()
+            if events:
+                yield events
+
+    def __put_event(self, event, path):
+        """
+        Puts given event into the events queue if its path matches the filters.
+
+        :param event: Event.
+        :type event: unicode
+        :param path: File path.
+        :type path: unicode
+        """
+
+        if foundations.walkers.filter_path(path, *self.__patterns):
+            self.__events.put((event, path))
+
+    def __run(self, target):
+        """
+        Runs given watcher loop, its failure is stored and the events consumers are notified once it ends.
+
+        :param target: Watcher loop.
+        :type target: object
+        """
+
+        try:
+            target()
+        except Exception as error:
+            LOGGER.error("!> {0} | '{1}' directory watcher failed: '{2}'.".format(
+                self.__class__.__name__, self.__directory, error))
+            self.__error = error
+        finally:
+            self.__ready.set()
+            self.__events.put(None)
+
+    def __check_directory(self):
+        """
+        Checks that the watched directory exists.
+        """
+
+        if not os.path.isdir(self.__directory):
+            raise foundations.exceptions.DirectoryExistsError(
+                "{0} | '{1}' watched directory doesn't exists!".format(self.__class__.__name__, self.__directory))
+
+    def __polling_loop(self):
+        """
+        Polls the directory tree files changes.
+        """
+
+        self.__check_directory()
+        files_index = foundations.indexes.FilesIndex(self.__directory,
+                                                     filters_in=self.__filters_in,
+                                                     filters_out=self.__filters_out,
+                                                     flags=self.__flags)
+        for event in files_index.update():
+            pass
+        self.__ready.set()
+
+        while not self.__stopped.wait(self.__polling_interval):
+            for event, path in files_index.update(check_files=True):
+                self.__events.put((event, path))
+            self.__check_directory()
+
+    def __add_watches(self, library, descriptor, directory, watches):
+        """
+        Adds inotify watches to given directory tree.
+
+        :param library: Inotify library.
+        :type library: Library
+        :param descriptor: Inotify file descriptor.
+        :type descriptor: int
+        :param directory: Directory.
+        :type directory: unicode
+        :param watches: Watches descriptors and their directories.
+        :type watches: dict
+        """
+
+        mask = 0
+        for name in ("IN_MODIFY", "IN_ATTRIB", "IN_CLOSE_WRITE", "IN_MOVED_FROM", "IN_MOVED_TO", "IN_CREATE",
+                     "IN_DELETE", "IN_DELETE_SELF", "IN_MOVE_SELF", "IN_ONLYDIR"):
+            mask |= INOTIFY_MASKS[name]
+
+        directories = [directory]
+        while directories:
+            directory = directories.pop()
+            watch = library.inotify_add_watch(descriptor, os.fsencode(directory), mask)
+            if watch < 0:
+                LOGGER.warning("!> {0} | Cannot watch '{1}' directory!".format(self.__class__.__name__, directory))
+                continue
+
+            # Inotify returns the existing watch descriptor of an already watched directory, e.g. a symbolic link cycle.
+            if watch in watches:
+                continue
+            watches[watch] = directory
+
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+
+            for entry in entries:
+                try:
+                    entry.is_dir() and directories.append(entry.path.replace("\\", "/"))
+                except OSError:
+                    continue
+
+    def __inotify_loop(self):
+        """
+        Reads the directory tree inotify events.
+        """
+
+        self.__check_directory()
+        library = get_inotify_library()
+        descriptor = library.inotify_init1(INOTIFY_MASKS["IN_CLOEXEC"])
+        if descriptor < 0:
+            raise foundations.exceptions.LibraryExecutionError(
+                "{0} | Cannot initialize inotify, the instances limit may have been reached!".format(
+                    self.__class__.__name__))
+
+        self.__pipe = os.pipe()
+        watches = {}
+        try:
+            self.__add_watches(library, descriptor, self.__directory.replace("\\", "/"), watches)
+            self.__ready.set()
+
+            while not self.__stopped.is_set():
+                readable = select.select((descriptor, self.__pipe[0]), (), ())[0]
+                if descriptor not in readable:
+                    continue
+
+                data = os.read(descriptor, 65536)
+                offset = 0
+                while offset < len(data):
+                    watch, mask, cookie, length = _INOTIFY_EVENT_STRUCTURE.unpack_from(data, offset)
+                    offset += _INOTIFY_EVENT_STRUCTURE.size
+                    name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+                    offset += length
+                    self.__process_inotify_event(library, descriptor, watches, watch, mask, name)
+        finally:
+            os.close(descriptor)
+            for file_descriptor in self.__pipe:
+                os.close(file_descriptor)
+            self.__pipe = None
+
+    def __process_inotify_event(self, library, descriptor, watches, watch, mask, name):
+        """
+        Processes given inotify event.
+
+        :param library: Inotify library.
+        :type library: Library
+        :param descriptor: Inotify file descriptor.
+        :type descriptor: int
+        :param watches: Watches descriptors and their directories.
+        :type watches: dict
+        :param watch: Event watch descriptor.
+        :type watch: int
+        :param mask: Event mask.
+        :type mask: int
+        :param name: Event file name.
+        :type name: unicode
+        """
+
+        if mask & INOTIFY_MASKS["IN_Q_OVERFLOW"]:
+            LOGGER.warning("!> {0} | Inotify events queue overflowed, events have been lost!".format(
+                self.__class__.__name__))
+            return
+
+        directory = watches.get(watch)
+        if mask & (INOTIFY_MASKS["IN_DELETE_SELF"] | INOTIFY_MASKS["IN_MOVE_SELF"]) and \
+                directory == self.__directory.replace("\\", "/"):
+            raise foundations.exceptions.DirectoryExistsError(
+                "{0} | '{1}' watched directory has been removed or moved!".format(
+                    self.__class__.__name__, self.__directory))
+
+        if mask & INOTIFY_MASKS["IN_IGNORED"]:
+            watches.pop(watch, None)
+            return
+
+        if directory is None or not name:
+            return
+
+        path = "/".join((directory, name))
+        if mask & INOTIFY_MASKS["IN_ISDIR"]:
+            if mask & (INOTIFY_MASKS["IN_CREATE"] | INOTIFY_MASKS["IN_MOVED_TO"]):
+                self.__add_watches(library, descriptor, path, watches)
+                # Files created before the watches were added are reported by walking the new directory.
+                for file in foundations.walkers.files_walker(path):
+                    self.__put_event(ADDED, file)
+            elif mask & INOTIFY_MASKS["IN_MOVED_FROM"]:
+                for watch, directory in list(watches.items()):
+                    if directory == path or directory.startswith(path + "/"):
+                        library.inotify_rm_watch(descriptor, watch)
+                        del watches[watch]
+            return
+
+        if mask & (INOTIFY_MASKS["IN_CREATE"] | INOTIFY_MASKS["IN_MOVED_TO"]):
+            self.__put_event(ADDED, path)
+        elif mask & (INOTIFY_MASKS["IN_DELETE"] | INOTIFY_MASKS["IN_MOVED_FROM"]):
+            self.__put_event(REMOVED, path)
+        elif mask & (INOTIFY_MASKS["IN_MODIFY"] | INOTIFY_MASKS["IN_ATTRIB"] | INOTIFY_MASKS["IN_CLOSE_WRITE"]):
+            self.__put_event(MODIFIED, path)
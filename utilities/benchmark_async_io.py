@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**benchmark_async_io.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Benchmarks :mod:`asyncio` event loop latency while concurrently reading files with the blocking
+    :meth:`foundations.io.File.cache` method and the :meth:`foundations.io.File.acache` coroutine.
+
+**Others:**
+
+"""
+
+
+
+import asyncio
+import os
+import shutil
+import tempfile
+import time
+
+import foundations.verbose
+from foundations.io import File
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER",
+           "READS_COUNTS",
+           "FILE_SIZE",
+           "TICK_INTERVAL",
+           "get_synthetic_file",
+           "monitor_latency",
+           "benchmark_latency"]
+
+LOGGER = foundations.verbose.install_logger()
+
+READS_COUNTS = (16, 256, 4096)
+FILE_SIZE = 4
+TICK_INTERVAL = 0.001
+
+
+def get_synthetic_file(directory, size=FILE_SIZE):
+    """
+    Writes a synthetic file with given size.
+
+    :param directory: Output directory.
+    :type directory: unicode
+    :param size: File size in megabytes.
+    :type size: int
+    :return: File path.
+    :rtype: unicode
+    """
+
+    line = "Attribute = \"Value\" ; Synthetic content line used to benchmark asynchronous files input.\n"
+    path = os.path.join(directory, "synthetic_{0}.txt".format(size))
+    File(path, [line] * (size * 1048576 // len(line))).write()
+    return path
+
+
+async def monitor_latency(latencies, interval=TICK_INTERVAL):
+    """
+    Coroutine sleeping for given interval until cancelled and storing how late the event loop woke it up.
+
+    :param latencies: Latencies in seconds.
+    :type latencies: list
+    :param interval: Sleep interval in seconds.
+    :type interval: float
+    """
+
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        latencies.append(loop.time() - start - interval)
+
+
+async def _read_files(path, reads_count, blocking):
+    """
+    Coroutine concurrently reading given file the given times count while monitoring the event loop latency.
+
+    :param path: File path.
+    :type path: unicode
+    :param reads_count: Reads count.
+    :type reads_count: int
+    :param blocking: Blocking :meth:`foundations.io.File.cache` method is used.
+    :type blocking: bool
+    :return: Latencies in seconds.
+    :rtype: list
+    """
+
+    async def read():
+        file = File(path)
+        if blocking:
+            file.cache()
+        else:
+            await file.acache()
+        return len(file.content)
+
+    latencies = []
+    monitor = asyncio.ensure_future(monitor_latency(latencies))
+    await asyncio.sleep(0)
+    results = await asyncio.gather(*(read() for i in range(reads_count)))
+    # Letting the monitor record the last stall.
+    await asyncio.sleep(TICK_INTERVAL * 2)
+    monitor.cancel()
+
+    assert len(set(results)) == 1, "Read contents differ!"
+    return latencies or [0]
+
+
+def benchmark_latency(directory, reads_counts=READS_COUNTS, size=FILE_SIZE):
+    """
+    Benchmarks the event loop latency while concurrently reading files with the blocking
+        :meth:`foundations.io.File.cache` method and the :meth:`foundations.io.File.acache` coroutine.
+
+    :param directory: Synthetic files directory.
+    :type directory: unicode
+    :param reads_counts: Concurrent reads counts to benchmark.
+    :type reads_counts: tuple
+    :param size: File size in megabytes.
+    :type size: int
+    :return: Definition success.
+    :rtype: bool
+    """
+
+    path = get_synthetic_file(directory, size)
+    for reads_count in reads_counts:
+        for blocking in (True, False):
+            start = time.time()
+            latencies = sorted(asyncio.run(_read_files(path, reads_count, blocking)))
+            time_ = time.time() - start
+            print("{0} | {1} reads of {2} MB: {3:.3f}s, {4} ticks, latency p50 {5:.1f}ms, "
+                  "p99 {6:.1f}ms, max {7:.1f}ms".format("cache" if blocking else "acache",
+                                                        reads_count,
+                                                        size,
+                                                        time_,
+                                                        len(latencies),
+                                                        latencies[len(latencies) // 2] * 1000,
+                                                        latencies[int(len(latencies) * 0.99)] * 1000,
+                                                        latencies[-1] * 1000))
+    return True
+
+
+if __name__ == "__main__":
+    directory = tempfile.mkdtemp()
+    try:
+        benchmark_latency(directory)
+    finally:
+        shutil.rmtree(directory)
@@ -0,0 +1,263 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**benchmark_io.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Benchmarks :class:`foundations.io.File` class read and write throughput against the previous
+    :mod:`codecs` based implementation on large synthetic files.
+
+**Others:**
+    Files sizes in megabytes can be given as command line arguments.
+
+"""
+
+
+
+import codecs
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import foundations.verbose
+from foundations.globals.constants import Constants
+from foundations.io import File
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER",
+           "FILES_SIZES",
+           "get_synthetic_content",
+           "legacy_cache",
+           "legacy_write",
+           "legacy_append",
+           "benchmark_read",
+           "benchmark_write",
+           "benchmark_append"]
+
+LOGGER = foundations.verbose.install_logger()
+
+FILES_SIZES = (1, 100, 1000)
+
+
+def get_synthetic_content(size):
+    """
+    Returns synthetic content lines with given size.
+
+    :param size: Content size in megabytes.
+    :type size: int
+    :return: Content.
+    :rtype: list
+    """
+
+    line = "Attribute = \"Value ü\" ; Synthetic content line used to benchmark files input / output.\n"
+    return [line] * (size * 1048576 // len(line.encode(Constants.default_codec)))
+
+
+def legacy_cache(path, mode="r", encoding=Constants.default_codec, errors=Constants.codec_error):
+    """
+    Reads given file content with the previous :func:`codecs.open` definition based implementation.
+
+    :param path: File path.
+    :type path: unicode
+    :param mode: File read mode.
+    :type mode: unicode
+    :param encoding: File encoding codec.
+    :type encoding: unicode
+    :param errors: File encoding errors handling.
+    :type errors: unicode
+    :return: Content.
+    :rtype: list
+    """
+
+    with codecs.open(path, mode, encoding, errors) as file:
+        return file.readlines()
+
+
+def legacy_write(path, content, mode="w", encoding=Constants.default_codec, errors=Constants.codec_error):
+    """
+    Writes given content with the previous :func:`codecs.open` definition based implementation.
+
+    :param path: File path.
+    :type path: unicode
+    :param content: Content.
+    :type content: list
+    :param mode: File write mode.
+    :type mode: unicode
+    :param encoding: File encoding codec.
+    :type encoding: unicode
+    :param errors: File encoding errors handling.
+    :type errors: unicode
+    :return: Definition success.
+    :rtype: bool
+    """
+
+    with codecs.open(path, mode, encoding, errors) as file:
+        file.write("".join(content))
+    return True
+
+
+def legacy_append(path, content, mode="a", encoding=Constants.default_codec, errors=Constants.codec_error):
+    """
+    Appends given content with the previous per line :func:`codecs.open` definition based implementation.
+
+    :param path: File path.
+    :type path: unicode
+    :param content: Content.
+    :type content: list
+    :param mode: File write mode.
+    :type mode: unicode
+    :param encoding: File encoding codec.
+    :type encoding: unicode
+    :param errors: File encoding errors handling.
+    :type errors: unicode
+    :return: Definition success.
+    :rtype: bool
+    """
+
+    with codecs.open(path, mode, encoding, errors) as file:
+        for line in content:
+            file.write(line)
+    return True
+
+
+def _print_throughput(operation, size, legacy_time, time_):
+    """
+    Prints given operation throughputs.
+
+    :param operation: Operation name.
+    :type operation: unicode
+    :param size: Processed size in megabytes.
+    :type size: int
+    :param legacy_time: Legacy implementation time.
+    :type legacy_time: float
+    :param time_: Current implementation time.
+    :type time_: float
+    """
+
+    print("{0} | {1} MB: legacy {2:.1f} MB/s, current {3:.1f} MB/s, speedup x{4:.2f}".format(
+        operation, size, size / max(legacy_time, 1e-9), size / max(time_, 1e-9), legacy_time / max(time_, 1e-9)))
+
+
+def benchmark_read(directory, files_sizes=FILES_SIZES):
+    """
+    Benchmarks :meth:`foundations.io.File.cache` method against :func:`legacy_cache` definition
+    and ensures both produce the same content.
+
+    :param directory: Synthetic files directory.
+    :type directory: unicode
+    :param files_sizes: Files sizes in megabytes to benchmark.
+    :type files_sizes: tuple
+    :return: Definition success.
+    :rtype: bool
+    """
+
+    for size in files_sizes:
+        path = os.path.join(directory, "synthetic_{0}.txt".format(size))
+        File(path, get_synthetic_content(size)).write()
+
+        start = time.time()
+        content = legacy_cache(path)
+        legacy_time = time.time() - start
+        del content
+
+        file = File(path)
+        start = time.time()
+        file.cache()
+        time_ = time.time() - start
+
+        assert file.content == legacy_cache(path), "Read contents differ!"
+
+        _print_throughput("read", size, legacy_time, time_)
+        os.remove(path)
+    return True
+
+
+def benchmark_write(directory, files_sizes=FILES_SIZES):
+    """
+    Benchmarks :meth:`foundations.io.File.write` method against :func:`legacy_write` definition
+    and ensures both produce the same output.
+
+    :param directory: Synthetic files directory.
+    :type directory: unicode
+    :param files_sizes: Files sizes in megabytes to benchmark.
+    :type files_sizes: tuple
+    :return: Definition success.
+    :rtype: bool
+    """
+
+    for size in files_sizes:
+        content = get_synthetic_content(size)
+        legacy_path = os.path.join(directory, "legacy_{0}.txt".format(size))
+        path = os.path.join(directory, "synthetic_{0}.txt".format(size))
+
+        start = time.time()
+        legacy_write(legacy_path, content)
+        legacy_time = time.time() - start
+
+        start = time.time()
+        File(path, content).write()
+        time_ = time.time() - start
+
+        assert os.path.getsize(legacy_path) == os.path.getsize(path), "Written files differ!"
+
+        _print_throughput("write", size, legacy_time, time_)
+        os.remove(legacy_path)
+        os.remove(path)
+    return True
+
+
+def benchmark_append(directory, files_sizes=FILES_SIZES):
+    """
+    Benchmarks :meth:`foundations.io.File.append` method against :func:`legacy_append` definition
+    and ensures both produce the same output.
+
+    :param directory: Synthetic files directory.
+    :type directory: unicode
+    :param files_sizes: Files sizes in megabytes to benchmark.
+    :type files_sizes: tuple
+    :return: Definition success.
+    :rtype: bool
+    """
+
+    for size in files_sizes:
+        content = get_synthetic_content(size)
+        legacy_path = os.path.join(directory, "legacy_{0}.txt".format(size))
+        path = os.path.join(directory, "synthetic_{0}.txt".format(size))
+
+        start = time.time()
+        legacy_append(legacy_path, content)
+        legacy_time = time.time() - start
+
+        start = time.time()
+        File(path, content).append()
+        time_ = time.time() - start
+
+        assert os.path.getsize(legacy_path) == os.path.getsize(path), "Appended files differ!"
+
+        _print_throughput("append", size, legacy_time, time_)
+        os.remove(legacy_path)
+        os.remove(path)
+    return True
+
+
+if __name__ == "__main__":
+    files_sizes = tuple(int(size) for size in sys.argv[1:]) or FILES_SIZES
+    directory = tempfile.mkdtemp()
+    try:
+        benchmark_read(directory, files_sizes)
+        benchmark_write(directory, files_sizes)
+        benchmark_append(directory, files_sizes)
+    finally:
+        shutil.rmtree(directory)
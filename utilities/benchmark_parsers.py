@@ -0,0 +1,464 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**benchmark_parsers.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Benchmarks :mod:`foundations.parsers` module objects against their previous implementations
+    on large synthetic sections files.
+
+**Others:**
+
+"""
+
+
+
+import codecs
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+
+if sys.version_info[:2] <= (2, 6):
+    from ordereddict import OrderedDict
+else:
+    from collections import OrderedDict
+
+import foundations.exceptions
+import foundations.namespace
+import foundations.strings
+import foundations.verbose
+from foundations.globals.constants import Constants
+from foundations.parsers import AttributeCompound
+from foundations.parsers import SectionsFileParser
+from foundations.parsers import get_attribute_compound
+from foundations.parsers import get_attribute_compounds
+from foundations.parsers import parse_many
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER",
+           "SECTIONS_COUNTS",
+           "ATTRIBUTES_COUNT",
+           "get_synthetic_sections_file",
+           "FILES_COUNT",
+           "legacy_parse",
+           "legacy_write",
+           "legacy_get_attribute_compound",
+           "benchmark_parse",
+           "benchmark_parse_many",
+           "benchmark_write",
+           "benchmark_get_attribute_compounds"]
+
+LOGGER = foundations.verbose.install_logger()
+
+SECTIONS_COUNTS = (100, 1000, 10000)
+ATTRIBUTES_COUNT = 10
+FILES_COUNT = 256
+
+
+def get_synthetic_sections_file(directory, sections_count, attributes_count=ATTRIBUTES_COUNT):
+    """
+    Writes a synthetic sections file with given sections and attributes count.
+
+    :param directory: Output directory.
+    :type directory: unicode
+    :param sections_count: Sections count.
+    :type sections_count: int
+    :param attributes_count: Attributes count per section.
+    :type attributes_count: int
+    :return: Sections file path.
+    :rtype: unicode
+    """
+
+    path = os.path.join(directory, "synthetic_{0}.rc".format(sections_count))
+    with open(path, "w") as file:
+        for i in range(sections_count):
+            file.write("[Section {0}]\n".format(i))
+            file.write("; Section {0} comment.\n".format(i))
+            for j in range(attributes_count):
+                file.write("Attribute {0} = \"@Attribute{0} | Value {1} | String | Attribute {0}\"\n".format(j, i))
+            file.write("\n")
+    return path
+
+
+def legacy_parse(sections_file_parser,
+                 raw_sections=None,
+                 namespaces=True,
+                 strip_comments=True,
+                 strip_whitespaces=True,
+                 strip_quotation_markers=True):
+    """
+    Parses given :class:`foundations.parsers.SectionsFileParser` class instance content with the
+    previous per line regex based implementation.
+
+    :param sections_file_parser: Sections file parser.
+    :type sections_file_parser: SectionsFileParser
+    :param raw_sections: Ignored raw sections.
+    :type raw_sections: tuple or list
+    :param namespaces: Attributes and comments are namespaced.
+    :type namespaces: bool
+    :param strip_comments: Comments are stripped.
+    :type strip_comments: bool
+    :param strip_whitespaces: Whitespaces are stripped.
+    :type strip_whitespaces: bool
+    :param strip_quotation_markers: Attributes values quotation markers are stripped.
+    :type strip_quotation_markers: bool
+    :return: Sections, comments, parsing errors.
+    :rtype: tuple
+    """
+
+    if not sections_file_parser.content:
+        sections_file_parser.read()
+
+    sections, comments, parsing_errors = OrderedDict(), OrderedDict(), []
+    attributes = OrderedDict()
+    section = sections_file_parser.defaults_section
+    raw_sections = raw_sections or []
+
+    commentId = 0
+    for i, line in enumerate(sections_file_parser.content):
+        search = re.search(r"^\s*[{0}](?P<comment>.+)$".format("".join(sections_file_parser.comment_limiters)), line)
+        if search:
+            if not strip_comments:
+                comment = namespaces and foundations.namespace.set_namespace(section, "{0}{1}".format(
+                    sections_file_parser.comment_marker, commentId), sections_file_parser.namespace_splitter) or \
+                          "{0}{1}".format(sections_file_parser.comment_marker, commentId)
+                comments[comment] = {"id": commentId, "content": strip_whitespaces and
+                                                                 search.group("comment").strip() or
+                                                                 search.group("comment")}
+                commentId += 1
+            continue
+
+        search = re.search(r"^\s*\[(?P<section>.+)\]\s*$", line)
+        if search:
+            section = strip_whitespaces and search.group("section").strip() or search.group("section")
+            attributes = OrderedDict()
+            rawContent = []
+            continue
+
+        if section in raw_sections:
+            rawContent.append(line)
+            attributes[sections_file_parser.raw_section_content_identifier] = rawContent
+        else:
+            search = re.search(r"^\s*$", line)
+            if search:
+                continue
+
+            search = re.search(r"^(?P<attribute>.+?)[{0}](?P<value>.+)$".format(
+                "".join(sections_file_parser.splitters)), line) or \
+                     re.search(r"^(?P<attribute>.+?)[{0}]\s*$".format("".join(sections_file_parser.splitters)), line)
+            if search:
+                attribute = search.group("attribute").strip() if strip_whitespaces else search.group("attribute")
+                attribute = foundations.namespace.set_namespace(section, attribute,
+                                                                sections_file_parser.namespace_splitter) \
+                    if namespaces else attribute
+
+                if len(search.groups()) == 2:
+                    value = search.group("value").strip() if strip_whitespaces else search.group("value")
+                    attributes[attribute] = value.strip("".join(sections_file_parser.quotation_markers)) \
+                        if strip_quotation_markers else value
+                else:
+                    attributes[attribute] = None
+            else:
+                parsing_errors.append(foundations.exceptions.AttributeStructureParsingError(
+                    "Attribute structure is invalid: {0}".format(line), i + 1))
+
+        sections[section] = attributes
+
+    return sections, comments, parsing_errors
+
+
+def legacy_write(sections_file_parser,
+                 namespaces=False,
+                 splitter="=",
+                 comment_limiter=(";"),
+                 spaces_around_splitter=True,
+                 space_after_comment_limiter=True):
+    """
+    Writes given :class:`foundations.parsers.SectionsFileParser` class instance sections and comments with the
+    previous per line implementation, scanning the comments for every section.
+
+    :param sections_file_parser: Sections file parser.
+    :type sections_file_parser: SectionsFileParser
+    :param namespaces: Attributes are namespaced.
+    :type namespaces: bool
+    :param splitter: Splitter character.
+    :type splitter: unicode
+    :param comment_limiter: Comment limiter character.
+    :type comment_limiter: unicode
+    :param spaces_around_splitter: Spaces around attributes and value splitters.
+    :type spaces_around_splitter: bool
+    :param space_after_comment_limiter: Space after comments limiter.
+    :type space_after_comment_limiter: bool
+    :return: Definition success.
+    :rtype: bool
+    """
+
+    sections_file_parser.uncache()
+
+    sections, comments = sections_file_parser.sections, sections_file_parser.comments
+    defaults_section = sections_file_parser.defaults_section
+    attribute_template = "{{0}} {0} {{1}}\n".format(splitter) if spaces_around_splitter else \
+        "{{0}}{0}{{1}}\n".format(splitter)
+    attribute_template = foundations.strings.replace(attribute_template, {"{{": "{", "}}": "}"})
+    comment_template = space_after_comment_limiter and "{0} {{0}}\n".format(comment_limiter) or \
+                       "{0}{{0}}\n".format(comment_limiter)
+    if defaults_section in sections:
+        if comments:
+            for comment, value in comments.items():
+                if defaults_section in comment:
+                    value = value["content"] or ""
+                    LOGGER.debug("> Appending '{0}' comment with '{1}' value.".format(comment, value))
+                    sections_file_parser.content.append(comment_template.format(value))
+        for attribute, value in sections[defaults_section].items():
+            attribute = namespaces and attribute or foundations.namespace.remove_namespace(
+                attribute, sections_file_parser.namespace_splitter, root_only=True)
+            value = value or ""
+            LOGGER.debug("> Appending '{0}' attribute with '{1}' value.".format(attribute, value))
+            sections_file_parser.content.append(attribute_template.format(attribute, value))
+        sections_file_parser.content.append("\n")
+
+    for i, section in enumerate(sections):
+        LOGGER.debug("> Appending '{0}' section.".format(section))
+        sections_file_parser.content.append("[{0}]\n".format(section))
+        if comments:
+            for comment, value in comments.items():
+                if section in comment:
+                    value = value["content"] or ""
+                    LOGGER.debug("> Appending '{0}' comment with '{1}' value.".format(comment, value))
+                    sections_file_parser.content.append(comment_template.format(value))
+        for attribute, value in sections[section].items():
+            if foundations.namespace.remove_namespace(attribute) == sections_file_parser.raw_section_content_identifier:
+                for line in value:
+                    sections_file_parser.content.append(line)
+            else:
+                attribute = namespaces and attribute or foundations.namespace.remove_namespace(
+                    attribute, sections_file_parser.namespace_splitter, root_only=True)
+                value = value or ""
+                LOGGER.debug("> Appending '{0}' attribute with '{1}' value.".format(attribute, value))
+                sections_file_parser.content.append(attribute_template.format(attribute, value))
+        if i != len(sections) - 1:
+            sections_file_parser.content.append("\n")
+
+    with codecs.open(sections_file_parser.path, "w", Constants.default_codec, Constants.codec_error) as file:
+        for line in sections_file_parser.content:
+            file.write(line)
+    return True
+
+
+def legacy_get_attribute_compound(attribute, value=None, splitter="|", binding_identifier="@"):
+    """
+    Returns an attribute compound with the previous implementation, compiling the binding pattern on every call.
+
+    :param attribute: Attribute.
+    :type attribute: unicode
+    :param value: Attribute value.
+    :type value: object
+    :param splitter: Splitter.
+    :type splitter: unicode
+    :param binding_identifier: Binding identifier.
+    :type binding_identifier: unicode
+    :return: Attribute compound.
+    :rtype: AttributeCompound
+    """
+
+    LOGGER.debug("> Attribute: '{0}', value: '{1}'.".format(attribute, value))
+
+    if type(value) is str:
+        if splitter in value:
+            value_tokens = value.split(splitter)
+            if len(value_tokens) >= 3 and re.search(r"{0}\w*".format(binding_identifier), value_tokens[0]):
+                return AttributeCompound(name=attribute,
+                                         value=value_tokens[1].strip(),
+                                         link=value_tokens[0].strip(),
+                                         type=value_tokens[2].strip(),
+                                         alias=len(value_tokens) == 4 and value_tokens[3].strip() or None)
+        else:
+            if re.search(r"{0}\w*".format(binding_identifier), value):
+                return AttributeCompound(name=attribute, value=None, link=value, type=None, alias=None)
+
+    return AttributeCompound(name=attribute, value=value, link=None, type=None, alias=None)
+
+
+def benchmark_parse(directory, sections_counts=SECTIONS_COUNTS):
+    """
+    Benchmarks :meth:`foundations.parsers.SectionsFileParser.parse` method against :func:`legacy_parse`
+    definition and ensures both produce the same output.
+
+    :param directory: Synthetic files directory.
+    :type directory: unicode
+    :param sections_counts: Sections counts to benchmark.
+    :type sections_counts: tuple
+    :return: Definition success.
+    :rtype: bool
+    """
+
+    for sections_count in sections_counts:
+        path = get_synthetic_sections_file(directory, sections_count)
+
+        legacy_parser = SectionsFileParser(path)
+        legacy_parser.read()
+        start = time.time()
+        sections, comments, parsing_errors = legacy_parse(legacy_parser, strip_comments=False)
+        legacy_time = time.time() - start
+
+        parser = SectionsFileParser(path)
+        parser.read()
+        start = time.time()
+        parser.parse(strip_comments=False)
+        time_ = time.time() - start
+
+        assert parser.sections == sections, "Parsed sections differ!"
+        assert parser.comments == comments, "Parsed comments differ!"
+
+        print("parse | {0} lines: legacy {1:.3f}s, current {2:.3f}s, speedup x{3:.2f}".format(
+            len(parser.content), legacy_time, time_, legacy_time / max(time_, 1e-9)))
+    return True
+
+
+def benchmark_parse_many(directory, files_count=FILES_COUNT, sections_count=100):
+    """
+    Benchmarks :func:`foundations.parsers.parse_many` definition scaling with workers count against
+    sequential parsing.
+
+    :param directory: Synthetic files directory.
+    :type directory: unicode
+    :param files_count: Files count.
+    :type files_count: int
+    :param sections_count: Sections count per file.
+    :type sections_count: int
+    :return: Definition success.
+    :rtype: bool
+    """
+
+    path = get_synthetic_sections_file(directory, sections_count)
+    paths = []
+    for i in range(files_count):
+        paths.append(os.path.join(directory, "synthetic_{0}_{1}.ibl".format(sections_count, i)))
+        shutil.copyfile(path, paths[-1])
+
+    start = time.time()
+    for path in paths:
+        SectionsFileParser(path).parse()
+    sequential_time = time.time() - start
+    print("parse_many | {0} files: sequential {1:.3f}s".format(files_count, sequential_time))
+
+    workers_counts = sorted(set([1, 2, 4, 8, os.cpu_count() or 1]))
+    for executor in ("thread", "process"):
+        for workers in workers_counts:
+            start = time.time()
+            parsers, errors = parse_many(paths, workers=workers, executor=executor)
+            time_ = time.time() - start
+
+            assert len(parsers) == files_count and not errors, "Parsing failed!"
+
+            print("parse_many | {0} files, {1} executor, {2} workers: {3:.3f}s, speedup x{4:.2f}".format(
+                files_count, executor, workers, time_, sequential_time / max(time_, 1e-9)))
+    return True
+
+
+def benchmark_write(directory, sections_counts=SECTIONS_COUNTS):
+    """
+    Benchmarks :meth:`foundations.parsers.SectionsFileParser.write` method against :func:`legacy_write`
+    definition and ensures both produce the same output.
+
+    :param directory: Synthetic files directory.
+    :type directory: unicode
+    :param sections_counts: Sections counts to benchmark.
+    :type sections_counts: tuple
+    :return: Definition success.
+    :rtype: bool
+    """
+
+    for sections_count in sections_counts:
+        parser = SectionsFileParser(get_synthetic_sections_file(directory, sections_count))
+        parser.parse(strip_comments=False)
+        # Legacy writer matches comments on section names substrings, comments are namespaced
+        # with a prefix free section name so that both writers output match.
+        parser.comments = OrderedDict(("{0}]|{1}".format(*comment.split("|")), value)
+                                      for comment, value in parser.comments.items())
+        parser.sections = OrderedDict(("{0}]".format(section), attributes)
+                                      for section, attributes in parser.sections.items())
+
+        legacy_parser = SectionsFileParser(os.path.join(directory, "legacy_{0}.rc".format(sections_count)))
+        legacy_parser.sections, legacy_parser.comments = parser.sections, parser.comments
+        start = time.time()
+        legacy_write(legacy_parser)
+        legacy_time = time.time() - start
+
+        writing_parser = SectionsFileParser(os.path.join(directory, "current_{0}.rc".format(sections_count)))
+        writing_parser.sections, writing_parser.comments = parser.sections, parser.comments
+        start = time.time()
+        writing_parser.write()
+        time_ = time.time() - start
+
+        with open(legacy_parser.path, "rb") as legacy_file, open(writing_parser.path, "rb") as file:
+            assert legacy_file.read() == file.read(), "Written files differ!"
+
+        print("write | {0} sections: legacy {1:.3f}s, current {2:.3f}s, speedup x{3:.2f}".format(
+            sections_count, legacy_time, time_, legacy_time / max(time_, 1e-9)))
+    return True
+
+
+def benchmark_get_attribute_compounds(directory, sections_count=1000):
+    """
+    Benchmarks :func:`foundations.parsers.get_attribute_compounds` definition against per attribute
+    :func:`legacy_get_attribute_compound` and :func:`foundations.parsers.get_attribute_compound` definitions calls.
+
+    :param directory: Synthetic files directory.
+    :type directory: unicode
+    :param sections_count: Sections count.
+    :type sections_count: int
+    :return: Definition success.
+    :rtype: bool
+    """
+
+    parser = SectionsFileParser(get_synthetic_sections_file(directory, sections_count))
+    parser.parse()
+
+    start = time.time()
+    compounds = [dict((attribute, legacy_get_attribute_compound(attribute, value))
+                      for attribute, value in attributes.items()) for attributes in parser.sections.values()]
+    legacy_time = time.time() - start
+
+    start = time.time()
+    for attributes in parser.sections.values():
+        for attribute, value in attributes.items():
+            get_attribute_compound(attribute, value)
+    single_time = time.time() - start
+
+    start = time.time()
+    compact_compounds = [get_attribute_compounds(attributes) for attributes in parser.sections.values()]
+    time_ = time.time() - start
+
+    for attributes, compact_attributes in zip(compounds, compact_compounds):
+        for attribute, compound in attributes.items():
+            assert compact_attributes[attribute] == compound, "Attributes compounds differ!"
+
+    print("get_attribute_compounds | {0} attributes: legacy {1:.3f}s, get_attribute_compound {2:.3f}s, "
+          "current {3:.3f}s, speedup x{4:.2f}".format(sum(len(attributes) for attributes in compounds), legacy_time,
+                                                      single_time, time_, legacy_time / max(time_, 1e-9)))
+    return True
+
+
+if __name__ == "__main__":
+    directory = tempfile.mkdtemp()
+    try:
+        benchmark_parse(directory)
+        benchmark_parse_many(directory)
+        benchmark_write(directory)
+        benchmark_get_attribute_compounds(directory)
+    finally:
+        shutil.rmtree(directory)
@@ -0,0 +1,263 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**benchmark_walkers.py**
+
+**Platform:**
+    Windows, Linux, Mac Os X.
+
+**Description:**
+    Benchmarks :func:`foundations.walkers.files_walker` definition serial and concurrent walks against
+    the previous :func:`os.walk` based implementation on large synthetic directories trees, and
+    :func:`foundations.walkers.dictionaries_walker` definition against the previous recursive implementation
+    on deep and wide synthetic dictionaries.
+
+**Others:**
+    Files counts can be given as command line arguments.
+
+"""
+
+
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import foundations.strings
+import foundations.verbose
+import foundations.walkers
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER",
+           "FILES_COUNTS",
+           "FILES_PER_DIRECTORY",
+           "DIRECTORIES_PER_DIRECTORY",
+           "EXTENSIONS",
+           "FILTERS_IN",
+           "FILTERS_OUT",
+           "WORKERS",
+           "DICTIONARIES_SHAPES",
+           "get_synthetic_tree",
+           "legacy_files_walker",
+           "benchmark_files_walker",
+           "get_synthetic_dictionary",
+           "legacy_dictionaries_walker",
+           "benchmark_dictionaries_walker"]
+
+LOGGER = foundations.verbose.install_logger()
+
+FILES_COUNTS = (10000, 100000, 1000000)
+FILES_PER_DIRECTORY = 100
+DIRECTORIES_PER_DIRECTORY = 10
+EXTENSIONS = (".py", ".pyc", ".txt", ".rc", ".ibl", ".sIBLT", ".jpg", ".exr")
+FILTERS_IN = ("\.py$", "\.txt$", "\.rc$", "\.ibl$", "\.sIBLT$")
+FILTERS_OUT = ("__pycache__", "\.git", "/build/", "/dist/")
+WORKERS = 8
+DICTIONARIES_SHAPES = ((100000, 0, 0), (10, 10, 4), (10, 1, 500), (10, 1, 2000))
+
+
+def get_synthetic_tree(directory, files_count):
+    """
+    Writes a synthetic directories tree with given files count.
+
+    :param directory: Output directory.
+    :type directory: unicode
+    :param files_count: Files count.
+    :type files_count: int
+    :return: Tree root directory.
+    :rtype: unicode
+    """
+
+    root_directory = os.path.join(directory, "tree_{0}".format(files_count))
+    directories = [root_directory]
+    index = 0
+    while index < files_count:
+        parent = directories.pop(0)
+        os.makedirs(parent)
+        for i in range(min(FILES_PER_DIRECTORY, files_count - index)):
+            open(os.path.join(parent, "file_{0}{1}".format(i, EXTENSIONS[i % len(EXTENSIONS)])), "w").close()
+        index += FILES_PER_DIRECTORY
+        directories.extend(os.path.join(parent, "directory_{0}".format(i)) for i in range(DIRECTORIES_PER_DIRECTORY))
+    return root_directory
+
+
+def legacy_files_walker(directory, filters_in=None, filters_out=None, flags=0):
+    """
+    Walks files using given filters with the previous :func:`os.walk` definition based implementation.
+
+    :param directory: Directory to recursively walk.
+    :type directory: unicode
+    :param filters_in: Regex filters in list.
+    :type filters_in: tuple or list
+    :param filters_out: Regex filters out list.
+    :type filters_out: tuple or list
+    :param flags: Regex flags.
+    :type flags: int
+    :return: File.
+    :rtype: unicode
+    """
+
+    for parent_directory, directories, files in os.walk(directory, topdown=False, followlinks=True):
+        for file in files:
+            path = foundations.strings.to_forward_slashes(os.path.join(parent_directory, file))
+            if os.path.isfile(path):
+                if not foundations.strings.filter_words((path,), filters_in, filters_out, flags):
+                    continue
+
+                yield path
+
+
+def _time_walker(walker, *args, **kwargs):
+    """
+    Exhausts given walker and returns its paths and the elapsed time.
+
+    :param walker: Walker.
+    :type walker: object
+    :param \*args: Arguments.
+    :type \*args: \*
+    :param \*\*kwargs: Keywords arguments.
+    :type \*\*kwargs: \*\*
+    :return: Paths, time.
+    :rtype: tuple
+    """
+
+    start = time.time()
+    paths = list(walker(*args, **kwargs))
+    return paths, time.time() - start
+
+
+def benchmark_files_walker(directory, files_counts=FILES_COUNTS, workers=WORKERS):
+    """
+    Benchmarks :func:`foundations.walkers.files_walker` definition against :func:`legacy_files_walker`
+    definition and ensures both yield the same paths in the same order.
+
+    :param directory: Synthetic trees directory.
+    :type directory: unicode
+    :param files_counts: Files counts to benchmark.
+    :type files_counts: tuple
+    :param workers: Concurrent walk threads pool workers count.
+    :type workers: int
+    :return: Definition success.
+    :rtype: bool
+    """
+
+    for files_count in files_counts:
+        root_directory = get_synthetic_tree(directory, files_count)
+        for name, filters_in, filters_out in (("unfiltered", None, None),
+                                              ("filtered", FILTERS_IN, FILTERS_OUT)):
+            legacy_paths, legacy_time = _time_walker(legacy_files_walker, root_directory, filters_in, filters_out)
+            paths, time_ = _time_walker(foundations.walkers.files_walker, root_directory, filters_in, filters_out)
+
+            assert paths == legacy_paths, "Walked paths differ!"
+
+            print("{0} | {1} files, {2} yielded: legacy {3:.3f}s, current {4:.3f}s, speedup x{5:.2f}".format(
+                name, files_count, len(paths), legacy_time, time_, legacy_time / max(time_, 1e-9)))
+
+        legacy_paths = list(legacy_files_walker(root_directory))
+        paths, time_ = _time_walker(foundations.walkers.files_walker, root_directory, workers=workers)
+        assert paths == legacy_paths, "Walked paths differ!"
+        print("parallel | {0} files, {1} workers: current {2:.3f}s".format(files_count, workers, time_))
+
+        pruned_paths, time_ = _time_walker(foundations.walkers.files_walker,
+                                           root_directory,
+                                           directories_filters_out=("directory_[1-9]$",))
+        print("pruned | {0} files, {1} yielded: current {2:.3f}s".format(files_count, len(pruned_paths), time_))
+
+        shutil.rmtree(root_directory)
+    return True
+
+
+def get_synthetic_dictionary(values_count, dictionaries_count, depth):
+    """
+    Returns a synthetic nested dictionary with given shape.
+
+    :param values_count: Values count per dictionary.
+    :type values_count: int
+    :param dictionaries_count: Nested dictionaries count per dictionary.
+    :type dictionaries_count: int
+    :param depth: Nesting depth.
+    :type depth: int
+    :return: Dictionary.
+    :rtype: dict
+    """
+
+    dictionary = {"Value {0}".format(i): i for i in range(values_count)}
+    for i in range(depth):
+        nested_dictionary = {"Value {0}".format(j): j for j in range(values_count)}
+        nested_dictionary.update(("Level {0} {1}".format(i, j), dictionary) for j in range(dictionaries_count))
+        dictionary = nested_dictionary
+    return dictionary
+
+
+def legacy_dictionaries_walker(dictionary, path=()):
+    """
+    Walks into nested dictionaries with the previous recursive nested generators implementation.
+
+    :param dictionary: Dictionary to walk.
+    :type dictionary: dict
+    :param path: Walked paths.
+    :type path: tuple
+    :return: Path, key, value.
+    :rtype: tuple
+    """
+
+    for key in dictionary:
+        if not isinstance(dictionary[key], dict):
+            yield path, key, dictionary[key]
+        else:
+            for value in legacy_dictionaries_walker(dictionary[key], path + (key,)):
+                yield value
+
+
+def benchmark_dictionaries_walker(shapes=DICTIONARIES_SHAPES):
+    """
+    Benchmarks :func:`foundations.walkers.dictionaries_walker` definition against
+    :func:`legacy_dictionaries_walker` definition and ensures both yield the same items in the same order.
+
+    :param shapes: Synthetic dictionaries values counts, nested dictionaries counts and depths to benchmark.
+    :type shapes: tuple
+    :return: Definition success.
+    :rtype: bool
+    """
+
+    for values_count, dictionaries_count, depth in shapes:
+        dictionary = get_synthetic_dictionary(values_count, dictionaries_count, depth)
+        try:
+            legacy_items, legacy_time = _time_walker(legacy_dictionaries_walker, dictionary)
+        except RecursionError:
+            legacy_items, legacy_time = None, None
+        items, time_ = _time_walker(foundations.walkers.dictionaries_walker, dictionary)
+        shared_items, shared_time = _time_walker(foundations.walkers.dictionaries_walker, dictionary, shared_path=True)
+
+        assert legacy_items is None or items == legacy_items, "Walked items differ!"
+        assert len(shared_items) == len(items), "Walked items differ!"
+
+        print("dictionaries | {0} values, {1} dictionaries, depth {2}, {3} items: legacy {4}, "
+              "current {5:.3f}s, shared path {6:.3f}s".format(
+            values_count,
+            dictionaries_count,
+            depth,
+            len(items),
+            "recursion error" if legacy_time is None else "{0:.3f}s".format(legacy_time),
+            time_,
+            shared_time))
+    return True
+
+
+if __name__ == "__main__":
+    files_counts = tuple(int(count) for count in sys.argv[1:]) or FILES_COUNTS
+    directory = tempfile.mkdtemp()
+    try:
+        benchmark_files_walker(directory, files_counts)
+        benchmark_dictionaries_walker()
+    finally:
+        shutil.rmtree(directory)
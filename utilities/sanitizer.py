@@ -16,9 +16,13 @@
 
 
 
+import io
+import os
 import re
 
+import foundations.io
 import foundations.verbose
+from foundations.globals.constants import Constants
 from foundations.io import File
 
 __author__ = "Thomas Mansencal"
@@ -30,7 +34,9 @@ __status__ = "Production"
 
 __all__ = ["LOGGER",
            "STATEMENT_UPDATE_MESSAGE",
-           "STATEMENTS_SUBSTITUTE",
+           "STATEMENT_MAIN_PATTERN",
+           "STATEMENT_DECORATOR_PATTERN",
+           "STATEMENT_DEFINITION_PATTERN",
            "STATEMENT_IGNORE",
            "bleach"]
 
@@ -38,16 +44,121 @@ LOGGER = foundations.verbose.install_logger()
 
 STATEMENT_UPDATE_MESSAGE = "# Oncilla: Statement commented by auto-documentation process: "
 
-STATEMENTS_SUBSTITUTE = ("(\n)(?P<bleach>\s*if\s+__name__\s+==\s+[\"']__main__[\"']\s*:.*)",
-                         "(\n)(?P<bleach>\s*@(?!property|\w+\.setter|\w+\.deleter).*?)(\n+\s*def\s+)")
+# Deprecated: Whole content substitution patterns, superseded by the line based "STATEMENT_*_PATTERN" patterns.
+STATEMENTS_SUBSTITUTE = (r"(\n)(?P<bleach>\s*if\s+__name__\s+==\s+[\"']__main__[\"']\s*:.*)",
+                         r"(\n)(?P<bleach>\s*@(?!property|\w+\.setter|\w+\.deleter).*?)(\n+\s*def\s+)")
+
+STATEMENT_MAIN_PATTERN = re.compile(r"\s*if\s+__name__\s+==\s+[\"']__main__[\"']\s*:")
+STATEMENT_DECORATOR_PATTERN = re.compile(r"\s*@(?!property|\w+\.setter|\w+\.deleter)")
+STATEMENT_DEFINITION_PATTERN = re.compile(r"\s*def\s")
 
 STATEMENT_IGNORE = ("@handle_exceptions(ZeroDivisionError)",)
 
 
+def _comment_statement(statement):
+    """
+    Comments given statement lines unless they contain an ignored statement.
+
+    :param statement: Statement lines.
+    :type statement: list
+    :return: Statement lines.
+    :rtype: list
+    """
+
+    if any(ignore in line for line in statement for ignore in STATEMENT_IGNORE):
+        return statement
+
+    return ["{0}{1}".format(STATEMENT_UPDATE_MESSAGE, line) for line in statement]
+
+
+def _bleach_main_statement(lines):
+    """
+    Comments the main statement and everything following it, including the blank lines preceding it.
+
+    :param lines: Lines.
+    :type lines: iterable
+    :return: Line.
+    :rtype: unicode
+    """
+
+    lines = iter(lines)
+    for line in lines:
+        yield line
+        break
+
+    blanks = []
+    for line in lines:
+        if not line.strip():
+            blanks.append(line)
+            continue
+
+        if STATEMENT_MAIN_PATTERN.match(line):
+            statement = blanks + [line] + list(lines)
+            commented_statement = _comment_statement(statement)
+            if commented_statement is not statement and statement[-1].endswith("\n"):
+                commented_statement.append(STATEMENT_UPDATE_MESSAGE)
+            for line in commented_statement:
+                yield line
+            return
+
+        for blank in blanks:
+            yield blank
+        blanks = []
+        yield line
+
+    for blank in blanks:
+        yield blank
+
+
+def _bleach_decorators_statements(lines):
+    """
+    Comments the decorators statements, including the blank lines preceding them, up to the next definition.
+
+    :param lines: Lines.
+    :type lines: iterable
+    :return: Line.
+    :rtype: unicode
+    """
+
+    lines = iter(lines)
+    for line in lines:
+        yield line
+        break
+
+    blanks, statement = [], None
+    for line in lines:
+        if statement is None:
+            if not line.strip():
+                blanks.append(line)
+            elif STATEMENT_DECORATOR_PATTERN.match(line):
+                statement, blanks = blanks + [line], []
+            else:
+                for blank in blanks:
+                    yield blank
+                blanks = []
+                yield line
+        elif STATEMENT_DEFINITION_PATTERN.match(line):
+            for statement_line in _comment_statement(statement) + blanks + [line]:
+                yield statement_line
+            blanks, statement = [], None
+        elif not line.strip():
+            blanks.append(line)
+        else:
+            statement.extend(blanks)
+            statement.append(line)
+            blanks = []
+
+    for line in (statement or []) + blanks:
+        yield line
+
+
 def bleach(file):
     """
     Sanitizes given python module.
 
+    The module is streamed line by line, only the statements being commented are held in memory
+    and the sanitized module is written to a temporary file replacing the original one.
+
     :param file: Python module file.
     :type file: unicode
     :return: Definition success.
@@ -56,26 +167,15 @@ def bleach(file):
 
     LOGGER.info("{0} | Sanitizing '{1}' python module!".format(__name__, file))
 
-    source_file = File(file)
-    content = source_file.read()
-    for pattern in STATEMENTS_SUBSTITUTE:
-        matches = [match for match in re.finditer(pattern, content, re.DOTALL)]
-
-        offset = 0
-        for match in matches:
-            if any([x in match.group("bleach") for x in STATEMENT_IGNORE]):
-                continue
-
-            start, end = match.start("bleach"), match.end("bleach")
-            substitution = "{0}{1}".format(STATEMENT_UPDATE_MESSAGE,
-                                           re.sub("\n", "\n{0}".format(STATEMENT_UPDATE_MESSAGE),
-                                                  match.group("bleach")))
-            content = "".join((content[0: start + offset],
-                               substitution,
-                               content[end + offset:]))
-            offset += len(substitution) - len(match.group("bleach"))
-
-    source_file.content = [content]
-    source_file.write()
+    path = foundations.io.get_temporary_path(file)
+    try:
+        with io.open(path, "w", encoding=Constants.default_codec, errors=Constants.codec_error,
+                     newline="") as output:
+            output.writelines(_bleach_decorators_statements(_bleach_main_statement(File(file).iter_lines())))
+        foundations.io.atomic_replace(path, file)
+    except Exception:
+        if os.path.exists(path):
+            os.remove(path)
+        raise
 
     return True